@@ -0,0 +1,105 @@
+import hashlib
+import os
+import zipfile
+from Backend.Cache import TTLCache
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+
+class AudioCache:
+    """Decoded speech keyed by (engine, voice, text), in an LRU memory tier over a size-capped disk tier.
+
+    Disk entries are uncompressed .npz files holding the samples and their
+    sample rate; the least recently played ones are removed once the
+    directory grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024, memory_size=64):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = TTLCache(float("inf"), memory_size)
+        # file name -> size, least recently played first; scanned once, then kept up to date
+        self._files = None
+        self._bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(engine, voice, text):
+        return hashlib.sha256(f"{engine}\0{voice}\0{text.strip()}".encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def get(self, key):
+        """Return (samples, samplerate) or None."""
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory_hits += 1
+            return entry
+        path = self._path(key)
+        try:
+            with np.load(path) as f:
+                entry = f["pcm"], int(f["samplerate"])
+            os.utime(path)  # 🔹 Recently played phrases survive trimming
+            name = os.path.basename(path)
+            if self._files is not None and name in self._files:
+                self._files[name] = self._files.pop(name)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        self.memory.set(key, entry)
+        self.disk_hits += 1
+        return entry
+
+    def set(self, key, pcm, samplerate):
+        self.memory.set(key, (pcm, samplerate))
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, pcm=pcm, samplerate=samplerate)
+            os.replace(tmp_path, path)
+            files, name, size = self._index(), os.path.basename(path), os.path.getsize(path)
+            self._bytes += size - files.pop(name, 0)
+            files[name] = size
+            # 🔹 Only trim when this write went over the limit
+            if self._bytes > self.max_bytes:
+                self._trim()
+        except OSError as e:
+            print(f"⚠️ TTS cache write failed: {e}")
+
+    def _index(self):
+        if self._files is None:
+            entries = [(e.stat(), e.name) for e in os.scandir(self.directory) if e.name.endswith(".npz")]
+            entries.sort(key=lambda e: e[0].st_mtime)
+            self._files = {name: st.st_size for st, name in entries}
+            self._bytes = sum(self._files.values())
+        return self._files
+
+    def _trim(self):
+        files = self._index()
+        while self._bytes > self.max_bytes and files:
+            name = next(iter(files))
+            self._bytes -= files.pop(name)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def disk_bytes(self):
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(e.stat().st_size for e in os.scandir(self.directory) if e.name.endswith(".npz"))
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "size": len(self.memory),
+        }
@@ -0,0 +1,172 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import deque
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+sd = LazyModule("sounddevice")
+
+class Segment:
+    """One queued piece of audio; `future` resolves to True once played, False if cancelled."""
+
+    def __init__(self, pcm):
+        self.pcm = pcm
+        self.pos = 0
+        self.future = concurrent.futures.Future()
+
+    @property
+    def done(self):
+        return self.future.done()
+
+    def _finish(self, played):
+        if not self.future.done():
+            self.future.set_result(played)
+
+class NullDevice:
+    """Output stream stand-in that consumes audio on a timer thread instead of a sound card.
+
+    `speed` > 1 plays faster than real time; everything written is kept in
+    `written` so tests can check what would have been heard.
+    """
+
+    def __init__(self, samplerate, channels, blocksize, callback, speed=1.0):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.callback = callback
+        self.speed = speed
+        self.written = []
+        self._running = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name="null-audio", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        period = self.blocksize / self.samplerate / self.speed
+        while self._running.is_set():
+            block = np.zeros((self.blocksize, self.channels), dtype='float32')
+            self.callback(block, self.blocksize, None, None)
+            if block.any():
+                self.written.append(block[:, 0].copy())
+            time.sleep(period)
+
+    def close(self):
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join()
+
+    def samples(self):
+        return np.concatenate(self.written) if self.written else np.zeros(0, dtype='float32')
+
+def _sounddevice_stream(samplerate, channels, blocksize, callback):
+    return sd.OutputStream(
+        samplerate=samplerate, channels=channels, dtype='float32',
+        blocksize=blocksize, latency='low', callback=callback,
+    )
+
+class AudioOutput:
+    """A single long-lived output stream fed from a queue of PCM segments.
+
+    The stream opens on the first segment, at that segment's sample rate, and
+    then stays open; later segments at another rate are resampled. Playback
+    runs on the audio thread, so awaiting it never blocks the event loop, and
+    cancel() silences the output from the next block on.
+    """
+
+    def __init__(self, blocksize=512, channels=1, device_factory=None):
+        self.blocksize = blocksize
+        self.channels = channels
+        self._device_factory = device_factory or _sounddevice_stream
+        self._segments = deque()
+        self._lock = threading.Lock()
+        self.samplerate = None
+        self.stream = None
+
+    def start(self, samplerate):
+        with self._lock:
+            if self.stream is None:
+                self.samplerate = int(samplerate)
+                self.stream = self._device_factory(self.samplerate, self.channels, self.blocksize, self._callback)
+                self.stream.start()
+        return self.stream
+
+    def enqueue(self, data, samplerate) -> Segment:
+        """Queue audio behind anything already playing and return its Segment."""
+        self.start(samplerate)
+        segment = Segment(self._prepare(data, samplerate))
+        with self._lock:
+            self._segments.append(segment)
+        return segment
+
+    async def play(self, data, samplerate):
+        """Play audio and wait for it; returns False if it was cancelled before the end."""
+        segment = self.enqueue(data, samplerate)
+        try:
+            return await asyncio.shield(asyncio.wrap_future(segment.future))
+        except asyncio.CancelledError:
+            self.cancel(segment)
+            raise
+
+    def cancel(self, segment=None):
+        """Drop one segment, or everything queued and playing (barge-in)."""
+        with self._lock:
+            if segment is None:
+                dropped, self._segments = list(self._segments), deque()
+            else:
+                dropped = [segment] if segment in self._segments else []
+                if dropped:
+                    self._segments.remove(segment)
+        for s in dropped:
+            s._finish(False)
+
+    @property
+    def busy(self):
+        return bool(self._segments)
+
+    def close(self):
+        self.cancel()
+        with self._lock:
+            stream, self.stream = self.stream, None
+        if stream is not None:
+            stream.close()
+
+    def _prepare(self, data, samplerate):
+        pcm = np.asarray(data)
+        if pcm.dtype == np.int16:
+            pcm = pcm.astype('float32') / 32768.0
+        else:
+            pcm = pcm.astype('float32', copy=False)
+        if pcm.ndim > 1:
+            pcm = pcm.mean(axis=1)  # 🔹 The stream is mono
+        if int(samplerate) != self.samplerate and len(pcm):
+            n = int(round(len(pcm) * self.samplerate / samplerate))
+            pcm = np.interp(
+                np.linspace(0, len(pcm) - 1, n), np.arange(len(pcm)), pcm,
+            ).astype('float32')
+        return pcm
+
+    def _callback(self, outdata, frames, time_info, status):
+        filled = 0
+        finished = []
+        with self._lock:
+            while filled < frames and self._segments:
+                segment = self._segments[0]
+                n = min(frames - filled, len(segment.pcm) - segment.pos)
+                outdata[filled:filled + n, 0] = segment.pcm[segment.pos:segment.pos + n]
+                segment.pos += n
+                filled += n
+                if segment.pos >= len(segment.pcm):
+                    finished.append(self._segments.popleft())
+        outdata[filled:] = 0
+        for channel in range(1, outdata.shape[1]):
+            outdata[:filled, channel] = outdata[:filled, 0]
+        for segment in finished:
+            segment._finish(True)
+
+# Shared by every OrionTTS in this process, so PortAudio opens one stream for the whole session
+audio_output = AudioOutput()
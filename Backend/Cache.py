@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    """Small in-memory LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, ttl, maxsize=128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is not None:
+            stored_at, value = item
+            if time.time() - stored_at < self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return default
+
+    def set(self, key, value, stored_at=None):
+        self._data[key] = (stored_at or time.time(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._data),
+        }
+
+class DiskCache:
+    """JSON entries on disk, one file per key, trimmed oldest-first to max_entries.
+
+    Expired entries are kept until trimmed so callers can still revalidate
+    them (for example with an ETag) through get(..., allow_stale=True).
+    """
+
+    def __init__(self, directory, ttl, max_entries=1000):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._files = None  # file name -> None, oldest write first; scanned once by the first set()
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get_entry(self, key, allow_stale=False):
+        """Return (stored_at, value) or None."""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("key") != key:
+            return None
+        if not allow_stale and time.time() - entry["stored_at"] >= self.ttl:
+            return None
+        return entry["stored_at"], entry["value"]
+
+    def get(self, key, allow_stale=False):
+        entry = self.get_entry(key, allow_stale)
+        return entry[1] if entry else None
+
+    def set(self, key, value):
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            files = self._index()
+            name = os.path.basename(path)
+            files.pop(name, None)
+            files[name] = None
+            # 🔹 Only trim when this write went over the limit
+            if len(files) > self.max_entries:
+                self._trim()
+        except OSError as e:
+            print(f"⚠️ Disk cache write failed: {e}")
+
+    def _index(self):
+        if self._files is None:
+            entries = [e for e in os.scandir(self.directory) if e.name.endswith(".json")]
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            self._files = dict.fromkeys(e.name for e in entries)
+        return self._files
+
+    def _trim(self):
+        files = self._index()
+        while len(files) > self.max_entries:
+            name = next(iter(files))
+            del files[name]
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def __len__(self):
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(1 for e in os.scandir(self.directory) if e.name.endswith(".json"))
+
+class TieredCache:
+    """LRU memory tier in front of a DiskCache, with per-tier hit counters."""
+
+    def __init__(self, directory, ttl, memory_size=256, max_entries=1000):
+        self.memory = TTLCache(ttl, memory_size)
+        self.disk = DiskCache(directory, ttl, max_entries)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        entry = self.disk.get_entry(key)
+        if entry is not None:
+            stored_at, value = entry
+            self.memory.set(key, value, stored_at=stored_at)
+            self.disk_hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    def get_stale(self, key):
+        """Expired value still on disk, for conditional revalidation."""
+        return self.disk.get(key, allow_stale=True)
+
+    def set(self, key, value):
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "size": len(self.memory),
+        }
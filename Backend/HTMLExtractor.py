@@ -0,0 +1,84 @@
+import codecs
+from html.parser import HTMLParser
+
+# Tags that implicitly close an open <p>, as browsers (and BeautifulSoup) do
+_BLOCK_TAGS = {
+    "p", "div", "table", "ul", "ol", "dl", "pre", "blockquote", "section", "article",
+    "aside", "header", "footer", "nav", "form", "h1", "h2", "h3", "h4", "h5", "h6", "hr",
+}
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg"}
+
+class ParagraphExtractor(HTMLParser):
+    """Incremental parser that stops at the first <p> longer than min_length.
+
+    Bytes are fed as they arrive from the network; `done` turns true once a
+    qualifying paragraph is found or max_bytes have been read, so the caller
+    can stop downloading the rest of the page.
+    """
+
+    def __init__(self, min_length=80, max_bytes=512 * 1024, encoding="utf-8"):
+        super().__init__(convert_charrefs=True)
+        self.min_length = min_length
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.result = None
+        self._decoder = codecs.getincrementaldecoder(_codec(encoding))(errors="replace")
+        self._in_p = False
+        self._skip_depth = 0
+        self._parts = []
+
+    @property
+    def done(self):
+        return self.result is not None or self.bytes_read >= self.max_bytes
+
+    def feed_bytes(self, chunk: bytes):
+        """Feed one network chunk; returns True once no more input is needed."""
+        self.bytes_read += len(chunk)
+        self.feed(self._decoder.decode(chunk))
+        return self.done
+
+    def finish(self):
+        if self.result is None:
+            self.feed(self._decoder.decode(b"", final=True))
+            self.close()
+            self._end_paragraph()
+        return self.result
+
+    def handle_starttag(self, tag, attrs):
+        if self.result is not None:
+            return
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._end_paragraph()
+            if tag == "p":
+                self._in_p = True
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "p" or (tag in _BLOCK_TAGS and self._in_p):
+            self._end_paragraph()
+
+    def handle_data(self, data):
+        if self._in_p and not self._skip_depth and self.result is None:
+            self._parts.append(data)
+
+    def _end_paragraph(self):
+        if self._in_p and self.result is None:
+            text = "".join(self._parts).strip()
+            if len(text) > self.min_length:
+                self.result = text
+        self._in_p = False
+        self._parts = []
+
+def _codec(encoding):
+    try:
+        return codecs.lookup(encoding or "utf-8").name
+    except LookupError:
+        return "utf-8"
+
+def is_html(content_type):
+    """True for HTML-ish responses, or when the server didn't say."""
+    content_type = (content_type or "").lower()
+    return not content_type or "html" in content_type
@@ -0,0 +1,55 @@
+import asyncio
+import aiohttp
+
+class HTTPClient:
+    """One pooled aiohttp session shared by every Backend network call.
+
+    Keeps TCP/TLS connections alive between requests and caches DNS lookups,
+    so repeat calls to ipinfo, ipapi, open-meteo, Wikipedia or a scraped host
+    reuse a warm connection instead of handshaking again.
+    """
+
+    def __init__(self, limit=64, limit_per_host=4, dns_ttl=600, keepalive_timeout=60):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._loop = None
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+        # A session can't outlive its event loop, so a new loop gets a new pool
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._loop = loop
+        print("🌐 HTTP connection pool started.")
+        return self._session
+
+    async def session(self):
+        """Return the shared session, starting the pool on first use."""
+        return await self.start()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            print("🌐 HTTP connection pool closed.")
+        self._session = None
+        self._loop = None
+
+# Shared by every RealTimeInformation instance in the process
+http_client = HTTPClient()
+
+async def startup():
+    return await http_client.start()
+
+async def shutdown():
+    await http_client.close()
@@ -0,0 +1,29 @@
+import importlib
+
+class LazyModule:
+    """Stand-in for a module that is only imported on first attribute access.
+
+    Heavy optional engines (TTS backends, audio I/O, search clients) are
+    declared with it at module level, so importing Orion stays cheap and only
+    the engine that is actually used ever gets loaded.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load_module(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def _is_loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load_module(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
@@ -0,0 +1,207 @@
+import asyncio
+import io
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+sf = LazyModule("soundfile")
+
+# kbit/s by bitrate index, for MPEG-1 and MPEG-2/2.5 Layer III
+_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_SAMPLERATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def parse_frame_header(header: bytes):
+    """Return (frame length, samples per frame, samplerate) for a Layer III header, or None."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03  # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    samplerate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or samplerate_index == 3:
+        return None
+    padding = (header[2] >> 1) & 0x01
+    mpeg1 = version == 3
+    bitrate = _BITRATES[1 if mpeg1 else 2][bitrate_index] * 1000
+    samplerate = _SAMPLERATES[version][samplerate_index]
+    samples = 1152 if mpeg1 else 576
+    length = (samples // 8) * bitrate // samplerate + padding
+    return length, samples, samplerate
+
+def _id3_size(data):
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for b in data[6:10]:
+        size = (size << 7) | (b & 0x7F)
+    return 10 + size
+
+class MP3StreamDecoder:
+    """Decodes an MP3 byte stream piece by piece, at frame boundaries, as it downloads.
+
+    Complete frames are decoded in batches. Layer III frames borrow up to 511
+    bytes from the frames before them and overlap with their neighbour, so
+    every batch is decoded together with enough of the previous frames to
+    cover that, and their samples are dropped again.
+
+    libsndfile sizes a raw MP3 from its first frame, which only holds for
+    constant-bitrate streams (what edge-tts and Google TTS send). If frame
+    sizes start to vary, the rest is decoded in one go at flush().
+    """
+
+    _reservoir = 512
+
+    def __init__(self, min_frames=8, dtype='float32'):
+        self.min_frames = min_frames
+        self.dtype = dtype
+        self.samplerate = None
+        self.variable_bitrate = False
+        self._buffer = bytearray()
+        self._raw = bytearray()     # everything received, for the variable-bitrate fallback
+        self._frames = []           # complete frames not decoded yet
+        self._context = []          # trailing frames that were already decoded
+        self._frame_length = None
+        self._emitted = 0
+        self._header_checked = False
+
+    def feed(self, chunk: bytes):
+        """Add downloaded bytes; returns newly decoded samples (possibly empty)."""
+        self._raw.extend(chunk)
+        self._buffer.extend(chunk)
+        self._split_frames()
+        if self.variable_bitrate or len(self._frames) < self.min_frames:
+            return self._empty()
+        return self._decode()
+
+    def flush(self):
+        """Decode whatever complete frames are left at the end of the stream."""
+        self._split_frames()
+        if self.variable_bitrate:
+            data = self._read(bytes(self._raw))[self._emitted:]
+            self._emitted += len(data)
+            return data
+        return self._decode() if self._frames else self._empty()
+
+    def _empty(self):
+        return np.zeros(0, dtype=self.dtype)
+
+    def _split_frames(self):
+        if not self._header_checked:
+            skip = _id3_size(self._buffer)
+            if len(self._buffer) < max(skip, 10):
+                return  # 🔹 Wait for the whole ID3 tag
+            del self._buffer[:skip]
+            self._header_checked = True
+        pos = 0
+        buffer = self._buffer
+        while len(buffer) - pos >= 4:
+            header = parse_frame_header(bytes(buffer[pos:pos + 4]))
+            if header is None:
+                pos += 1  # 🔹 Resync on garbage between frames
+                continue
+            length, samples, samplerate = header
+            if len(buffer) - pos < length:
+                break
+            frame = bytes(buffer[pos:pos + length])
+            pos += length
+            if b"Xing" in frame[:48] or b"Info" in frame[:48]:
+                continue  # 🔹 VBR/gapless tag frame: no audio, and it would change how batches are trimmed
+            self.samplerate = self.samplerate or samplerate
+            self._frame_length = self._frame_length or length
+            if abs(length - self._frame_length) > 1:  # 🔹 Padding changes a frame by one byte at most
+                self.variable_bitrate = True
+            self._frames.append((frame, samples))
+        del buffer[:pos]
+
+    def _decode(self):
+        frames, self._frames = self._frames, []
+        batch = self._context + frames
+        skip = sum(samples for _, samples in self._context)
+        data = self._read(b"".join(frame for frame, _ in batch))[skip:]
+        self._context = self._trailing_context(batch)
+        self._emitted += len(data)
+        return data
+
+    def _trailing_context(self, frames):
+        size = 0
+        for i in range(len(frames) - 1, -1, -1):
+            size += len(frames[i][0])
+            if size >= self._reservoir:
+                return frames[max(i - 1, 0):]  # 🔹 One more frame for the overlap-add
+        return list(frames)
+
+    def _read(self, data):
+        pcm, _ = sf.read(io.BytesIO(data), dtype=self.dtype)
+        if pcm.ndim > 1:
+            pcm = pcm.mean(axis=1).astype(self.dtype)
+        return pcm
+
+async def decode_mp3(chunks):
+    """Decode a whole async stream of MP3 bytes; returns (samples, samplerate)."""
+    decoder = MP3StreamDecoder()
+    parts = []
+    async for chunk in chunks:
+        parts.append(decoder.feed(chunk))
+    parts.append(decoder.flush())
+    return np.concatenate(parts), decoder.samplerate
+
+class DecodedStream:
+    """Downloads and decodes an MP3 stream in the background, handing out PCM as it is ready.
+
+    chunks() holds the first audio back until `jitter` seconds are decoded,
+    so a slow network doesn't stutter right at the start. on_complete gets
+    the whole utterance once the download finishes, for caching.
+    """
+
+    def __init__(self, chunks, jitter=0.3, on_complete=None):
+        self.jitter = jitter
+        self.decoder = MP3StreamDecoder()
+        self.on_complete = on_complete
+        self._ready = asyncio.Queue()
+        self.task = asyncio.ensure_future(self._run(chunks))
+
+    @property
+    def samplerate(self):
+        return self.decoder.samplerate
+
+    async def _run(self, chunks):
+        parts = []
+        try:
+            async for chunk in chunks:
+                pcm = self.decoder.feed(chunk)
+                if len(pcm):
+                    parts.append(pcm)
+                    self._ready.put_nowait(pcm)
+            pcm = self.decoder.flush()
+            if len(pcm):
+                parts.append(pcm)
+                self._ready.put_nowait(pcm)
+            if self.on_complete and parts:
+                self.on_complete(np.concatenate(parts), self.decoder.samplerate)
+        finally:
+            self._ready.put_nowait(None)
+
+    async def chunks(self):
+        held, held_seconds = [], 0.0
+        while True:
+            pcm = await self._ready.get()
+            if pcm is None:
+                break
+            if held is None:
+                yield pcm
+                continue
+            held.append(pcm)
+            held_seconds += len(pcm) / self.decoder.samplerate
+            if held_seconds >= self.jitter:
+                for part in held:
+                    yield part
+                held = None
+        for part in held or ():
+            yield part
+        if not self.task.cancelled():
+            self.task.result()  # 🔹 Surface download/decode errors to the player
+
+    def cancel(self):
+        self.task.cancel()
@@ -1,19 +1,108 @@
 import asyncio
 import aiohttp
+import json
+import time
 from datetime import datetime
-from bs4 import BeautifulSoup
-from googlesearch import search
 import re
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 import os
+from Backend.HTTPClient import http_client
+from Backend.Cache import TTLCache, TieredCache
+from Backend.HTMLExtractor import ParagraphExtractor, is_html
+from Backend.Tracing import tracer
 
 # Load environment variables from .env
 load_dotenv(dotenv_path='../.env')
 
+class LocationCache:
+    """Geolocation of the current public IP, persisted under Brain/Data.
+
+    Shared by every RealTimeInformation in the process. An entry is served
+    until it is older than ttl; the public IP is re-checked in the background
+    every ip_check_interval and a changed IP forces a fresh lookup.
+    """
+
+    def __init__(self, path=os.path.join('Brain', 'Data', 'location_cache.json'),
+                 ttl=6 * 3600, ip_check_interval=15 * 60):
+        self.path = path
+        self.ttl = ttl
+        self.ip_check_interval = ip_check_interval
+        self.entry = self._load()
+        self.refreshing = None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            # 🔹 Valid JSON that isn't our entry (e.g. [] or null) is treated like no cache
+            if isinstance(entry, dict) and {"ip", "fetched_at", "location"} <= entry.keys():
+                return entry
+            return None
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def get(self):
+        if self.entry and time.time() - self.entry["fetched_at"] < self.ttl:
+            return dict(self.entry["location"])
+        return None
+
+    def needs_ip_check(self):
+        return not self.entry or time.time() - self.entry.get("checked_at", 0) >= self.ip_check_interval
+
+    def store(self, ip, location):
+        now = time.time()
+        self.entry = {"ip": ip, "fetched_at": now, "checked_at": now, "location": location}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entry, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not persist location cache: {e}")
+
+    def confirm(self, ip):
+        """Keep the entry if the public IP is unchanged, otherwise drop it."""
+        if self.entry and self.entry["ip"] == ip:
+            self.entry["checked_at"] = time.time()
+            return True
+        self.entry = None
+        return False
+
+location_cache = LocationCache(ttl=int(os.getenv('LocationCacheTTL', 6 * 3600)))
+# Current conditions keyed by coordinates rounded to ~1 km
+weather_cache = TTLCache(ttl=int(os.getenv('WeatherCacheTTL', 10 * 60)), maxsize=32)
+# Normalized query -> result links, and URL -> extracted summary
+search_cache = TieredCache(os.path.join('Brain', 'Data', 'cache', 'search'),
+                           ttl=int(os.getenv('SearchCacheTTL', 6 * 3600)), memory_size=128, max_entries=500)
+page_cache = TieredCache(os.path.join('Brain', 'Data', 'cache', 'pages'),
+                         ttl=int(os.getenv('PageCacheTTL', 24 * 3600)), memory_size=512, max_entries=2000)
+
+def search(query, num_results, lang):
+    """googlesearch is only imported the first time a web search actually runs."""
+    from googlesearch import search as google_search
+    return google_search(query, num_results=num_results, lang=lang)
+
+_FILLER_WORDS = {"search", "for", "about", "find", "look", "up", "please", "me", "the", "a", "an", "on", "of"}
+
+def normalize_query(query):
+    """Fold case, punctuation and filler words so near-identical searches share a cache key."""
+    words = re.sub(r"[^\w\s]", " ", query.lower()).split()
+    return " ".join(w for w in words if w not in _FILLER_WORDS) or " ".join(words)
+
 class RealTimeInformation:
-    def __init__(self):
+    def __init__(self, search_deadline=10.0, per_host_limit=2, max_page_bytes=512 * 1024, wiki_grace=0.5):
         self.location_data = None
         self.api_key = os.getenv('ipapiKey')
+        # Whole-search budget (Google + scrapes + Wikipedia) and per-host scrape cap
+        self.search_deadline = search_deadline
+        self.per_host_limit = per_host_limit
+        self._host_limits = {}
+        # How long Wikipedia may still take once enough page summaries are in
+        self.wiki_grace = wiki_grace
+        # Stop downloading a page after this many bytes if no paragraph qualified yet
+        self.max_page_bytes = max_page_bytes
         
     async def get(self, module, query):
         """Handle different types of information requests based on the module."""
@@ -29,54 +118,84 @@ class RealTimeInformation:
             return f"❌ Unknown module: {module}"
         
     async def get_location(self):
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get("https://ipinfo.io/json") as response:
-                    ip_info = await response.json()
-                    ip = ip_info.get("ip", "Unknown")
-                
-                async with session.get(f"https://api.ipapi.is?q={ip}&key={self.api_key}") as response:
-                    data = await response.json()
-                    location = data.get("location", {})
-                    city = location.get("city", "Unknown")
-                    region = location.get("state", "")
-                    country = location.get("country", "")
-                    lat = location.get("latitude", "")
-                    lon = location.get("longitude", "")
-                    return {
-                        "city": city,
-                        "region": region,
-                        "country": country,
-                        "latitute": lat,
-                        "longitude": lon,
-                        "timezone": location.get("timezone", "Unknown")
-                    }
-            except Exception as e:
-                return {
-                    "city": "Unknown", "region": "", "country": "",
-                    "latitute": "", "longitude": "", "timezone": "", "error": str(e)
+        cached = location_cache.get()
+        if cached:
+            if location_cache.needs_ip_check() and location_cache.refreshing is None:
+                # 🔹 Serve the cached value now, notice IP changes in the background
+                self._start_location_refresh(revalidate=True)
+            return cached
+        return await self.refresh_location()
+
+    async def refresh_location(self, revalidate=False):
+        """Fetch location once even if several callers ask at the same time."""
+        task = location_cache.refreshing
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = self._start_location_refresh(revalidate)
+        return dict(await asyncio.shield(task))
+
+    def _start_location_refresh(self, revalidate):
+        task = asyncio.ensure_future(self._fetch_location(revalidate))
+        location_cache.refreshing = task
+        task.add_done_callback(lambda _: setattr(location_cache, "refreshing", None))
+        return task
+
+    async def _fetch_location(self, revalidate=False):
+        session = await http_client.session()
+        try:
+            async with session.get("https://ipinfo.io/json") as response:
+                ip_info = await response.json()
+                ip = ip_info.get("ip", "Unknown")
+
+            if revalidate and location_cache.confirm(ip) and location_cache.get():
+                return location_cache.get()
+
+            async with session.get(f"https://api.ipapi.is?q={ip}&key={self.api_key}") as response:
+                data = await response.json()
+                location = data.get("location", {})
+                city = location.get("city", "Unknown")
+                region = location.get("state", "")
+                country = location.get("country", "")
+                lat = location.get("latitude", "")
+                lon = location.get("longitude", "")
+                result = {
+                    "city": city,
+                    "region": region,
+                    "country": country,
+                    "latitute": lat,
+                    "longitude": lon,
+                    "timezone": location.get("timezone", "Unknown")
                 }
+            location_cache.store(ip, result)
+            return result
+        except Exception as e:
+            return {
+                "city": "Unknown", "region": "", "country": "",
+                "latitute": "", "longitude": "", "timezone": "", "error": str(e)
+            }
 
     async def get_detailed_weather(self):
-        if not self.location_data:
-            self.location_data = await self.get_location()
-            if "error" in self.location_data:
-                return f"❌ Error fetching location: {self.location_data['error']}"
+        self.location_data = await self.get_location()
+        if "error" in self.location_data:
+            return f"❌ Error fetching location: {self.location_data['error']}"
         lat = self.location_data["latitute"]
         lon = self.location_data["longitude"]
         if not lat or not lon:
             return "Location not found."
 
-        url = (
-            f"https://api.open-meteo.com/v1/forecast?"
-            f"latitude={lat}&longitude={lon}&current_weather=true"
-            f"&hourly=precipitation_probability,wind_speed_10m,wind_direction_10m"
-        )
-        async with aiohttp.ClientSession() as session:
+        key = (round(float(lat), 2), round(float(lon), 2))
+        current = weather_cache.get(key)
+        if current is None:
+            # Only current conditions are formatted, so don't ask for hourly series
+            url = (
+                f"https://api.open-meteo.com/v1/forecast?"
+                f"latitude={key[0]}&longitude={key[1]}&current_weather=true"
+            )
+            session = await http_client.session()
             async with session.get(url) as response:
                 data = await response.json()
+            current = data["current_weather"]
+            weather_cache.set(key, current)
 
-        current = data["current_weather"]
         wind_dir = current.get("winddirection", 0)
         wind_speed = current.get("windspeed", 0)
         temp_c = current.get("temperature", 0)
@@ -90,10 +209,9 @@ class RealTimeInformation:
         )
 
     async def get_time_info(self):
-        if not self.location_data:
-            self.location_data = await self.get_location()
-            if "error" in self.location_data:
-                return f"❌ Error fetching location: {self.location_data['error']}"
+        self.location_data = await self.get_location()
+        if "error" in self.location_data:
+            return f"❌ Error fetching location: {self.location_data['error']}"
         now = datetime.now()
         return (
             f"🗕️ Date: {now.strftime('%A, %d %B %Y')}\n"
@@ -102,10 +220,9 @@ class RealTimeInformation:
         )
 
     async def get_location_info(self):
-        if not self.location_data:
-            self.location_data = await self.get_location()
-            if "error" in self.location_data:
-                return f"❌ Error fetching location: {self.location_data['error']}"
+        self.location_data = await self.get_location()
+        if "error" in self.location_data:
+            return f"❌ Error fetching location: {self.location_data['error']}"
         return (
             f"📍 City: {self.location_data['city']}\n"
             f"🗺️ Region: {self.location_data['region']}\n"
@@ -145,33 +262,53 @@ class RealTimeInformation:
             max_results = min(max(1, max_results), 10)  # Between 1 and 10
             
             print(f"🔍 Searching for: {query} (max results: {max_results})")
-            searcher = search(query, num_results=max_results, lang="en")
-            links = list(searcher)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.search_deadline
+
+            # Over-fetch candidates so a few dead pages don't cost us results
+            wanted = max_results * 2
+            query_key = normalize_query(query)
+            cached = search_cache.get(query_key)
+            if cached and cached["requested"] >= wanted:
+                links = cached["links"]
+            else:
+                with tracer.span("search.engine"):
+                    links = await asyncio.wait_for(
+                        asyncio.to_thread(lambda: list(search(query, num_results=wanted, lang="en"))),
+                        timeout=self.search_deadline,
+                    )
+                # 🔹 A blocked or rate-limited search returns nothing; don't remember that for hours
+                if links:
+                    search_cache.set(query_key, {"requested": wanted, "links": links})
 
             valid_links = [
                 link for link in links if all(bad not in link for bad in [
                     "gstatic", "google.com/search", "accounts.google.com", ".jpg", ".png", ".webp"
                 ])
-            ][:max_results]
-
-            results = []
-            for link in valid_links:
-                summary = await self.scrape_summary(link, min_summary_length)
-                results.append(f"🔗 {link}\n📜 {summary or 'Summary not available'}")
+            ][:max_results * 2]
 
             # Integrated Wikipedia inside search system
             title = re.sub(r"[^\w\s]", "", query).strip().replace(" ", "_").title()
             wiki_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(wiki_url) as response:
-                        data = await response.json()
-                        if 'extract' in data:
-                            results.append(f"📘 Wikipedia Summary:\n{data['extract']}")
-                except Exception as e:
-                    print(f"Wikipedia lookup failed: {e}")
-            
-            search_results = f"🔍 Search Results for '{query}':\n\n{"\n\n".join(results) if results else "❌ No useful results found."}"
+
+            summaries, wiki_extract = await self._fan_out(
+                valid_links, wiki_url, max_results, min_summary_length, deadline
+            )
+
+            # 🔹 Keep search-engine ranking, not arrival order
+            results = [
+                f"🔗 {link}\n📜 {summaries[link]}" for link in valid_links if summaries.get(link)
+            ][:max_results]
+            for link in valid_links[:max_results]:
+                if len(results) >= max_results:
+                    break
+                if not summaries.get(link):
+                    results.append(f"🔗 {link}\n📜 Summary not available")
+            if wiki_extract:
+                results.append(f"📘 Wikipedia Summary:\n{wiki_extract}")
+
+            body = "\n\n".join(results) if results else "❌ No useful results found."
+            search_results = f"🔍 Search Results for '{query}':\n\n{body}"
             print(f"Found {len(results)} results for query: {query}")
             return search_results
         except Exception as e:
@@ -179,22 +316,131 @@ class RealTimeInformation:
             print(error_msg)
             return error_msg  # Always return a string, never None
 
-    async def scrape_summary(self, url, min_length=80):
-        headers = {"User-Agent": "Mozilla/5.0"}
+    async def _fan_out(self, links, wiki_url, max_results, min_summary_length, deadline):
+        """Scrape all links and the Wikipedia summary concurrently under one deadline."""
+        loop = asyncio.get_running_loop()
+        summaries = {}
+        wiki_extract = None
+
+        session = await http_client.session()
+        tasks = {
+            asyncio.create_task(self._scrape_limited(session, link, min_summary_length)): link
+            for link in links
+        }
+        wiki_task = asyncio.create_task(self._fetch_wiki_summary(session, wiki_url))
+        pending = set(tasks) | {wiki_task}
+        good = 0
+        wait_until = deadline
+
+        try:
+            while pending:
+                # 🔹 Enough summaries: don't wait on stragglers, and give Wikipedia only a short grace
+                if good >= max_results:
+                    if wiki_task.done():
+                        break
+                    if wait_until == deadline:
+                        wait_until = min(deadline, loop.time() + self.wiki_grace)
+                remaining = wait_until - loop.time()
+                if remaining <= 0:
+                    if wait_until < deadline:
+                        print("⏱️ Enough results, not waiting for Wikipedia")
+                    else:
+                        print(f"⏱️ Search deadline of {self.search_deadline}s reached")
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task is wiki_task:
+                        wiki_extract = task.result()
+                        continue
+                    summary = task.result()
+                    summaries[tasks[task]] = summary
+                    if summary:
+                        good += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return summaries, wiki_extract
+
+    async def _scrape_limited(self, session, url, min_length):
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        async with semaphore:
+            return await self.scrape_summary(url, min_length, session=session)
+
+    async def _fetch_wiki_summary(self, session, wiki_url):
+        async def extract(response):
+            data = await response.json()
+            return data.get('extract')
+
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url, timeout=7) as response:
-                    html = await response.text()
-
-            soup = BeautifulSoup(html, "html.parser")
-            for p in soup.find_all("p"):
-                text = p.get_text().strip()
-                if len(text) > min_length:
-                    return text
+            return await self._cached_get(session, wiki_url, wiki_url, extract)
+        except Exception as e:
+            print(f"Wikipedia lookup failed: {e}")
             return None
+
+    async def scrape_summary(self, url, min_length=80, session=None):
+        headers = {"User-Agent": "Mozilla/5.0"}
+
+        async def extract(response):
+            # 🔹 PDFs, images and feeds never have a usable <p>; don't download them
+            if not is_html(response.headers.get("Content-Type")):
+                return None
+            parser = ParagraphExtractor(min_length, self.max_page_bytes, response.charset)
+            async for chunk in response.content.iter_chunked(16 * 1024):
+                if parser.feed_bytes(chunk):
+                    break
+            return parser.finish()
+
+        try:
+            session = session or await http_client.session()
+            with tracer.span("search.scrape", host=urlparse(url).netloc):
+                return await self._cached_get(session, url, f"{min_length}|{url}", extract, headers)
+        except asyncio.CancelledError:
+            raise
         except:
             return None
 
+    async def _cached_get(self, session, url, key, extract, headers=None):
+        """GET through page_cache, revalidating expired entries with ETag/Last-Modified."""
+        cached = page_cache.get(key)
+        if cached is not None:
+            return cached["summary"]
+
+        headers = dict(headers or {})
+        stale = page_cache.get_stale(key)
+        if stale:
+            if stale.get("etag"):
+                headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                headers["If-Modified-Since"] = stale["last_modified"]
+
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=7)) as response:
+            if response.status == 304 and stale:
+                page_cache.set(key, stale)
+                return stale["summary"]
+            summary = await extract(response)
+            if response.status == 200:
+                page_cache.set(key, {
+                    "summary": summary,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                })
+            return summary
+
+    def cache_stats(self):
+        """Hit/miss counters of the shared realtime caches."""
+        return {
+            "weather": weather_cache.stats(),
+            "search": search_cache.stats(),
+            "pages": page_cache.stats(),
+        }
+
     def interpret_weather_code(self, code):
         code_map = {
             0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast", 45: "Fog",
@@ -210,6 +456,13 @@ class RealTimeInformation:
         ix = int((degree + 22.5) / 45.0) % 8
         return dirs[ix]
 
+async def warm_location_cache():
+    """Resolve (or revalidate) the cached location so the first query doesn't wait on it."""
+    location = await RealTimeInformation().refresh_location(revalidate=True)
+    if "error" in location:
+        print(f"⚠️ Location warm-up failed: {location['error']}")
+    return location
+
 # RealTimeInformation = RealTimeInformation()
 # # Example usage:
 # asyncio.run(RealTimeInformation.get_location_info("Where am I?"))
\ No newline at end of file
@@ -0,0 +1,134 @@
+import statistics
+import threading
+import time
+from collections import deque
+
+_DROPPED = object()
+
+class RecognitionPool:
+    """Transcribes captured phrases on a few worker threads and delivers results in capture order.
+
+    submit() never blocks the listener thread. At most max_pending phrases
+    wait for a worker; when another one arrives the oldest waiting phrase is
+    dropped. deliver(result) is called once per phrase that was not dropped,
+    in the order the phrases were captured; result is the transcript, or the
+    exception the recognizer raised.
+    """
+
+    def __init__(self, recognize, deliver, workers=2, max_pending=4):
+        self.recognize = recognize
+        self.deliver = deliver
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pending = deque()        # (seq, audio, submitted_at) waiting for a worker
+        self._results = {}             # seq -> result, until its turn to be delivered
+        self._next = 0                 # next seq to deliver
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._deliver_lock = threading.Lock()
+        self._threads = []
+        self._closed = False
+        # 🔹 Metrics
+        self.submitted = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self._latencies = deque(maxlen=200)      # capture -> delivery, seconds
+        self._recognize_times = deque(maxlen=200)
+
+    def start(self):
+        with self._lock:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"stt-worker-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def submit(self, audio):
+        if not self._threads:
+            self.start()
+        dropped = None
+        with self._lock:
+            seq, self._seq = self._seq, self._seq + 1
+            self.submitted += 1
+            if len(self._pending) >= self.max_pending:
+                dropped = self._pending.popleft()[0]
+                self._results[dropped] = _DROPPED
+                self.dropped += 1
+            self._pending.append((seq, audio, time.monotonic()))
+            self.max_depth = max(self.max_depth, len(self._pending))
+            self._ready.notify()
+        if dropped is not None:
+            print("⚠️ Recognition queue full, dropped the oldest phrase.")
+            self._flush()
+        return seq
+
+    @property
+    def depth(self):
+        return len(self._pending)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._ready.notify_all()
+
+    def _work(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._ready.wait()
+                if self._closed:
+                    return
+                seq, audio, submitted_at = self._pending.popleft()
+            started = time.monotonic()
+            try:
+                result = self.recognize(audio)
+            except Exception as e:
+                result = e
+            with self._lock:
+                self._recognize_times.append(time.monotonic() - started)
+                self._results[seq] = (result, submitted_at)
+            self._flush()
+
+    def _flush(self):
+        # Only one thread delivers at a time, so results go out strictly in seq order
+        with self._deliver_lock:
+            while True:
+                with self._lock:
+                    if self._next not in self._results:
+                        return
+                    item = self._results.pop(self._next)
+                    self._next += 1
+                if item is _DROPPED:
+                    continue
+                result, submitted_at = item
+                try:
+                    self.deliver(result)
+                except Exception as e:
+                    print(f"⚠️ Delivering a transcript failed: {e}")
+                with self._lock:
+                    self.delivered += 1
+                    self._latencies.append(time.monotonic() - submitted_at)
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            recognize_times = sorted(self._recognize_times)
+            return {
+                "submitted": self.submitted,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "queue_depth": len(self._pending),
+                "max_queue_depth": self.max_depth,
+                "latency_p50_ms": percentile_ms(latencies, 50),
+                "latency_p95_ms": percentile_ms(latencies, 95),
+                "recognize_p50_ms": percentile_ms(recognize_times, 50),
+            }
+
+def percentile_ms(sorted_values, pct):
+    """pct-th percentile of sorted durations in seconds, in milliseconds (also used by Backend/Tracing.py)."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0] * 1000
+    return statistics.quantiles(sorted_values, n=100, method="inclusive")[pct - 1] * 1000
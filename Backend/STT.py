@@ -3,6 +3,14 @@ import asyncio
 import time
 import threading
 from Backend.TTS import OrionTTS
+from Backend.RecognitionPool import RecognitionPool
+from Backend.State import assistant_state
+from Backend.STTBackends import GoogleRecognizer, microphone_source
+from Backend.Tracing import Transcript, tracer
+from Backend.VAD import VoiceActivityDetector
+from Backend.WakeWord import WakeWordDetector
+
+WAKE_PHRASES = ("orion", "hi orion", "hey orion", "wakeup", "wake up")
 
 class AudioHandler:
     def __init__(self):
@@ -18,13 +26,16 @@ class AudioHandler:
         return await self.audio_queue.get()
 
 class FastNaturalSpeechRecognition:
-    def __init__(self):
+    def __init__(self, tts=None, state=None, source=None, backend=None, workers=2, max_pending=4,
+                 vad=None, wakeword=None, on_barge_in=None):
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # Where audio comes from and who transcribes it (see Backend/STTBackends.py)
+        self.source = source if source is not None else microphone_source()
+        self.backend = backend or GoogleRecognizer(self.recognizer)
         self.recognizer.energy_threshold = 300
         self.recognizer.dynamic_energy_threshold = False
         self.recognizer.pause_threshold = 0.5
-        self.exit = True
+        self.state = state or assistant_state
         self.listener = None
         self._stop_event = threading.Event()
 
@@ -34,27 +45,72 @@ class FastNaturalSpeechRecognition:
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
-        self.tts = OrionTTS()
+        self.tts = tts or OrionTTS()
         self.audio_handler = AudioHandler()
+        # Noise bursts are dropped before upload (vad=False sends every captured phrase)
+        self.vad = VoiceActivityDetector() if vad is None else vad
+        # While asleep, phrases are matched against local wake word templates instead of uploaded
+        self.wakeword = WakeWordDetector() if wakeword is None else wakeword
+        self.ignored_while_asleep = 0
+        # Called from the pool thread when the user talks over Orion (main.py aborts the reply with it)
+        self.on_barge_in = on_barge_in
+        # Phrases are transcribed in parallel so capture never waits on the cloud
+        self.pool = RecognitionPool(self._recognize, self._deliver, workers, max_pending)
+
+    @property
+    def exit(self):
+        return self.state.sleeping
 
     def get_exit_status(self):
-        with open('Brain/Data/stop.orion', 'r') as f:
-            self.exit = f.read().strip().lower() == 'true'
+        return self.state.sleeping
 
     def set_exit_status(self, status: bool):
-        with open('Brain/Data/stop.orion', 'w') as f:
-            f.write(str(status))
-        self.exit = status
+        if status:
+            self.state.sleep()
+        else:
+            self.state.wake()
 
     def _callback(self, recognizer, audio):
+        turn = tracer.new_turn()
+        tracer.record("stt.capture", len(audio.frame_data) / (audio.sample_rate * audio.sample_width), turn)
+        if self.vad:
+            with tracer.span("stt.vad", turn):
+                audio = self.vad.process(audio)
+            if audio is None:
+                return
+        if self.exit and self.wakeword and self.wakeword.available:
+            with tracer.span("stt.wakeword", turn):
+                detected = self.wakeword.detect(audio)
+            if detected:
+                print("👂 Wake word detected, listening again.")
+                self.set_exit_status(False)
+            return
+        self.pool.submit((audio, turn))
+
+    def _recognize(self, phrase):
+        """Runs on a pool worker; the transcript carries the phrase's turn ID when tracing."""
+        audio, turn = phrase
+        with tracer.span("stt.recognition", turn):
+            text = self.backend.recognize(audio)
+        return Transcript(text, turn) if turn else text
+
+    def _deliver(self, result):
+        """Called by the pool, one phrase at a time in capture order."""
         try:
-            text = recognizer.recognize_google(audio)
-            self.get_exit_status()
-            if self.exit and text.lower() in ["orion", "hi orion", "hey orion", "wakeup"]:
+            if isinstance(result, Exception):
+                raise result
+            text = result
+            if self.exit:
+                # No wake word templates: cloud STT decides, but only the wake word reaches the model
+                if text.lower().strip(" .!?") not in WAKE_PHRASES:
+                    self.ignored_while_asleep += 1
+                    return
                 self.set_exit_status(False)
-            if self.tts and self.tts._isruning():
+            if self.state.speaking:
                 print("🛑 Barge-in detected! Stopping TTS...")
                 self.tts.stop()
+                if self.on_barge_in:
+                    self.on_barge_in()
             print(f"🎤 Recognized (raw): {text}")
             self.audio_handler.put_threadsafe(text, self.loop)
         except sr.UnknownValueError:
@@ -67,7 +123,7 @@ class FastNaturalSpeechRecognition:
     def start_background_listener(self):
         if self.listener is None:
             print("🎧 Background listener started.")
-            self.listener = self.recognizer.listen_in_background(self.microphone, self._callback)
+            self.listener = self.recognizer.listen_in_background(self.source, self._callback)
 
     def run_background_listener(self):
         self.start_background_listener()
@@ -89,12 +145,11 @@ class FastNaturalSpeechRecognition:
 
     async def recognize_from_microphone(self) -> str:
         try:
-            with sr.Microphone() as source:
+            with self.source as source:
                 print("🎙️ Listening... (speak at your pace)")
                 audio_data = self.recognizer.listen(source)
-            result = await asyncio.to_thread(self.recognizer.recognize_google, audio_data)
-            self.get_exit_status()
-            if self.exit and result.lower() in ["orion", "hi orion", "wake up"]:
+            result = await asyncio.to_thread(self.backend.recognize, audio_data)
+            if self.exit and result.lower().strip(" .!?") in WAKE_PHRASES:
                 self.set_exit_status(False)
             return result if not self.exit else None
         except sr.UnknownValueError:
@@ -0,0 +1,130 @@
+import threading
+import time
+import speech_recognition as sr
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+sf = LazyModule("soundfile")
+
+# 🔹 Audio sources: anything speech_recognition can listen to (sr.AudioSource)
+
+def microphone_source(**kwargs):
+    """The live microphone, as used by the assistant."""
+    return sr.Microphone(**kwargs)
+
+class _ReplayStream:
+    def __init__(self, source):
+        self.source = source
+
+    def read(self, frames):
+        return self.source._read(frames)
+
+    def close(self):
+        pass
+
+class ReplaySource(sr.AudioSource):
+    """Feeds recorded WAVs (like temp.wav) to the listener as if they came from a microphone.
+
+    Audio is paced at `speed` times real time (float("inf") for no pacing),
+    with `gap` seconds of silence after each recording so the listener sees
+    the phrase end. Trailing silence in the files is trimmed, so
+    `utterance_ends` collects the monotonic time at which the speech in each
+    recording finished playing. `finished` is set after the last one; from
+    then on the source keeps delivering silence.
+    """
+
+    def __init__(self, paths, speed=1.0, gap=1.0, sample_rate=16000, chunk_size=1024):
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.speed = speed
+        self.gap = gap
+        self.SAMPLE_RATE = sample_rate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = chunk_size
+        self.stream = None
+        self.utterance_ends = []
+        self.finished = threading.Event()
+        self._audio = b""
+        self._ends = []
+        self._pos = 0
+        self._started_at = None
+
+    def __enter__(self):
+        if self._started_at is None:
+            silence = bytes(int(self.gap * self.SAMPLE_RATE) * self.SAMPLE_WIDTH)
+            parts = []
+            for path in self.paths:
+                parts.append(self._load(path))
+                self._ends.append(sum(len(p) for p in parts))
+                parts.append(silence)
+            self._audio = b"".join(parts)
+            self._started_at = time.monotonic()
+        self.stream = _ReplayStream(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stream = None
+
+    def _load(self, path):
+        data, rate = sf.read(path, dtype='float32', always_2d=True)
+        mono = data.mean(axis=1)
+        loud = np.flatnonzero(np.abs(mono) > 0.01)
+        mono = mono[:loud[-1] + 1] if len(loud) else mono[:0]  # 🔹 Ends are measured from the last sound
+        if rate != self.SAMPLE_RATE and len(mono):
+            n = int(round(len(mono) * self.SAMPLE_RATE / rate))
+            mono = np.interp(np.linspace(0, len(mono) - 1, n), np.arange(len(mono)), mono)
+        return (np.clip(mono, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+    def _read(self, frames):
+        size = frames * self.SAMPLE_WIDTH
+        chunk = self._audio[self._pos:self._pos + size]
+        chunk += bytes(size - len(chunk))
+        self._pos += size
+        # 🔹 Don't hand out audio before it would have been spoken
+        due = self._started_at + self._pos / (self.SAMPLE_RATE * self.SAMPLE_WIDTH) / self.speed
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        while self._ends and self._pos >= self._ends[0]:
+            self._ends.pop(0)
+            self.utterance_ends.append(time.monotonic())
+        if not self._ends and self._pos >= len(self._audio):
+            self.finished.set()
+        return chunk
+
+# 🔹 Recognizers: recognize(audio) -> text, raising sr.UnknownValueError / sr.RequestError
+
+class GoogleRecognizer:
+    """Google Web Speech API via speech_recognition (needs network)."""
+
+    name = "google"
+
+    def __init__(self, recognizer=None, language="en-US"):
+        self.recognizer = recognizer or sr.Recognizer()
+        self.language = language
+
+    def recognize(self, audio):
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+class LocalStubRecognizer:
+    """Offline stand-in that answers with scripted transcripts after a fixed latency.
+
+    Transcripts are returned in order; an empty or missing one counts as
+    unintelligible speech.
+    """
+
+    name = "local-stub"
+
+    def __init__(self, transcripts=(), latency=0.0):
+        self.transcripts = list(transcripts)
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def recognize(self, audio):
+        time.sleep(self.latency)
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+        if index >= len(self.transcripts) or not self.transcripts[index]:
+            raise sr.UnknownValueError()
+        return self.transcripts[index]
@@ -0,0 +1,89 @@
+from dotenv import load_dotenv
+import os
+import threading
+
+load_dotenv(dotenv_path='../.env')
+
+class AssistantState:
+    """Thread-safe listening/sleeping and speaking/idle flags shared by STT, TTS and the main loop.
+
+    Checks are plain memory reads, so the STT callback thread can test for
+    barge-in or a wake word without touching the disk. Pass snapshot_dir to
+    also mirror every change into the old stop.orion / TTS_runing.orion
+    files for other processes that still read them.
+    """
+
+    def __init__(self, sleeping=False, snapshot_dir=None):
+        self._awake = threading.Event()
+        self._speaking = threading.Event()
+        self._idle = threading.Event()
+        self._lock = threading.Lock()
+        self.snapshot_dir = snapshot_dir
+        if snapshot_dir:
+            sleeping = self._read_flag("stop.orion", sleeping)
+        if not sleeping:
+            self._awake.set()
+        self._idle.set()
+
+    # 🔹 Listening / sleeping
+    @property
+    def sleeping(self):
+        return not self._awake.is_set()
+
+    @property
+    def listening(self):
+        return self._awake.is_set()
+
+    def sleep(self):
+        with self._lock:
+            self._awake.clear()
+            self._snapshot("stop.orion", True)
+
+    def wake(self):
+        with self._lock:
+            self._awake.set()
+            self._snapshot("stop.orion", False)
+
+    def wait_awake(self, timeout=None):
+        return self._awake.wait(timeout)
+
+    # 🔹 Speaking / idle
+    @property
+    def speaking(self):
+        return self._speaking.is_set()
+
+    def start_speaking(self):
+        with self._lock:
+            self._idle.clear()
+            self._speaking.set()
+            self._snapshot("TTS_runing.orion", True)
+
+    def stop_speaking(self):
+        with self._lock:
+            self._speaking.clear()
+            self._idle.set()
+            self._snapshot("TTS_runing.orion", False)
+
+    def wait_idle(self, timeout=None):
+        return self._idle.wait(timeout)
+
+    def _read_flag(self, name, default):
+        try:
+            with open(os.path.join(self.snapshot_dir, name), 'r') as f:
+                return f.read().strip().lower() == 'true'
+        except OSError:
+            return default
+
+    def _snapshot(self, name, value):
+        if not self.snapshot_dir:
+            return
+        try:
+            with open(os.path.join(self.snapshot_dir, name), 'w') as f:
+                f.write(str(value).lower())
+        except OSError as e:
+            print(f"⚠️ State snapshot failed: {e}")
+
+# Shared by every component in this process; set OrionStateSnapshot=1 to mirror it to Brain/Data
+assistant_state = AssistantState(
+    snapshot_dir=os.path.join('Brain', 'Data') if os.getenv('OrionStateSnapshot') == '1' else None,
+)
@@ -0,0 +1,104 @@
+import concurrent.futures
+import contextlib
+import io
+import os
+import queue
+import tempfile
+import threading
+import time
+from Backend.Lazy import LazyModule
+
+pyttsx3 = LazyModule("pyttsx3")
+sf = LazyModule("soundfile")
+
+_STOP = object()
+
+def _scratch_dir():
+    """RAM-backed /dev/shm when available, so pyttsx3's output file never touches the disk."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+class Pyttsx3Worker:
+    """One pyttsx3 engine kept alive on its own thread, turning queued text into PCM in order.
+
+    pyttsx3 can only synthesize into a file, so every request goes through a
+    scratch WAV that is read straight back into memory and removed. Requests
+    are served one by one, so the next sentence synthesizes while the caller
+    plays the current one.
+    """
+
+    def __init__(self, engine_factory=None, scratch_dir=None, flush_timeout=0.5):
+        self._engine_factory = engine_factory or pyttsx3.init
+        self.scratch_dir = scratch_dir or _scratch_dir()
+        self.flush_timeout = flush_timeout
+        self._requests = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.engine_inits = 0
+        self.synthesized = 0
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="pyttsx3-worker", daemon=True)
+                self._thread.start()
+
+    def submit(self, text) -> concurrent.futures.Future:
+        """Queue text for synthesis; the future resolves to (float32 samples, samplerate)."""
+        self.start()
+        future = concurrent.futures.Future()
+        self._requests.put((text, future))
+        return future
+
+    def close(self, timeout=2.0):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._requests.put(_STOP)
+            thread.join(timeout)
+
+    def _run(self):
+        fd, path = tempfile.mkstemp(prefix="orion-tts-", suffix=".wav", dir=self.scratch_dir)
+        os.close(fd)
+        engine = None
+        try:
+            while True:
+                item = self._requests.get()
+                if item is _STOP:
+                    break
+                text, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue  # 🔹 Dropped by a barge-in before we got to it
+                try:
+                    if engine is None:
+                        engine = self._engine_factory()
+                        self.engine_inits += 1
+                    future.set_result(self._synthesize(engine, text, path))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def _synthesize(self, engine, text, path):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)  # 🔹 Never read back the previous sentence
+        engine.save_to_file(text, path)
+        engine.runAndWait()
+        result = self._read(path)
+        self.synthesized += 1
+        return result
+
+    def _read(self, path):
+        # Some drivers return from runAndWait() just before the file is flushed;
+        # poll for it briefly instead of always sleeping.
+        deadline = time.monotonic() + self.flush_timeout
+        while True:
+            try:
+                with open(path, 'rb') as f:
+                    return sf.read(io.BytesIO(f.read()), dtype='float32')
+            except (OSError, RuntimeError):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.01)
@@ -1,106 +1,298 @@
 import time
-import sounddevice as sd
-import soundfile as sf
 import io
 import asyncio
-from edge_tts import Communicate
-from gtts import gTTS
-import pyttsx3
-from groq import Groq
 from dotenv import load_dotenv
 import os
-import tempfile
+import re
+from Backend.AudioCache import AudioCache
+from Backend.AudioOutput import audio_output
+from Backend.Lazy import LazyModule
+from Backend.MP3Stream import DecodedStream, decode_mp3
+from Backend.State import assistant_state
+from Backend.SynthWorker import Pyttsx3Worker
+from Backend.Tracing import tracer
+
+# Audio I/O and engines load on first use, so only the selected engine is ever imported
+sd = LazyModule("sounddevice")
+sf = LazyModule("soundfile")
+edge_tts = LazyModule("edge_tts")
+gtts = LazyModule("gtts")
+pyttsx3 = LazyModule("pyttsx3")
+groq = LazyModule("groq")
 
 load_dotenv(dotenv_path='../.env')
 groq_api = os.getenv('GroqAPI')
-if not groq_api:
-    raise ValueError("❌ GroqAPI not set")
+
+# engine name -> (synthesis method, modules it needs besides audio I/O)
+ENGINES = {
+    "gtts": ("_synthesize_gtts", (gtts,)),
+    "edge": ("_synthesize_edge_tts", (edge_tts,)),
+    "pyttsx3": ("_synthesize_offline", (pyttsx3,)),
+    "groq": ("_synthesize_groq", (groq,)),
+}
+# engines that deliver MP3 while synthesizing -> method yielding the MP3 bytes
+STREAMING = {"gtts": "_mp3_gtts", "edge": "_mp3_edge_tts"}
+VOICES = {"gtts": "en", "edge": "en-GB-RyanNeural", "pyttsx3": "default", "groq": "Atlas-PlayAI"}
+
+# Synthesized once and replayed from the cache (override with "stock_phrases" in orionconfig.json)
+STOCK_PHRASES = (
+    "Oops, something went wrong.",
+    "Hello! How can I help you?",
+    "Okay.",
+    "Sure.",
+    "Goodbye!",
+)
+
+# Shared decoded-audio cache (engine, voice, text) -> PCM
+audio_cache = AudioCache(
+    os.path.join('Brain', 'Data', 'cache', 'tts'),
+    max_bytes=int(os.getenv('TTSCacheMB', 64)) * 1024 * 1024,
+)
+
+class SentenceSplitter:
+    """Cuts a stream of LLM text deltas into speakable sentences."""
+
+    _boundary = re.compile(r"""(?<=[.!?])["')\]]*\s+|\n+""")
+    _abbreviations = ("mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "e.g.", "i.e.", "etc.")
+
+    def __init__(self, min_chars=20):
+        self.min_chars = min_chars
+        self.buffer = ""
+
+    def feed(self, delta: str):
+        self.buffer += delta
+        sentences = []
+        start = 0
+        for match in self._boundary.finditer(self.buffer):
+            candidate = self.buffer[start:match.start()].strip()
+            # 🔹 Don't cut after "Dr." or on tiny fragments like "1."
+            last_word = candidate.rsplit(None, 1)[-1].lower() if candidate else ""
+            if len(candidate) < self.min_chars or last_word in self._abbreviations:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        tail, self.buffer = self.buffer.strip(), ""
+        return tail
 
 class OrionTTS:
-    def __init__(self, engine="pyttsx3"):
+    def __init__(self, engine="pyttsx3", voice=None, client=None, client_factory=None, state=None,
+                 cache=None, output=None, stock_phrases=STOCK_PHRASES, streaming=True, jitter=0.3):
         self.engine = engine.lower()
+        self.voice = voice or VOICES.get(self.engine)
+        self.state = state or assistant_state
+        self.cache = audio_cache if cache is None else cache
+        self.output = audio_output if output is None else output
+        self.stock_phrases = stock_phrases
+        # Start playing edge/gtts audio after `jitter` seconds are decoded instead of after the download
+        self.streaming = streaming
+        self.jitter = jitter
+        # Groq client for the groq engine: injected, or built once on first use
+        self._client = client
+        self._client_factory = client_factory
         self.lock = asyncio.Lock()
+        self.first_audio_at = None
+        self._streaming = False
+        self._offline_worker = None
 
     def _isruning(self):
-        with open("Brain/Data/TTS_runing.orion", 'r') as f:
-            return f.read().strip().lower() == "true"
+        return self.state.speaking
 
     def _stop(self):
-        with open("Brain/Data/TTS_runing.orion", 'w') as f:
-            f.write("false")
+        self.state.stop_speaking()
 
     def _start(self):
-        with open("Brain/Data/TTS_runing.orion", 'w') as f:
-            f.write("true")
+        self.state.start_speaking()
 
     async def speak(self, text: str):
-        if self.engine == "gtts":
-            await self._speak_gtts(text)
-        elif self.engine == "edge":
-            await self._speak_edge_tts(text)
-        elif self.engine == "pyttsx3":
-            await self._speak_offline(text)
-        elif self.engine == "groq":
-            self._speak_groq(text)
-        else:
+        if self.engine not in ENGINES:
             print("Unknown TTS engine.")
+            return
+        await self._play(self._start_synthesis(text))
 
-    async def _speak_edge_tts(self, text):
-        communicate = Communicate(text=text, voice="en-GB-RyanNeural")
-        audio_stream = io.BytesIO()
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_stream.write(chunk["data"])
-        audio_stream.seek(0)
-        data, samplerate = sf.read(audio_stream, dtype='int16')
-        sd.play(data, samplerate)
-        sd.wait()
-
-    async def _speak_gtts(self, text):
-        tts = gTTS(text)
-        stream = io.BytesIO()
-        tts.write_to_fp(stream)
-        stream.seek(0)
-        data, samplerate = sf.read(stream, dtype='int16')
-        sd.play(data, samplerate)
-        sd.wait()
-
-    async def _speak_offline(self, text):
+    def _start_synthesis(self, text):
+        """Start synthesizing text; returns a DecodedStream for streaming engines,
+        otherwise a future of (samples, samplerate)."""
+        key = self.cache.key(self.engine, self.voice, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            done = asyncio.get_running_loop().create_future()
+            done.set_result(cached)
+            return done
+        if self.streaming and self.engine in STREAMING:
+            mp3 = getattr(self, STREAMING[self.engine])(text)
+            started, turn = time.perf_counter(), tracer.current_turn()
+
+            def on_complete(data, rate):
+                tracer.record("tts.synthesis", time.perf_counter() - started, turn, engine=self.engine, streamed=True)
+                self.cache.set(key, data, rate)
+            return DecodedStream(mp3, self.jitter, on_complete=on_complete)
+        return asyncio.ensure_future(self._synthesize_into_cache(key, text))
+
+    async def synthesize(self, text: str):
+        """Return (samples, samplerate) for text, from the cache when possible."""
+        key = self.cache.key(self.engine, self.voice, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        return await self._synthesize_into_cache(key, text)
+
+    async def _synthesize_into_cache(self, key, text):
+        with tracer.span("tts.synthesis", engine=self.engine):
+            data, samplerate = await getattr(self, ENGINES[self.engine][0])(text)
+        self.cache.set(key, data, samplerate)
+        return data, samplerate
+
+    async def warm_cache(self, phrases=None):
+        """Synthesize the stock phrases that aren't cached yet, so they play instantly."""
+        if self.engine not in ENGINES:
+            return
+        for phrase in self.stock_phrases if phrases is None else phrases:
+            try:
+                await self.synthesize(phrase)
+            except Exception as e:
+                print(f"⚠️ Could not pre-synthesize {phrase!r}: {e}")
+
+    @property
+    def offline_worker(self):
+        if self._offline_worker is None:
+            self._offline_worker = Pyttsx3Worker()
+        return self._offline_worker
+
+    async def speak_stream(self, sentences: asyncio.Queue):
+        """Speak sentences from a queue as they arrive; None ends the stream.
+
+        The next sentence is synthesized while the current one plays.
+        """
+        self.first_audio_at = None
         self.stop()
         self._start()
-        engine = pyttsx3.init()
-        path = "Brain/Data/audio.wav"
-        engine.save_to_file(text, path)
-        engine.runAndWait()
-        await asyncio.sleep(0.2)
+        self._streaming = True
+        pending = asyncio.Queue(maxsize=1)
+
+        async def synthesize_ahead():
+            while True:
+                sentence = await sentences.get()
+                if sentence is None:
+                    await pending.put(None)
+                    return
+                await pending.put(self._start_synthesis(sentence))
+
+        feeder = asyncio.create_task(synthesize_ahead())
         try:
-            data, samplerate = sf.read(path, dtype='float32')
-            sd.play(data, samplerate)
-            while sd.get_stream().active:
-                await asyncio.sleep(0.1)
+            if self.engine not in ENGINES:
+                print("Unknown TTS engine.")
+                return
+            while True:
+                synthesis = await pending.get()
+                if synthesis is None:
+                    break
+                if not self._isruning():
+                    synthesis.cancel()
+                    print("🛑 Stream interrupted, skipping the rest of the reply.")
+                    break
+                await self._play(synthesis)
         finally:
+            feeder.cancel()
+            while not pending.empty():
+                synthesis = pending.get_nowait()
+                if synthesis is not None:
+                    synthesis.cancel()
+            self._streaming = False
             self._stop()
 
+    def _mark_audio_start(self):
+        if self.first_audio_at is None:
+            self.first_audio_at = time.time()
+
+    async def _play(self, synthesis):
+        if not self._streaming:
+            self.stop()
+            self._start()
+        try:
+            if isinstance(synthesis, DecodedStream):
+                with tracer.span("tts.playback", streamed=True):
+                    return await self._play_stream(synthesis)
+            data, samplerate = await synthesis
+            if not self._isruning():
+                return  # 🔹 Barge-in while the sentence was synthesizing
+            self._mark_audio_start()
+            with tracer.span("tts.playback"):
+                await self._play_pcm(data, samplerate)
+        finally:
+            if not self._streaming:
+                self._stop()
+
+    async def _play_stream(self, stream):
+        """Queue decoded chunks on the output as they arrive, then wait for the last one."""
+        segments = []
+        try:
+            async for pcm in stream.chunks():
+                if not self._isruning():
+                    stream.cancel()
+                    return False
+                self._mark_audio_start()
+                segments.append(self.output.enqueue(pcm, stream.samplerate))
+            if not segments:
+                return True
+            return await asyncio.wrap_future(segments[-1].future)
+        except asyncio.CancelledError:
+            stream.cancel()
+            for segment in segments:
+                self.output.cancel(segment)
+            raise
+
+    async def _play_pcm(self, data, samplerate):
+        return await self.output.play(data, samplerate)
+
     def stop(self):
         try:
-            sd.stop()
+            self.output.cancel()
             self._stop()
         except Exception as e:
             print(f"⚠️ Stop failed: {e}")
 
-    def _speak_groq(self, text):
-        client = Groq(api_key=groq_api)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-            path = temp_audio.name
-            temp_audio.write(
-                client.audio.speech.create(
-                    model="playai-tts",
-                    voice="Atlas-PlayAI",
-                    response_format="wav",
-                    input=text,
-                ).read()
+    async def _synthesize_edge_tts(self, text):
+        return await decode_mp3(self._mp3_edge_tts(text))
+
+    async def _mp3_edge_tts(self, text):
+        communicate = edge_tts.Communicate(text=text, voice=self.voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+    async def _synthesize_gtts(self, text):
+        return await decode_mp3(self._mp3_gtts(text))
+
+    async def _mp3_gtts(self, text):
+        # gTTS.stream() is a blocking generator (one request per ~100 characters)
+        parts = gtts.gTTS(text, lang=self.voice).stream()
+        while (part := await asyncio.to_thread(next, parts, None)) is not None:
+            yield part
+
+    async def _synthesize_offline(self, text):
+        return await asyncio.wrap_future(self.offline_worker.submit(text))
+
+    def _groq_client(self):
+        if self._client is None:
+            if self._client_factory is not None:
+                self._client = self._client_factory()
+            elif groq_api:
+                self._client = groq.Groq(api_key=groq_api)
+            else:
+                raise ValueError("❌ GroqAPI not set")
+        return self._client
+
+    async def _synthesize_groq(self, text):
+        def synthesize():
+            response = self._groq_client().audio.speech.create(
+                model="playai-tts",
+                voice=self.voice,
+                response_format="wav",
+                input=text,
             )
-        with sf.SoundFile(path) as f:
-            sd.play(f.read(dtype='float32'), f.samplerate)
-            sd.wait()
-        os.remove(path)
+            return sf.read(io.BytesIO(response.read()), dtype='float32')
+        return await asyncio.to_thread(synthesize)
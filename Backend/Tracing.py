@@ -0,0 +1,161 @@
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from Backend.RecognitionPool import percentile_ms
+
+_turn = contextvars.ContextVar("orion_turn", default=None)
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+class _Span:
+    def __init__(self, tracer, name, turn, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.turn = turn
+        self.attrs = attrs
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer.record(self.name, time.perf_counter() - self.started, self.turn, **self.attrs)
+        return False
+
+class Transcript(str):
+    """A recognized phrase that remembers the turn it started."""
+
+    turn = None
+
+    def __new__(cls, text, turn=None):
+        transcript = super().__new__(cls, text)
+        transcript.turn = turn
+        return transcript
+
+class Tracer:
+    """Per-turn latency spans and p50/p95/p99 histograms per stage.
+
+    Disabled by default: span() then returns a shared no-op context manager,
+    so instrumented code costs next to nothing. When enabled every span is
+    tagged with the current turn ID (a context variable, so tasks and
+    to_thread calls started during a turn inherit it), its duration goes into
+    a histogram for its name and the most recent spans are kept for dump().
+    """
+
+    def __init__(self, enabled=False, path=None, max_samples=1000, recent=500):
+        self.enabled = enabled
+        self.path = path
+        self.max_samples = max_samples
+        self._samples = {}                 # name -> deque of seconds
+        self._recent = deque(maxlen=recent)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def enable(self, path=None):
+        self.enabled = True
+        self.path = path or self.path
+
+    # 🔹 Turns
+    def new_turn(self):
+        """A fresh turn ID, or None while tracing is off."""
+        return f"turn-{next(self._ids)}" if self.enabled else None
+
+    def start_turn(self, turn=None):
+        """Make turn (or a new one) the current turn of this task; returns it."""
+        if not self.enabled:
+            return None
+        turn = turn or self.new_turn()
+        _turn.set(turn)
+        return turn
+
+    @staticmethod
+    def current_turn():
+        return _turn.get()
+
+    # 🔹 Spans
+    def span(self, name, turn=None, **attrs):
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name, turn or _turn.get(), attrs)
+
+    def record(self, name, seconds, turn=None, **attrs):
+        """Add a span measured elsewhere (e.g. the length of a captured phrase)."""
+        if not self.enabled:
+            return
+        span = {"turn": turn or _turn.get(), "name": name, "ms": round(seconds * 1000, 3),
+                "at": round(time.time(), 3), **attrs}
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            self._recent.append(span)
+
+    # 🔹 Reports
+    def histograms(self):
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+        return {
+            name: {
+                "count": len(values),
+                "p50_ms": percentile_ms(values, 50),
+                "p95_ms": percentile_ms(values, 95),
+                "p99_ms": percentile_ms(values, 99),
+                "max_ms": values[-1] * 1000,
+            }
+            for name, values in sorted(samples.items())
+        }
+
+    def spans(self, turn=None):
+        with self._lock:
+            return [dict(s) for s in self._recent if turn is None or s["turn"] == turn]
+
+    def snapshot(self):
+        return {"generated_at": time.time(), "histograms": self.histograms(), "recent_spans": self.spans()}
+
+    def dump(self, path=None):
+        """Write the histograms and recent spans as JSON to path (atomically)."""
+        path = path or self.path
+        if not path:
+            return None
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, indent=1)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Trace dump failed: {e}")
+            return None
+        return path
+
+    async def push(self, url, session=None):
+        """POST the snapshot as JSON to a collector endpoint."""
+        if session is None:
+            from Backend.HTTPClient import http_client
+            session = await http_client.session()
+        async with session.post(url, json=self.snapshot()) as response:
+            return response.status
+
+    def report(self):
+        for name, h in self.histograms().items():
+            print(f"⏱️ {name:<18} n={h['count']:<4} p50 {h['p50_ms']:8.1f} ms   "
+                  f"p95 {h['p95_ms']:8.1f} ms   p99 {h['p99_ms']:8.1f} ms")
+
+# Shared by every component in this process; main.py --profile turns it on
+tracer = Tracer()
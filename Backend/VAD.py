@@ -0,0 +1,95 @@
+import threading
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+sr = LazyModule("speech_recognition")
+
+class VoiceActivityDetector:
+    """Drops captured phrases that contain no speech and trims silence off the rest.
+
+    Works on the raw 16-bit buffer of an sr.AudioData through np.frombuffer,
+    split into frames with a reshape (a view, not a copy). A frame counts as
+    speech when it is well above the running noise floor, most of its energy
+    is in the voice band, its spectrum isn't flat like hiss and it doesn't
+    flip sign like broadband clicks. The noise floor follows the quietest
+    frames of every phrase, since the listener always records some lead-in.
+    """
+
+    def __init__(self, frame_ms=20, min_speech_ms=200, pad_ms=150, energy_ratio=3.0, min_rms=60.0,
+                 min_band_ratio=0.6, max_flatness=0.45, max_zcr=0.35, adapt=0.2, band=(80, 4000)):
+        self.frame_ms = frame_ms
+        self.min_speech_ms = min_speech_ms
+        self.pad_ms = pad_ms
+        self.energy_ratio = energy_ratio
+        self.min_rms = min_rms
+        self.min_band_ratio = min_band_ratio
+        self.max_flatness = max_flatness
+        self.max_zcr = max_zcr
+        self.adapt = adapt
+        self.band = band
+        self.noise_floor = None
+        self._lock = threading.Lock()
+        # 🔹 Counters
+        self.accepted = 0
+        self.rejected = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def features(self, samples, sample_rate):
+        """Per-frame (rms, zero-crossing rate, voice-band energy ratio, spectral flatness)."""
+        n = max(1, sample_rate * self.frame_ms // 1000)
+        count = len(samples) // n
+        frames = samples[:count * n].reshape(count, n)
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames, dtype=np.int64) / n)
+        zcr = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1) / n
+        power = np.abs(np.fft.rfft(frames * np.hanning(n).astype('float32'), axis=1)) ** 2 + 1e-9
+        freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+        in_band = (freqs >= self.band[0]) & (freqs <= self.band[1])
+        band_ratio = power[:, in_band].sum(axis=1) / power.sum(axis=1)
+        flatness = np.exp(np.log(power).mean(axis=1)) / power.mean(axis=1)
+        return rms, zcr, band_ratio, flatness
+
+    def speech_frames(self, samples, sample_rate):
+        rms, zcr, band_ratio, flatness = self.features(samples, sample_rate)
+        if not len(rms):
+            return rms.astype(bool)
+        quiet = float(np.percentile(rms, 20))
+        with self._lock:
+            floor = quiet if self.noise_floor is None else self.noise_floor
+            loud = rms > max(floor * self.energy_ratio, self.min_rms)
+            speech = loud & (band_ratio >= self.min_band_ratio) & (flatness <= self.max_flatness) & (zcr <= self.max_zcr)
+            # 🔹 Adapt towards the quiet part of this phrase; speech never drags the floor up
+            self.noise_floor = floor + self.adapt * (min(quiet, max(floor, self.min_rms) * self.energy_ratio) - floor)
+        return speech
+
+    def process(self, audio):
+        """Return the phrase trimmed to its speech, or None if it holds no speech."""
+        data = audio.frame_data if audio.sample_width == 2 else audio.get_raw_data(convert_width=2)
+        samples = np.frombuffer(data, dtype='<i2')
+        speech = self.speech_frames(samples, audio.sample_rate)
+        frame_bytes = max(1, audio.sample_rate * self.frame_ms // 1000) * 2
+        self.bytes_in += len(data)
+        if np.count_nonzero(speech) * self.frame_ms < self.min_speech_ms:
+            self.rejected += 1
+            return None
+        pad = self.pad_ms // self.frame_ms
+        voiced = np.flatnonzero(speech)
+        start = max(0, voiced[0] - pad) * frame_bytes
+        end = min(len(speech), voiced[-1] + 1 + pad) * frame_bytes
+        if voiced[-1] + 1 + pad >= len(speech):
+            end = len(data)  # 🔹 Keep the partial frame at the end
+        self.accepted += 1
+        self.bytes_out += end - start
+        return sr.AudioData(data[start:end], audio.sample_rate, 2)
+
+    def stats(self):
+        total = self.accepted + self.rejected
+        return {
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "reject_rate": self.rejected / total if total else 0.0,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "bytes_saved": self.bytes_in - self.bytes_out,
+            "noise_floor": self.noise_floor,
+        }
@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+from Backend.Lazy import LazyModule
+
+np = LazyModule("numpy")
+sf = LazyModule("soundfile")
+sr = LazyModule("speech_recognition")
+
+WAKEWORD_DIR = os.path.join('Brain', 'Data', 'wakeword')
+
+class WakeWordDetector:
+    """Matches captured phrases against recorded wake words ("hey orion") on the CPU.
+
+    Each WAV in `directory` is a template. A phrase is turned into MFCCs
+    (NumPy only) and compared to every template with dynamic time warping;
+    the wake word is detected when the best length-normalized distance is
+    under `threshold`. Phrases much shorter or longer than every template are
+    rejected without running DTW. With no templates `available` is False and
+    the listener falls back to cloud recognition while asleep.
+    """
+
+    def __init__(self, directory=WAKEWORD_DIR, threshold=0.24, sample_rate=16000, frame_ms=25, hop_ms=10,
+                 n_mels=26, n_mfcc=13, max_stretch=1.6):
+        self.directory = directory
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.frame = sample_rate * frame_ms // 1000
+        self.hop = sample_rate * hop_ms // 1000
+        self.n_fft = 1 << (self.frame - 1).bit_length()
+        self.n_mels = n_mels
+        self.n_mfcc = n_mfcc
+        self.max_stretch = max_stretch
+        self.templates = None
+        self._filters = None
+        self._dct = None
+        self._lock = threading.Lock()
+        # 🔹 Counters
+        self.checked = 0
+        self.detected = 0
+        self.last_distance = None
+        self.last_ms = 0.0
+
+    @property
+    def available(self):
+        return bool(self._templates())
+
+    @property
+    def requests_avoided(self):
+        """Phrases heard while asleep that were never sent to cloud STT."""
+        return self.checked
+
+    def _templates(self):
+        if self.templates is None:
+            with self._lock:
+                if self.templates is None:
+                    self.templates = self._load_templates()
+        return self.templates
+
+    def _load_templates(self):
+        templates = []
+        if not os.path.isdir(self.directory):
+            return templates
+        for name in sorted(os.listdir(self.directory)):
+            if not name.lower().endswith('.wav'):
+                continue
+            try:
+                data, rate = sf.read(os.path.join(self.directory, name), dtype='float32', always_2d=True)
+            except Exception as e:
+                print(f"⚠️ Skipping wake word template {name}: {e}")
+                continue
+            template = self.features(data.mean(axis=1), rate)
+            if not len(template):
+                print(f"⚠️ Skipping wake word template {name}: no speech in it")
+                continue
+            templates.append(template)
+        if templates:
+            print(f"👂 Loaded {len(templates)} wake word template(s).")
+        return templates
+
+    def enroll(self, audio):
+        """Save a captured sr.AudioData as a new template."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"wake-{int(time.time() * 1000)}.wav")
+        with open(path, 'wb') as f:
+            f.write(audio.get_wav_data(convert_rate=self.sample_rate, convert_width=2))
+        samples = np.frombuffer(audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2), dtype='<i2')
+        template = self.features(samples / 32768.0, self.sample_rate)
+        with self._lock:
+            self.templates = (self.templates or []) + [template]
+        return path
+
+    # 🔹 Features
+    def _mel_filters(self):
+        if self._filters is None:
+            def to_mel(hz):
+                return 2595.0 * np.log10(1.0 + hz / 700.0)
+            mels = np.linspace(to_mel(60.0), to_mel(self.sample_rate / 2), self.n_mels + 2)
+            bins = np.floor((self.n_fft + 1) * 700.0 * (10 ** (mels / 2595.0) - 1) / self.sample_rate).astype(int)
+            filters = np.zeros((self.n_mels, self.n_fft // 2 + 1), dtype='float32')
+            for m in range(1, self.n_mels + 1):
+                left, center, right = bins[m - 1], bins[m], bins[m + 1]
+                if center > left:
+                    filters[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+                if right > center:
+                    filters[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+            k = np.arange(self.n_mels)
+            self._dct = np.cos(np.pi / self.n_mels * (k + 0.5)[None, :] * np.arange(1, self.n_mfcc + 1)[:, None])
+            self._filters = filters
+        return self._filters
+
+    def features(self, samples, sample_rate):
+        """MFCCs (without c0) of the voiced part of a float signal, one row per 10 ms hop."""
+        samples = np.asarray(samples, dtype='float32')
+        if sample_rate != self.sample_rate and len(samples):
+            n = int(round(len(samples) * self.sample_rate / sample_rate))
+            samples = np.interp(np.linspace(0, len(samples) - 1, n), np.arange(len(samples)), samples).astype('float32')
+        if len(samples) < self.frame:
+            return np.zeros((0, self.n_mfcc), dtype='float32')
+        samples = np.append(samples[0], samples[1:] - 0.97 * samples[:-1])
+        count = 1 + (len(samples) - self.frame) // self.hop
+        frames = np.lib.stride_tricks.as_strided(
+            samples, shape=(count, self.frame), strides=(samples.strides[0] * self.hop, samples.strides[0]),
+        )
+        power = np.abs(np.fft.rfft(frames * np.hamming(self.frame).astype('float32'), n=self.n_fft, axis=1)) ** 2
+        energy = power.sum(axis=1)
+        # 🔹 Keep the frames around the voiced part so lead-in silence doesn't dominate the match
+        floor = np.percentile(energy, 10)
+        voiced = np.flatnonzero(energy > min(max(energy.max() * 1e-3, floor * 10), energy.max() * 0.5))
+        if not voiced.size:
+            return np.zeros((0, self.n_mfcc), dtype='float32')  # 🔹 Digital silence (muted mic, padding): no match
+        power = power[voiced[0]:voiced[-1] + 1]
+        mfcc = np.log(power @ self._mel_filters().T + 1e-10) @ self._dct.T
+        mfcc -= mfcc.mean(axis=0)
+        return (mfcc / (np.linalg.norm(mfcc, axis=1, keepdims=True) + 1e-9)).astype('float32')
+
+    # 🔹 Matching
+    def distance(self, a, b):
+        """DTW distance between two MFCC sequences, divided by the path length bound."""
+        if not len(a) or not len(b):
+            return float('inf')
+        ratio = len(a) / len(b)
+        if ratio > self.max_stretch or ratio < 1 / self.max_stretch:
+            return float('inf')
+        cost = 1.0 - a @ b.T  # rows are unit vectors, so this is the cosine distance
+        inf = float('inf')
+        prev = np.full(len(b) + 1, inf)
+        prev[0] = 0.0
+        for i in range(len(a)):
+            diagonal = np.minimum(prev[:-1], prev[1:]) + cost[i]  # from (i-1, j-1) or (i-1, j)
+            row = [inf]
+            for value, step in zip(diagonal.tolist(), cost[i].tolist()):
+                row.append(min(value, row[-1] + step))  # or from (i, j-1)
+            prev = np.array(row)
+        return float(prev[-1]) / (len(a) + len(b))
+
+    def score(self, audio):
+        """Best distance of a captured sr.AudioData to any template."""
+        samples = np.frombuffer(audio.get_raw_data(convert_width=2), dtype='<i2') / 32768.0
+        sequence = self.features(samples, audio.sample_rate)
+        return min((self.distance(sequence, t) for t in self._templates()), default=float('inf'))
+
+    def detect(self, audio):
+        start = time.perf_counter()
+        distance = self.score(audio)
+        found = distance < self.threshold
+        with self._lock:
+            self.checked += 1
+            self.detected += found
+            self.last_distance = distance
+            self.last_ms = (time.perf_counter() - start) * 1000
+        return found
+
+    def stats(self):
+        return {
+            "templates": len(self._templates()),
+            "checked": self.checked,
+            "detected": self.detected,
+            "requests_avoided": self.requests_avoided,
+            "last_distance": self.last_distance,
+            "last_ms": self.last_ms,
+        }
+
+if __name__ == "__main__":
+    # 🔹 Record wake word templates: python -m Backend.WakeWord [count]
+    import sys
+    detector = WakeWordDetector()
+    recognizer = sr.Recognizer()
+    with sr.Microphone(sample_rate=detector.sample_rate) as source:
+        recognizer.adjust_for_ambient_noise(source)
+        for i in range(int(sys.argv[1]) if len(sys.argv) > 1 else 3):
+            print(f"🎙️ Say \"hey Orion\" ({i + 1})...")
+            print(f"✅ Saved {detector.enroll(recognizer.listen(source, phrase_time_limit=3))}")
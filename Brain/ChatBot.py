@@ -1,119 +1,108 @@
-from dotenv import load_dotenv
-import os
 import asyncio
 import time
-import json
-from groq import Groq
 from Backend import TTS
-from Backend.RealtimeData import RealTimeInformation
+from Brain.LLM import LLMCancelled
+from Brain.Prompt import PromptBuilder, search_snippets
+from Brain.Services import Services
+from Backend.Tracing import tracer
 
-# Load environment variables from .env
-load_dotenv(dotenv_path='../.env')
+GROUNDED_INSTRUCTIONS = (
+    "Answer the query using the information above where it helps. Keep it short and well structured, "
+    "combine sources, and mention conflicting or insufficient information. If you don't know, say 'I don't know'."
+)
 
 class Chatbot:
-    def __init__(self):
-        # 1) Load Groq API key
-        self.groq_api = os.getenv('GroqAPI')
-        if not self.groq_api:
-            raise ValueError("❌ GroqAPI environment variable is not set in .env file.")
-
-        # 2) Initialize client & TTS
-        self.client = Groq(api_key=self.groq_api)
-        self.tts    = TTS.OrionTTS(engine="pyttsx3")  # You can switch to 'gtts' or 'edge'
-        self.realtime_info = RealTimeInformation()
-
-        # 3) Path to your existing JSON (with manual system prompt already inside)
-        self.db_file = os.path.join('Brain', 'Data', 'ChatHistory.json')
-        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
-        if not os.path.exists(self.db_file):
-            # If file doesn't exist, create it as empty array.
-            with open(self.db_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, ensure_ascii=False, indent=4)
-
-    async def handle_query(self, query, contexts:list = ["General"]):
+    def __init__(self, services=None, stream=True):
+        services = services or Services()
+
+        # 1) Shared client, TTS and realtime data (the engine is chosen in Services)
+        self.llm    = services.llm
+        self.tts    = services.tts
+        self.realtime_info = services.realtime_info
+        self.stream = stream  # Speak the reply sentence-by-sentence while it is generated
+
+        # 2) Append-only history (migrates the old ChatHistory.json with its system prompt once)
+        self.history = services.history
+        self.config = services.config
+
+        # 3) Every request is assembled under one token budget (set "prompt_budget" in orionconfig.json)
+        self.prompt = PromptBuilder(budget=self.config.get("prompt_budget", 3000))
+
+    async def handle_query(self, query, contexts:list = ["General"], search_results=()):
         if not query:
             print("❌ Empty query received. Please provide a valid input.")
             return "❌ Empty query received. Please provide a valid input."
         print(f"🗣️ User: {query}")
-        response = ""
-        for context in contexts:
-            if context.lower() == "weather":
-                response += "\n" + await self.realtime_info.get_detailed_weather()
-            elif context.lower() == "time":
-                response += "\n" + await self.realtime_info.get_time_info()
-            elif context.lower() == "location":
-                response += "\n" + await self.realtime_info.get_location_info()
-            elif context.lower() == "search":
-                # Search context is handled separately by the Search function
-                pass
-            elif context.lower() == "general":
-                pass  # General context, no action needed
-
-        if response:
-            query = f"""This realtime information from web and other ways of getting information is not always accurate, so please verify it with other sources if you can. Here are the results: 
----
-{response}
---- 
-This is users query: {query}
----
-Please analyze this information carefully and provide a comprehensive, well-structured response that directly addresses the user's query. Synthesize the information from multiple sources when available, highlight key points, and present a balanced view if there are conflicting perspectives. If the information is insufficient or irrelevant, acknowledge this limitation in your response. If you don't know the answer, just say 'I don't know'."""
-
-        reply = await self.process_query(query)
+        fetchers = {
+            "weather": self.realtime_info.get_detailed_weather,
+            "time": self.realtime_info.get_time_info,
+            "location": self.realtime_info.get_location_info,
+            # "search" is handled separately by the Search function, "general" needs nothing
+        }
+        # 🔹 Fetch every requested context at once, keep the order they were asked in
+        wanted = list(dict.fromkeys(c.lower() for c in contexts if c.lower() in fetchers))
+        fetched = await asyncio.gather(*(fetchers[c]() for c in wanted), return_exceptions=True)
+        realtime = []
+        for context, info in zip(wanted, fetched):
+            if isinstance(info, BaseException):
+                info = f"❌ Could not fetch {context}: {info}"
+            realtime.append(info)
+
+        snippets = [snippet for result in search_results for snippet in search_snippets(result)]
+        reply = await self.process_query(query, "\n".join(realtime), snippets)
         return reply
 
-    @staticmethod
-    def load_chat_history_trimmed(filepath, user_query, max_history=6):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            history = json.load(f)
-        
-        with open(os.path.join('Brain', 'Data', 'orionconfig.json'), 'r', encoding='utf-8') as f:
-            config = json.load(f)
-
-        # 🔹 Separate the system prompt from the rest
-        system_prompt = [msg for msg in history if msg["role"] == "system"]
-        system_prompt[0]['content'].replace("{user}", config['user'])
-        conversation = [msg for msg in history if msg["role"] != "system"]
-
-        # 🔹 Trim conversation to the last N entries (user + assistant messages)
-        trimmed = conversation[-max_history:]
-
-        # 🔹 Append current user query
-        trimmed.append({"role": "user", "content": user_query})
-
-        # 🔹 Combine: system prompt + trimmed history + new query
-        return system_prompt + trimmed
-
-    async def process_query(self, query):
+    def build_messages(self, user_query, context="", snippets=(), max_history=20):
+        # 🔹 System prompt with the user's name filled in
+        system_prompt = self.history.system_messages()
+        for msg in system_prompt:
+            msg['content'] = msg['content'].replace("{user}", self.config.get('user', 'User'))
+
+        # 🔹 Recent history, context and search snippets share the token budget
+        instructions = GROUNDED_INSTRUCTIONS if context or snippets else ""
+        messages, report = self.prompt.build(
+            system_prompt, self.history.tail(max_history), user_query, context, snippets, instructions,
+        )
+        print(
+            f"🧮 Prompt ~{report['total']} tokens (system {report['system']}, history {report['history']}, "
+            f"realtime {report['context']}, search {report['search']}) of {report['budget']}"
+        )
+        return messages
+
+    async def process_query(self, query, context="", snippets=()):
         try:
             start = time.time()
 
-            # Load the entire history (including your manual system prompt)
-            with open(self.db_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-
-            # Build messages: history + current user message
-            messages = self.load_chat_history_trimmed(self.db_file, query)
+            # Build messages: system prompt + recent history + context + current user message
+            messages = self.build_messages(query, context, snippets)
 
             # Ask the model
-            resp = self.client.chat.completions.create(
-                model="llama3-70b-8192",
-                messages=messages,
-                temperature=0.84,
-                top_p=1,
-                stream=False,
-            )
-            reply = resp.choices[0].message.content.strip()
-
-            elapsed = time.time() - start
-            print(f"⏱️ Processed in {elapsed:.2f}s")
-            print(f"🤖 Orion: {reply}")
-            await self.tts.speak(reply)
+            if self.stream:
+                reply = await self._stream_reply(messages, start)
+            else:
+                with tracer.span("answer.llm"):
+                    resp = await self.llm.complete(
+                        model="llama3-70b-8192",
+                        messages=messages,
+                        temperature=0.84,
+                        top_p=1,
+                        stream=False,
+                    )
+                reply = resp.choices[0].message.content.strip()
+
+                elapsed = time.time() - start
+                print(f"⏱️ Processed in {elapsed:.2f}s")
+                print(f"🤖 Orion: {reply}")
+                await self.tts.speak(reply)
 
             # Append both user + assistant in one shot
             self._log_to_json("user", query, "assistant", reply)
             
             return reply
 
+        except LLMCancelled:
+            print("🛑 Answer request cancelled.")
+            return "🛑 Request cancelled."
         except Exception as e:
             err = f"❌ Error while processing query: {e}"
             print(err)
@@ -123,29 +112,59 @@ Please analyze this information carefully and provide a comprehensive, well-stru
             
             return err
 
+    async def _stream_reply(self, messages, start):
+        """Stream the answer and hand each finished sentence to TTS right away."""
+        sentences = asyncio.Queue()
+        speaker = asyncio.create_task(self.tts.speak_stream(sentences))
+        splitter = TTS.SentenceSplitter()
+        parts = []
+        first_token = None
+
+        try:
+            with tracer.span("answer.llm", streamed=True):
+                async for delta in self.llm.stream(
+                    model="llama3-70b-8192",
+                    messages=messages,
+                    temperature=0.84,
+                    top_p=1,
+                ):
+                    if first_token is None:
+                        first_token = time.time() - start
+                        print(f"⏱️ First token in {first_token:.2f}s")
+                        tracer.record("answer.first_token", first_token)
+                    parts.append(delta)
+                    for sentence in splitter.feed(delta):
+                        sentences.put_nowait(sentence)
+            tail = splitter.flush()
+            if tail:
+                sentences.put_nowait(tail)
+            sentences.put_nowait(None)
+        except BaseException:
+            speaker.cancel()
+            self.tts.stop()
+            raise
+
+        reply = "".join(parts).strip()
+        print(f"⏱️ Processed in {time.time() - start:.2f}s")
+        print(f"🤖 Orion: {reply}")
+        await speaker
+        if self.tts.first_audio_at is not None:
+            print(f"🔊 First audio in {self.tts.first_audio_at - start:.2f}s")
+        return reply
+
+    def cancel(self):
+        self.llm.cancel()
+
     def _log_to_json(self, role, content, assistant_role=None, assistant_content=None):
         try:
-            with open(self.db_file, 'r+', encoding='utf-8') as f:
-                try:
-                    data = json.load(f)
-                except json.JSONDecodeError:
-                    data = []
-
-                # 🔹 Remove system messages from re-logging
-                if role == "system":
-                    return
-
-                # 🔹 Append current messages
-                entries = [{"role": role, "content": content}]
-                if assistant_role and assistant_content:
-                    entries.append({"role": assistant_role, "content": assistant_content})
-
-                # 🔹 Avoid re-adding system messages
-                data += entries
-
-                f.seek(0)
-                json.dump(data, f, indent=4, ensure_ascii=False)
-                f.truncate()
+            # 🔹 Never re-log system messages
+            if role == "system":
+                return
+
+            entries = [{"role": role, "content": content}]
+            if assistant_role and assistant_content:
+                entries.append({"role": assistant_role, "content": assistant_content})
+            self.history.append(*entries)
 
         except Exception as e:
             print(f"❌ Failed to log chat: {e}")
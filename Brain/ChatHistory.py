@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+
+class ChatHistoryStore:
+    """Append-only JSONL chat log.
+
+    One message per line, system prompt first. Appending a turn writes only
+    the new lines, and the last N messages are read by scanning backwards
+    from the end of the file, so neither cost grows with conversation length.
+    """
+
+    def __init__(self, path=os.path.join('Brain', 'Data', 'ChatHistory.jsonl'),
+                 legacy_path=os.path.join('Brain', 'Data', 'ChatHistory.json'),
+                 block_size=8192):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._system = None
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if not os.path.exists(self.path):
+            self._migrate()
+
+    def _migrate(self):
+        """One-time conversion of the old ChatHistory.json array."""
+        messages = []
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            try:
+                with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                    messages = json.load(f)
+            except json.JSONDecodeError as e:
+                print(f"⚠️ Could not read {self.legacy_path}, starting a fresh history: {e}")
+
+        # 🔹 System prompt goes first so it can be read without a full scan
+        messages = [m for m in messages if m.get("role") == "system"] + \
+                   [m for m in messages if m.get("role") != "system"]
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for message in messages:
+                f.write(json.dumps(message, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        if messages:
+            print(f"📦 Migrated {len(messages)} messages from {self.legacy_path} to {self.path}")
+
+    def system_messages(self):
+        if self._system is None:
+            system = []
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    message = json.loads(line)
+                    if message.get("role") != "system":
+                        break
+                    system.append(message)
+            self._system = system
+        return [dict(m) for m in self._system]
+
+    def tail(self, n):
+        """Return the last n non-system messages, oldest first."""
+        if n <= 0:
+            return []
+        messages = []
+        with self._lock, open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            remainder = b""
+            while position > 0 and len(messages) < n:
+                step = min(self.block_size, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + remainder).split(b"\n")
+                # The first piece may be a partial line; keep it for the next block
+                remainder = lines.pop(0) if position > 0 else b""
+                for line in reversed(lines):
+                    if line.strip():
+                        message = json.loads(line)
+                        if message.get("role") != "system":
+                            messages.append(message)
+                            if len(messages) == n:
+                                break
+        messages.reverse()
+        return messages
+
+    def append(self, *messages):
+        lines = "".join(
+            json.dumps(m, ensure_ascii=False) + "\n" for m in messages if m.get("role") != "system"
+        )
+        if not lines:
+            return
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
@@ -0,0 +1,76 @@
+import asyncio
+
+_END = object()
+
+class LLMCancelled(Exception):
+    """Raised when an in-flight completion is cancelled through AsyncLLM.cancel()."""
+
+class AsyncLLM:
+    """Async Groq chat client that never blocks the event loop.
+
+    Every request runs as its own task so it can be cancelled (for example on
+    barge-in) without cancelling the coroutine that is waiting on it.
+    """
+
+    def __init__(self, api_key, timeout=30.0, client=None):
+        if client is None:
+            from groq import AsyncGroq  # 🔹 Deferred: the SDK is slow to import
+            client = AsyncGroq(api_key=api_key, timeout=timeout)
+        self.client = client
+        self._inflight = set()
+
+    async def complete(self, **kwargs):
+        task = asyncio.ensure_future(self.client.chat.completions.create(**kwargs))
+        self._inflight.add(task)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 🔹 Our own cancel() vs. the caller being cancelled
+            if task.cancelled() and not _caller_cancelling():
+                raise LLMCancelled("LLM request cancelled") from None
+            task.cancel()
+            raise
+        finally:
+            self._inflight.discard(task)
+
+    async def stream(self, **kwargs):
+        """Yield the content deltas of a streamed completion as they arrive."""
+        deltas = asyncio.Queue()
+
+        async def pump():
+            stream = await self.client.chat.completions.create(stream=True, **kwargs)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    deltas.put_nowait(chunk.choices[0].delta.content)
+
+        task = asyncio.ensure_future(pump())
+        task.add_done_callback(lambda _: deltas.put_nowait(_END))
+        self._inflight.add(task)
+        try:
+            while True:
+                delta = await deltas.get()
+                if delta is _END:
+                    break
+                yield delta
+            if task.cancelled():
+                raise LLMCancelled("LLM stream cancelled")
+            task.result()  # 🔹 Re-raise API errors from the pump
+        finally:
+            task.cancel()
+            self._inflight.discard(task)
+
+    @property
+    def busy(self):
+        return bool(self._inflight)
+
+    def cancel(self):
+        """Cancel every in-flight request. Must be called from the event loop thread."""
+        for task in list(self._inflight):
+            task.cancel()
+
+    def cancel_threadsafe(self, loop):
+        loop.call_soon_threadsafe(self.cancel)
+
+def _caller_cancelling():
+    current = asyncio.current_task()
+    return bool(current and current.cancelling())
@@ -0,0 +1,184 @@
+import math
+import re
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_WORDS = re.compile(r"[a-z0-9]+")
+_SENTENCES = re.compile(r"(?<=[.!?])\s+|\n+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how i in is it me my of on or the this to was what when where "
+    "which who why will with you your about tell please can do does".split()
+)
+
+def estimate_tokens(text):
+    """Rough BPE token count without a tokenizer: a token per short word or symbol, more for long words."""
+    if not text:
+        return 0
+    return sum(1 + len(piece) // 6 for piece in _PIECES.findall(text))
+
+def message_tokens(messages):
+    # Chat formats add a few tokens of framing per message
+    return sum(4 + estimate_tokens(m.get("content") or "") for m in messages) + 2
+
+def keywords(text):
+    return [w for w in _WORDS.findall(text.lower()) if w not in _STOPWORDS]
+
+def truncate(text, max_tokens):
+    """Cut text to at most max_tokens, at a word boundary."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    used, end = 0, 0
+    for match in _PIECES.finditer(text):
+        cost = 1 + len(match.group()) // 6
+        if used + cost > max_tokens - 1:
+            break
+        used += cost
+        end = match.end()
+    return text[:end].rstrip() + "…" if end else ""
+
+def search_snippets(result):
+    """Split a RealtimeData.perform_search result into (source, text) snippets.
+
+    Pages without a usable summary are left out; text that isn't in the
+    search result format (errors, other tools) is kept as one snippet.
+    """
+    snippets = []
+    for block in re.split(r"\n\s*\n", result or ""):
+        block = block.strip()
+        if not block or block.startswith("🔍 Search Results for"):
+            continue
+        link = re.match(r"🔗 (\S+)\n📜 (.*)", block, re.S)
+        if link:
+            if link.group(2).strip() != "Summary not available":
+                snippets.append((link.group(1), link.group(2).strip()))
+        elif block.startswith("📘 Wikipedia Summary:"):
+            snippets.append(("Wikipedia", block.split("\n", 1)[-1].strip()))
+        else:
+            snippets.append((None, block))
+    return snippets
+
+class PromptBuilder:
+    """Assembles Chatbot requests under a fixed token budget.
+
+    The system prompt and the user's query always go in. What is left after
+    reserving room for the reply is shared between realtime context (up to
+    context_share), recent history (up to history_share, whole messages,
+    newest first) and search snippets, which get the rest. Snippets are cut
+    into sentences, near-duplicates are dropped and the sentences that share
+    the most words with the query are kept; they are put back in source order.
+    Only the first max_sentences sentences of each snippet are considered.
+    """
+
+    def __init__(self, budget=3000, reply_tokens=512, context_share=0.25, history_share=0.35, duplicate=0.8,
+                 max_sentences=40):
+        self.budget = budget
+        self.reply_tokens = reply_tokens
+        self.context_share = context_share
+        self.history_share = history_share
+        self.duplicate = duplicate
+        self.max_sentences = max_sentences  # per snippet; page summaries rarely need more
+        self.last = None
+        # 🔹 Counters
+        self.requests = 0
+        self.total_tokens = 0
+        self.max_tokens = 0
+
+    def build(self, system, history, query, context="", snippets=(), instructions=""):
+        """Return (messages, report) for one request; report holds token counts per part."""
+        query_text = f"User query: {query}" if context or snippets else query
+        if instructions:
+            query_text += f"\n\n{instructions}"
+        fixed = message_tokens(system) + estimate_tokens(query_text) + 6 + 20  # + user message framing and headers
+        available = max(0, self.budget - self.reply_tokens - fixed)
+
+        context = truncate(context.strip(), int(available * self.context_share)) if context else ""
+        context_tokens = estimate_tokens(context)
+        history_cap = available - context_tokens
+        if snippets:
+            history_cap = min(history_cap, int(available * self.history_share))
+        kept_history = self._fit_history(history, history_cap)
+        history_tokens = message_tokens(kept_history) - 2 if kept_history else 0
+        search, selection = self.select(query, snippets, available - context_tokens - history_tokens)
+
+        sections = []
+        if context:
+            sections.append(f"Realtime information (may be inaccurate):\n{context}")
+        if search:
+            sections.append(f"Web search results (may be inaccurate):\n{search}")
+        sections.append(query_text)
+        messages = system + kept_history + [{"role": "user", "content": "\n\n".join(sections)}]
+
+        report = {
+            "total": message_tokens(messages),
+            "budget": self.budget,
+            "system": message_tokens(system) - 2,
+            "history": history_tokens,
+            "history_messages": len(kept_history),
+            "history_dropped": len(history) - len(kept_history),
+            "context": context_tokens,
+            "search": estimate_tokens(search),
+            **selection,
+        }
+        self.last = report
+        self.requests += 1
+        self.total_tokens += report["total"]
+        self.max_tokens = max(self.max_tokens, report["total"])
+        return messages, report
+
+    def _fit_history(self, history, max_tokens):
+        kept, used = [], 0
+        for message in reversed(history):
+            cost = 4 + estimate_tokens(message.get("content") or "")
+            if used + cost > max_tokens:
+                break
+            kept.append(message)
+            used += cost
+        kept.reverse()
+        # 🔹 Never start on an assistant reply whose question was dropped
+        while kept and kept[0].get("role") == "assistant":
+            kept.pop(0)
+        return kept
+
+    def select(self, query, snippets, max_tokens):
+        """Pick the most query-relevant, non-duplicate snippet sentences that fit in max_tokens."""
+        terms = set(keywords(query))
+        candidates, seen, duplicates = [], [], 0
+        for rank, (source, text) in enumerate(snippets):
+            for position, sentence in enumerate(s.strip() for s in _SENTENCES.split(text)[:self.max_sentences]):
+                words = set(keywords(sentence))
+                if not words:
+                    continue
+                if any(len(words & other) / len(words | other) >= self.duplicate for other in seen):
+                    duplicates += 1
+                    continue
+                seen.append(words)
+                # Query overlap first; earlier sentences and better-ranked sources break ties
+                score = len(terms & words) / math.sqrt(len(words)) + 0.2 / (1 + position) + 0.1 / (1 + rank)
+                candidates.append((score, rank, position, sentence))
+
+        chosen, used = [], 0
+        for score, rank, position, sentence in sorted(candidates, key=lambda c: -c[0]):
+            cost = estimate_tokens(sentence) + 1
+            if used + cost <= max_tokens:
+                chosen.append((rank, position, sentence))
+                used += cost
+
+        blocks, sources = [], {}
+        for rank, position, sentence in sorted(chosen):
+            sources.setdefault(rank, []).append(sentence)
+        for number, (rank, sentences) in enumerate(sorted(sources.items()), 1):
+            source = snippets[rank][0]
+            blocks.append(f"[{number}] {source}\n" + " ".join(sentences) if source else " ".join(sentences))
+        return "\n\n".join(blocks), {
+            "snippets": len(snippets),
+            "sentences_kept": len(chosen),
+            "sentences_dropped": len(candidates) - len(chosen),
+            "duplicates": duplicates,
+        }
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "avg_tokens": self.total_tokens / self.requests if self.requests else 0.0,
+            "max_tokens": self.max_tokens,
+            "last": self.last,
+        }
@@ -0,0 +1,110 @@
+import json
+import re
+from types import SimpleNamespace
+from Backend.Cache import TTLCache
+
+def _tool_call(name, arguments, index=0):
+    """Shape a local decision like a Groq tool call so OrionModel can dispatch it unchanged."""
+    return SimpleNamespace(
+        id=f"local{index}",
+        type="function",
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+
+class FastRouter:
+    """Pre-router for utterances that don't need the routing LLM.
+
+    Only whole-utterance matches are routed, so anything with a second
+    intent or extra detail ("weather in Lahore tomorrow") returns None and
+    falls back to the LLM.
+    """
+
+    _contractions = {
+        "what's": "what is", "whats": "what is", "how's": "how is", "hows": "how is",
+        "where's": "where is", "it's": "it is", "that's": "that is", "i'm": "i am",
+    }
+    _wake = re.compile(r"^(?:(?:hey|hi|ok|okay)\s+)?orion\s+|\s+orion$")
+    _polite = re.compile(r"^(?:please|can you|could you)\s+|\s+(?:please|now|right now)$")
+
+    _stop = re.compile(
+        r"(?:stop|stop listening|stop orion|pause|be quiet|shut up|exit|quit|mute|"
+        r"bye|goodbye|bye bye|go to sleep|that is all|that will be all)"
+    )
+    _contexts = {
+        "time": re.compile(
+            r"(?:what|tell me)(?: is)? the (?:time|date)(?: today)?|what time is it|"
+            r"what day is it(?: today)?|what is today s date|what is the date today"
+        ),
+        "weather": re.compile(
+            r"(?:what|how) is the weather(?: like)?(?: today| outside)?|(?:tell me the )?weather(?: today)?|"
+            r"(?:what|how) is the temperature(?: outside| today)?|how (?:hot|cold) is it(?: outside| today)?|"
+            r"is it (?:hot|cold|raining) outside"
+        ),
+        "location": re.compile(
+            r"where am i(?: right now)?|what is my (?:current )?location|(?:which|what) city am i in|"
+            r"what city is this|tell me my location"
+        ),
+    }
+
+    def normalize(self, text):
+        text = text.lower().replace("’", "'")
+        text = re.sub(r"[^\w\s']", " ", text)
+        words = [self._contractions.get(w, w) for w in text.split()]
+        text = " ".join(words).replace("'", " ")
+        text = re.sub(r"\s+", " ", text).strip()
+        for pattern in (self._wake, self._polite):
+            text = pattern.sub("", text).strip()
+        return text
+
+    def route(self, user_input):
+        """Return tool calls for a high-confidence intent, or None to ask the LLM."""
+        text = self.normalize(user_input)
+        if not text:
+            return None
+        if self._stop.fullmatch(text):
+            return [_tool_call("Stop", {})]
+        for context, pattern in self._contexts.items():
+            if pattern.fullmatch(text):
+                return [_tool_call("Chatbot", {"query": user_input, "contexts": [context]})]
+        return None
+
+class RouteCache:
+    """LRU cache of routing decisions, keyed on the normalized utterance.
+
+    Stores the tool-call plan the routing LLM chose and replays it for the
+    same utterance ("What's the weather?" and "whats the weather" share an
+    entry), so repeats skip the routing call. A "query" argument that was
+    the user's own words is filled in with the new wording on replay.
+    """
+
+    def __init__(self, normalize=None, maxsize=256, ttl=24 * 3600):
+        self.normalize = normalize or FastRouter().normalize
+        self.cache = TTLCache(ttl, maxsize)
+
+    def get(self, user_input):
+        key = self.normalize(user_input)
+        plan = self.cache.get(key) if key else None
+        if plan is None:
+            return None
+        return [
+            _tool_call(name, {**arguments, "query": user_input} if own_words else dict(arguments), index)
+            for index, (name, arguments, own_words) in enumerate(plan)
+        ]
+
+    def store(self, user_input, tool_calls):
+        key = self.normalize(user_input)
+        if not key or not tool_calls:
+            return
+        plan = []
+        for call in tool_calls:
+            try:
+                arguments = json.loads(call.function.arguments or "{}")
+            except json.JSONDecodeError:
+                return  # Never replay a plan that can't be dispatched
+            if not isinstance(arguments, dict):
+                return
+            plan.append((call.function.name, arguments, arguments.get("query") == user_input))
+        self.cache.set(key, plan)
+
+    def stats(self):
+        return self.cache.stats()
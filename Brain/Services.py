@@ -0,0 +1,105 @@
+from dotenv import load_dotenv
+import json
+import os
+
+# Load environment variables from .env
+load_dotenv(dotenv_path='../.env')
+
+class Services:
+    """Builds each heavy dependency once and hands the same instance to every caller.
+
+    OrionModel, Chatbot, OrionTTS and the STT layer all take their clients,
+    caches and realtime data from here, so a warm Groq client or cached
+    location benefits everyone. Any service can be replaced with a local fake:
+
+        Services(llm=FakeLLM(), tts=FakeTTS())
+    """
+
+    def __init__(self, tts_engine="pyttsx3", **overrides):
+        self.tts_engine = tts_engine  # You can switch to 'gtts', 'edge' or 'groq'
+        self._instances = dict(overrides)
+
+    def _get(self, name, factory):
+        if name not in self._instances:
+            self._instances[name] = factory()
+        return self._instances[name]
+
+    @property
+    def groq_api(self):
+        return self._get("groq_api", lambda: os.getenv('GroqAPI'))
+
+    def _require_groq_api(self):
+        if not self.groq_api:
+            raise ValueError("❌ GroqAPI environment variable is not set in .env file.")
+        return self.groq_api
+
+    @property
+    def llm(self):
+        def build():
+            from Brain.LLM import AsyncLLM
+            return AsyncLLM(api_key=self._require_groq_api())
+        return self._get("llm", build)
+
+    @property
+    def groq_client(self):
+        """Synchronous Groq client, used for Groq speech synthesis."""
+        def build():
+            from groq import Groq
+            return Groq(api_key=self._require_groq_api())
+        return self._get("groq_client", build)
+
+    @property
+    def realtime_info(self):
+        def build():
+            from Backend.RealtimeData import RealTimeInformation
+            return RealTimeInformation()
+        return self._get("realtime_info", build)
+
+    @property
+    def history(self):
+        def build():
+            from Brain.ChatHistory import ChatHistoryStore
+            return ChatHistoryStore()
+        return self._get("history", build)
+
+    @property
+    def config(self):
+        def build():
+            with open(os.path.join('Brain', 'Data', 'orionconfig.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return self._get("config", build)
+
+    @property
+    def state(self):
+        def build():
+            from Backend.State import assistant_state
+            return assistant_state
+        return self._get("state", build)
+
+    @property
+    def audio_output(self):
+        def build():
+            from Backend.AudioOutput import audio_output
+            return audio_output
+        return self._get("audio_output", build)
+
+    @property
+    def tts(self):
+        def build():
+            from Backend.TTS import OrionTTS, STOCK_PHRASES
+            # The Groq client is only built if the groq engine actually speaks
+            return OrionTTS(
+                engine=self.tts_engine,
+                client_factory=lambda: self.groq_client,
+                state=self.state,
+                output=self.audio_output,
+                stock_phrases=self.config.get("stock_phrases", STOCK_PHRASES),
+            )
+        return self._get("tts", build)
+
+    @property
+    def stt(self):
+        def build():
+            from Backend.STT import FastNaturalSpeechRecognition
+            return FastNaturalSpeechRecognition(tts=self.tts, state=self.state)
+        return self._get("stt", build)
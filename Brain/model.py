@@ -1,26 +1,28 @@
 from dotenv import load_dotenv
-import os
 import time
-from groq import Groq
 import json
 import asyncio
 
 from Brain.ChatBot import Chatbot
-from Backend.RealtimeData import RealTimeInformation
-from Backend.STT import FastNaturalSpeechRecognition
+from Brain.LLM import LLMCancelled
+from Brain.Router import FastRouter, RouteCache
+from Brain.Services import Services
+from Backend.Tracing import tracer
 
 # Load .env
 load_dotenv(dotenv_path='../.env')
-groq_api = os.getenv('GroqAPI')
-if not groq_api:
-    raise ValueError("❌ GroqAPI not found in environment.")
 
 class OrionModel:
-    def __init__(self):
-        self.client = Groq(api_key=groq_api)
-        self.realtime_info = RealTimeInformation()
-        self.Chatbot = Chatbot()
-        self.stt = FastNaturalSpeechRecognition()
+    def __init__(self, services=None, fast_routing=True, route_cache_size=256):
+        self.services = services or Services()
+        self.llm = self.services.llm
+        # Obvious intents ("stop", "what time is it") skip the routing LLM call
+        self.router = FastRouter() if fast_routing else None
+        # Routing decisions of the LLM, replayed when the same utterance comes again
+        self.routes = RouteCache(maxsize=route_cache_size)
+        self.routing_calls = 0
+        self.realtime_info = self.services.realtime_info
+        self.Chatbot = Chatbot(self.services)
 
         # Tool definitions for Groq function calling
         self.tools = [
@@ -117,65 +119,95 @@ class OrionModel:
             "Stop": async_stop_wrapper
         }
 
+        # Static part of every routing request, built once
+        self.routing_prefix = [
+            {
+                "role": "system",
+                "content": (
+                    "You are Orion, a function-calling assistant. "
+                    "You must always respond using either the 'Chatbot' or 'Search' function tools, or both when appropriate. "
+                    "Do NOT answer directly. Your job is only to select the function and arguments. "
+                    "For general queries or queries about weather, time, location, use the 'Chatbot' function with appropriate contexts. "
+                    "Valid contexts for Chatbot: 'weather', 'time', 'location', 'search', 'general'. "
+                    "For explicit web search requests, use the 'Search' function. "
+                    "When a query requires both search and conversation, use BOTH functions - the Search results will be automatically fed into the Chatbot for a comprehensive response. "
+                    "For example, if the user asks 'Tell me about the latest AI news', call both Search (for 'latest AI news') and Chatbot (to process and explain the results)."
+                )
+            },
+            {
+                "role": "user",
+                "content": "How are you Orion and what is the weather and time and search for latest news today"
+            },
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "id": "tool1",
+                        "type": "function",
+                        "function": {
+                            "name": "Chatbot",
+                            "arguments": json.dumps({
+                                "query": "How are you Orion and what is the weather and time?",
+                                "contexts": ['general', 'weather', 'time']
+                            })
+                        }
+                    },
+                    {
+                        "id": "tool2",
+                        "type": "function",
+                        "function": {
+                            "name": "Search",
+                            "arguments": json.dumps({
+                                "query": "latest news today",
+                                "max_results": 3
+                            })
+                        }
+                    }
+                ]
+            }
+        ]
+
+    @property
+    def stt(self):
+        # Only needed for Stop; resolved late so the model never opens a microphone itself
+        return self.services.stt
+
+    def routing_stats(self):
+        """Routing LLM calls made and how often the decision cache answered instead."""
+        return {"llm_calls": self.routing_calls, **self.routes.stats()}
+
+    def cancel(self):
+        """Abort any routing or answer request still waiting on the LLM."""
+        self.llm.cancel()
+        self.Chatbot.cancel()
+
+    def cancel_threadsafe(self, loop):
+        """cancel() from another thread, e.g. the STT pool on barge-in."""
+        loop.call_soon_threadsafe(self.cancel)
+
     async def handle(self, user_input: str) -> str:
         try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are Orion, a function-calling assistant. "
-                        "You must always respond using either the 'Chatbot' or 'Search' function tools, or both when appropriate. "
-                        "Do NOT answer directly. Your job is only to select the function and arguments. "
-                        "For general queries or queries about weather, time, location, use the 'Chatbot' function with appropriate contexts. "
-                        "Valid contexts for Chatbot: 'weather', 'time', 'location', 'search', 'general'. "
-                        "For explicit web search requests, use the 'Search' function. "
-                        "When a query requires both search and conversation, use BOTH functions - the Search results will be automatically fed into the Chatbot for a comprehensive response. "
-                        "For example, if the user asks 'Tell me about the latest AI news', call both Search (for 'latest AI news') and Chatbot (to process and explain the results)."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": "How are you Orion and what is the weather and time and search for latest news today"
-                },
-                {
-                    "role": "assistant",
-                    "tool_calls": [
-                        {
-                            "id": "tool1",
-                            "type": "function",
-                            "function": {
-                                "name": "Chatbot",
-                                "arguments": json.dumps({
-                                    "query": "How are you Orion and what is the weather and time?",
-                                    "contexts": ['general', 'weather', 'time']
-                                })
-                            }
-                        },
-                        {
-                            "id": "tool2",
-                            "type": "function",
-                            "function": {
-                                "name": "Search",
-                                "arguments": json.dumps({
-                                    "query": "latest news today",
-                                    "max_results": 3
-                                })
-                            }
-                        }
-                    ]
-                },
-                {
-                    "role": "user",
-                    "content": user_input
-                }
-            ]
-
-            response = self.client.chat.completions.create(
-                model="meta-llama/llama-4-scout-17b-16e-instruct",
-                messages=messages,
-                tools=self.tools,
-                tool_choice="auto"
-            )
+            tool_calls = self.router.route(user_input) if self.router else None
+            if tool_calls:
+                print(f"⚡ Fast route: {', '.join(call.function.name for call in tool_calls)}")
+                return await self._dispatch(tool_calls)
+
+            # 🔹 Same utterance as before: replay the stored plan instead of asking again
+            tool_calls = self.routes.get(user_input)
+            if tool_calls:
+                print(f"♻️ Cached route: {', '.join(call.function.name for call in tool_calls)}")
+                return await self._dispatch(tool_calls)
+
+            messages = self.routing_prefix + [{"role": "user", "content": user_input}]
+            self.routing_calls += 1
+
+            with tracer.span("route.llm"):
+                response = await self.llm.complete(
+                    model="meta-llama/llama-4-scout-17b-16e-instruct",
+                    messages=messages,
+                    tools=self.tools,
+                    tool_choice="auto"
+                )
 
             if not response or not response.choices:
                 return "❌ No response from model."
@@ -185,149 +217,176 @@ class OrionModel:
 
             # ✅ TOOL CALL PATH
             if choice.finish_reason == "tool_calls" and message and message.tool_calls:
-                results = []
-                search_results = ""
+                result = await self._dispatch(message.tool_calls)
+                try:
+                    self.routes.store(user_input, message.tool_calls)
+                except Exception as e:
+                    print(f"⚠️ Could not cache the route: {e}")  # 🔹 Caching never costs the user a turn
+                return result
+
+        except LLMCancelled:
+            print("🛑 Routing request cancelled.")
+            return "🛑 Request cancelled."
+        except Exception as e:
+            error_msg = f"🚨 Error in model.handle: {str(e)}"
+            print(error_msg)
+            return error_msg
+
+    async def _dispatch(self, tool_calls):
+        """Run the tool calls chosen by the router or the LLM and join their results.
+
+        Searches and other independent calls run concurrently. Chatbot calls
+        wait for the search results and run one at a time since they speak.
+        Results keep the order of tool_calls.
+        """
+        searches = [(i, c) for i, c in enumerate(tool_calls) if c.function.name == "Search"]
+        others = [(i, c) for i, c in enumerate(tool_calls) if c.function.name not in ("Search", "Chatbot")]
+        chats = [(i, c) for i, c in enumerate(tool_calls) if c.function.name == "Chatbot"]
+
+        # First pass: all Search calls and independent tools at once
+        outputs = await asyncio.gather(
+            *(self._traced(c, self._run_search(c)) for _, c in searches),
+            *(self._traced(c, self._run_tool(c)) for _, c in others),
+            return_exceptions=True,
+        )
+        search_outputs, other_outputs = outputs[:len(searches)], outputs[len(searches):]
+        search_results = [
+            out if isinstance(out, str) else f"❌ Error processing Search tool call: {out}"
+            for out in search_outputs
+        ]
+        search_results = [out for out in search_results if out]
+
+        ordered = {}
+        for (index, _), out in zip(others, other_outputs):
+            ordered[index] = out if not isinstance(out, BaseException) else f"❌ Error processing tool call: {str(out)}"
+
+        # Second pass: Chatbot calls with the merged search results
+        for index, tool_call in chats:
+            ordered[index] = await self._traced(tool_call, self._run_tool(tool_call, search_results))
+
+        results = [ordered[index] for index in sorted(ordered) if ordered[index] is not None]
+        return "\n".join(results) if results else "❌ No results from function calls."
+
+    async def _traced(self, tool_call, call):
+        with tracer.span(f"tool.{tool_call.function.name}"):
+            return await call
+
+    async def _run_search(self, tool_call):
+        """Run one Search call and return its raw result for the Chatbot prompt."""
+        print(f"🔍 Processing Search tool call")
+        args = {}
+        try:
+            args = json.loads(tool_call.function.arguments)
+            print(f"🧠 Calling Search with: {args}")
+            
+            # Extract min_summary_length from query if explicitly mentioned
+            query = args.get('query', '')
+            if 'min_summary_length=' in query:
+                try:
+                    # Extract the value after min_summary_length=
+                    min_length_str = query.split('min_summary_length=')[1].split()[0]
+                    # Remove any non-numeric characters
+                    min_length_str = ''.join(c for c in min_length_str if c.isdigit())
+                    if min_length_str:
+                        args['min_summary_length'] = int(min_length_str)
+                        # Remove the parameter from the query
+                        args['query'] = query.replace(f'min_summary_length={min_length_str}', '').strip()
+                        print(f"📏 Extracted min_summary_length={args['min_summary_length']} from query")
+                except Exception as e:
+                    print(f"⚠️ Failed to extract min_summary_length: {str(e)}")
+            
+            # Ensure min_summary_length is passed if not provided
+            if 'min_summary_length' not in args:
+                args['min_summary_length'] = 80  # Default value
                 
-                # First pass: Process all Search function calls
-                for tool_call in message.tool_calls:
-                    try:
-                        function_name = tool_call.function.name
-                        if function_name == "Search":
-                            print(f"🔍 Processing Search tool call")
-                            try:
-                                args = json.loads(tool_call.function.arguments)
-                                print(f"🧠 Calling Search with: {args}")
-                                
-                                # Extract min_summary_length from query if explicitly mentioned
-                                query = args.get('query', '')
-                                if 'min_summary_length=' in query:
-                                    try:
-                                        # Extract the value after min_summary_length=
-                                        min_length_str = query.split('min_summary_length=')[1].split()[0]
-                                        # Remove any non-numeric characters
-                                        min_length_str = ''.join(c for c in min_length_str if c.isdigit())
-                                        if min_length_str:
-                                            args['min_summary_length'] = int(min_length_str)
-                                            # Remove the parameter from the query
-                                            args['query'] = query.replace(f'min_summary_length={min_length_str}', '').strip()
-                                            print(f"📏 Extracted min_summary_length={args['min_summary_length']} from query")
-                                    except Exception as e:
-                                        print(f"⚠️ Failed to extract min_summary_length: {str(e)}")
-                                
-                                # Ensure min_summary_length is passed if not provided
-                                if 'min_summary_length' not in args:
-                                    args['min_summary_length'] = 80  # Default value
-                                    
-                                search_result = await self.realtime_info.perform_search(**args)
-                                if search_result:
-                                    # Format search results for better readability
-                                    formatted_result = f"\n\n=== SEARCH RESULTS FOR '{args.get('query', 'unknown query')}' ===\n{search_result}\n=== END OF SEARCH RESULTS ===\n"
-                                    search_results += formatted_result
-                                    print(f"✅ Search returned results")
-                            except Exception as e:
-                                error_msg = f"❌ Error executing Search for '{args.get('query', 'unknown query')}': {str(e)}"
-                                print(error_msg)
-                                search_results += f"\n\n=== SEARCH ERROR ===\n{error_msg}\n=== END OF SEARCH ERROR ===\n"
-                    except Exception as e:
-                        error_msg = f"❌ Error processing Search tool call: {str(e)}"
-                        print(error_msg)
-                        search_results += f"\n\n=== SEARCH PROCESSING ERROR ===\n{error_msg}\n=== END OF SEARCH PROCESSING ERROR ===\n"
+            search_result = await self.realtime_info.perform_search(**args)
+            if search_result:
+                print(f"✅ Search returned results")
+                return search_result
+            return ""
+        except Exception as e:
+            error_msg = f"❌ Error executing Search for '{args.get('query', 'unknown query')}': {str(e)}"
+            print(error_msg)
+            return error_msg
+
+    async def _run_tool(self, tool_call, search_results=()):
+        """Run one non-Search call; errors become result strings so other calls are unaffected."""
+        try:
+            function_name = tool_call.function.name
+            print(f"🔍 Processing tool call: {function_name}")
                 
-                # Second pass: Process all other function calls, with special handling for Chatbot
-                for tool_call in message.tool_calls:
-                    try:
-                        function_name = tool_call.function.name
-                        print(f"🔍 Processing tool call: {function_name}")
-                        
-                        # Skip Search calls as they were already processed
-                        if function_name == "Search":
-                            continue
-                            
-                        # Parse arguments with error handling
-                        try:
-                            args = json.loads(tool_call.function.arguments)
-                        except json.JSONDecodeError as e:
-                            error_msg = f"❌ Invalid JSON in arguments for {function_name}: {str(e)}"
-                            print(error_msg)
-                            results.append(error_msg)
-                            continue
-                        
-                        # Special handling for Chatbot to include search results
-                        if function_name == "Chatbot":
-                            print(f"🧠 Calling Chatbot with search results")
-                            original_query = args.get("query", "")
-                            
-                            # If we have search results, include them in the Chatbot query
-                            if search_results:
-                                enhanced_query = f"""I've gathered some real-time information from the web to help answer this query. This information may not always be 100% accurate, so please verify with other sources when possible.
-
-{search_results}
-
-ORIGINAL USER QUERY: "{original_query}"
-
-INSTRUCTIONS:
-1. Analyze the search results thoroughly
-2. Provide a comprehensive, short, and well-structured response addressing the user's query
-3. Synthesize information from multiple sources when available
-4. Highlight key points and important findings
-5. Present a balanced view if there are conflicting perspectives
-6. If the search results are insufficient or irrelevant, acknowledge this limitation
-7. If you don't know the answer, simply state that you don't know
-8. Format your response in a clear, readable manner."""
-                                args["query"] = enhanced_query
-                            
-                            # Call Chatbot with enhanced query
-                            try:
-                                result = await self.Chatbot.handle_query(**args)
-                                if result is not None:  # Only append non-None results
-                                    print(f"✅ Chatbot returned result")
-                                    results.append(result)
-                                else:
-                                    print(f"⚠️ Chatbot returned None")
-                            except Exception as e:
-                                error_msg = f"❌ Error executing Chatbot with query '{original_query[:30]}...': {str(e)}"
-                                print(error_msg)
-                                results.append(f"An error occurred while processing your request: {str(e)}. Please try again or rephrase your query.")
-                        # Handle other functions normally
-                        elif function_name in self.function_map:
-                            print(f"🧠 Calling {function_name} with: {args}")
-                            function_to_call = self.function_map[function_name]
-                            
-                            # Call function with error handling
-                            try:
-                                result = await function_to_call(**args)
-                                if result is not None:  # Only append non-None results
-                                    print(f"✅ {function_name} returned result of type: {type(result)}")
-                                    results.append(result)
-                                else:
-                                    print(f"⚠️ {function_name} returned None")
-                            except Exception as e:
-                                error_msg = f"❌ Error executing {function_name}: {str(e)}"
-                                print(error_msg)
-                                results.append(error_msg)
-                        else:
-                            error_msg = f"❌ Unknown function: {function_name}"
-                            print(error_msg)
-                            results.append(error_msg)
-                    except Exception as e:
-                        error_msg = f"❌ Error processing tool call: {str(e)}"
-                        print(error_msg)
-                        results.append(error_msg)
+            # Parse arguments with error handling
+            try:
+                args = json.loads(tool_call.function.arguments)
+            except json.JSONDecodeError as e:
+                error_msg = f"❌ Invalid JSON in arguments for {function_name}: {str(e)}"
+                print(error_msg)
+                return error_msg
+            
+            # Special handling for Chatbot to include search results
+            if function_name == "Chatbot":
+                print(f"🧠 Calling Chatbot with search results")
+                original_query = args.get("query", "")
                 
-                return "\n".join(results) if results else "❌ No results from function calls."
-
+                # Search results go in as snippets; the Chatbot fits them into its token budget
+                if search_results:
+                    args["search_results"] = search_results
+                
+                # Call Chatbot with the search results
+                try:
+                    result = await self.Chatbot.handle_query(**args)
+                    if result is not None:  # Only append non-None results
+                        print(f"✅ Chatbot returned result")
+                    else:
+                        print(f"⚠️ Chatbot returned None")
+                    return result
+                except Exception as e:
+                    error_msg = f"❌ Error executing Chatbot with query '{original_query[:30]}...': {str(e)}"
+                    print(error_msg)
+                    return f"An error occurred while processing your request: {str(e)}. Please try again or rephrase your query."
+            # Handle other functions normally
+            elif function_name in self.function_map:
+                print(f"🧠 Calling {function_name} with: {args}")
+                function_to_call = self.function_map[function_name]
+                
+                # Call function with error handling
+                try:
+                    result = await function_to_call(**args)
+                    if result is not None:  # Only append non-None results
+                        print(f"✅ {function_name} returned result of type: {type(result)}")
+                    else:
+                        print(f"⚠️ {function_name} returned None")
+                    return result
+                except Exception as e:
+                    error_msg = f"❌ Error executing {function_name}: {str(e)}"
+                    print(error_msg)
+                    return error_msg
+            else:
+                error_msg = f"❌ Unknown function: {function_name}"
+                print(error_msg)
+                return error_msg
         except Exception as e:
-            error_msg = f"🚨 Error in model.handle: {str(e)}"
+            error_msg = f"❌ Error processing tool call: {str(e)}"
             print(error_msg)
             return error_msg
 
+# Built on first use so importing this module stays cheap
+model_instance = None
+
+def get_model(services=None, **kwargs):
+    """Return the shared OrionModel, creating it on the first call.
 
-# Create an instance of the model to be imported by other modules
-model_instance = OrionModel()
+    Passing a different Services container builds a new model for it
+    instead of silently returning the one wired to the old services.
+    """
+    global model_instance
+    if model_instance is None or (services is not None and services is not model_instance.services):
+        model_instance = OrionModel(services=services, **kwargs)
+    return model_instance
 
 # Function to be imported by other modules
 async def model(user_input):
-    return await model_instance.handle(user_input)
+    return await get_model().handle(user_input)
 
 # Run test
 async def test():
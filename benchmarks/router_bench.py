@@ -0,0 +1,65 @@
+"""Accuracy and latency of the local fast-path router against a labeled utterance set.
+
+Each line of the data file is {"text": ..., "expected": ...}, where expected is
+"Stop", "Chatbot:<context>" or null for utterances that must go to the LLM.
+
+    python -m benchmarks.router_bench [--data benchmarks/data/router_utterances.jsonl]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Brain.Router import FastRouter
+
+def label(tool_calls):
+    if not tool_calls:
+        return None
+    call = tool_calls[0]
+    if call.function.name == "Chatbot":
+        return "Chatbot:" + ",".join(json.loads(call.function.arguments)["contexts"])
+    return call.function.name
+
+def run(path, repeat=200):
+    with open(path, encoding="utf-8") as f:
+        samples = [json.loads(line) for line in f if line.strip()]
+
+    router = FastRouter()
+    correct = wrong = missed = passed = 0
+    timings = []
+    for sample in samples:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            got = label(router.route(sample["text"]))
+        timings.append((time.perf_counter() - start) / repeat * 1e6)
+
+        expected = sample["expected"]
+        if got is None and expected is None:
+            passed += 1
+        elif got is None:
+            missed += 1
+        elif got == expected:
+            correct += 1
+        else:
+            wrong += 1
+            print(f"❌ {sample['text']!r}: routed {got}, expected {expected}")
+
+    routable = sum(1 for s in samples if s["expected"])
+    handled = correct + wrong
+    timings.sort()
+    print(f"📊 {len(samples)} utterances, {routable} with a local intent")
+    print(f"✅ Routed correctly: {correct}   ❌ Wrong route: {wrong}   ↪️ Left to LLM: {missed + passed}")
+    print(f"🎯 Precision on routed: {correct / handled if handled else 0:.1%}   Coverage: {correct / routable if routable else 0:.1%}")
+    print(f"⏱️ Latency per utterance: p50 {statistics.median(timings):.1f}µs   "
+          f"p99 {timings[int(len(timings) * 0.99) - 1]:.1f}µs   max {timings[-1]:.1f}µs")
+    return {"correct": correct, "wrong": wrong, "missed": missed, "passed": passed}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default=os.path.join(os.path.dirname(__file__), "data", "router_utterances.jsonl"))
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    run(args.data, args.repeat)
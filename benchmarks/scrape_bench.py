@@ -0,0 +1,77 @@
+"""Streaming paragraph extraction vs. full BeautifulSoup parsing over saved HTML pages.
+
+Each fixture is fed to ParagraphExtractor in network-sized chunks, the way
+scrape_summary reads a response, and compared with the old approach of
+downloading the whole body and building a full BeautifulSoup tree.
+
+    python -m benchmarks.scrape_bench [--min-length 80] [--max-bytes 524288]
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Backend.HTMLExtractor import ParagraphExtractor
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+CHUNK = 16 * 1024
+
+def full_parse(raw, min_length):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(raw.decode("utf-8", errors="replace"), "html.parser")
+    for p in soup.find_all("p"):
+        text = p.get_text().strip()
+        if len(text) > min_length:
+            return text
+    return None
+
+def streaming(raw, min_length, max_bytes):
+    parser = ParagraphExtractor(min_length, max_bytes)
+    for start in range(0, len(raw), CHUNK):
+        if parser.feed_bytes(raw[start:start + CHUNK]):
+            break
+    return parser.finish(), parser.bytes_read
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples) * 1000
+
+def run(min_length=80, max_bytes=512 * 1024, repeat=5):
+    try:
+        import bs4  # noqa: F401
+        baseline = True
+    except ImportError:
+        print("⚠️ bs4 not installed, skipping the BeautifulSoup baseline")
+        baseline = False
+
+    total_bytes = total_read = 0
+    print(f"{'fixture':<22}{'size':>10}{'read':>10}{'stream ms':>11}{'bs4 ms':>9}  same as bs4")
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        with open(path, "rb") as f:
+            raw = f.read()
+        (text, read), stream_ms = timed(lambda: streaming(raw, min_length, max_bytes), repeat)
+        total_bytes += len(raw)
+        total_read += read
+        if baseline:
+            expected, bs4_ms = timed(lambda: full_parse(raw, min_length), repeat)
+            same = "✅" if expected == text else "≠"
+            bs4_col = f"{bs4_ms:>9.1f}"
+        else:
+            same, bs4_col = "-", f"{'-':>9}"
+        print(f"{os.path.basename(path):<22}{len(raw):>10}{read:>10}{stream_ms:>11.1f}{bs4_col}  {same}")
+    print(f"📉 Read {total_read} of {total_bytes} bytes ({1 - total_read / total_bytes:.0%} saved)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-length", type=int, default=80)
+    parser.add_argument("--max-bytes", type=int, default=512 * 1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.min_length, args.max_bytes, args.repeat)
@@ -0,0 +1,110 @@
+"""Cold-start time of the Orion entry point, measured in fresh interpreters.
+
+Each run starts main.voice_loop as `python main.py` would and times, from
+interpreter start: importing main, the listener starting (the moment
+Orion is "listening") and the model being built. The stock-phrase TTS
+warm-up that runs in the background afterwards is timed on its own.
+Heavy optional modules that got imported along the way are listed, since
+none of them should load before they are used.
+
+    python -m benchmarks.startup_bench [--runs 5] [--budget 1.5] [--no-mic]
+
+--no-mic listens to a silent ReplaySource instead of the microphone, for
+machines without an input device. The exit code is 1 if the median time
+to listening exceeds --budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ["sounddevice", "soundfile", "pyttsx3", "edge_tts", "gtts", "groq", "bs4", "googlesearch", "speech_recognition"]
+
+CHILD = r"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+stages = {}
+import main
+stages["import"] = time.perf_counter() - start
+
+import Backend.STT
+from Backend.TTS import OrionTTS
+if not __MIC__:
+    from Backend.STTBackends import ReplaySource
+    Backend.STT.microphone_source = lambda: ReplaySource([])  # silence, forever
+
+listen = Backend.STT.FastNaturalSpeechRecognition.start_background_listener
+def timed_listen(self):
+    listen(self)
+    stages["listening"] = time.perf_counter() - start
+Backend.STT.FastNaturalSpeechRecognition.start_background_listener = timed_listen
+
+get_model = main.get_model
+def timed_get_model(**kwargs):
+    model = get_model(**kwargs)
+    stages["model"] = time.perf_counter() - start
+    return model
+main.get_model = timed_get_model
+
+warm_cache = OrionTTS.warm_cache
+async def timed_warm_cache(self, phrases=None):
+    began = time.perf_counter()
+    await warm_cache(self, phrases)
+    stages["warm_up"] = time.perf_counter() - began
+OrionTTS.warm_cache = timed_warm_cache
+
+async def run():
+    loop = asyncio.create_task(main.voice_loop())
+    deadline = time.perf_counter() + 120
+    while not {"model", "warm_up"} <= stages.keys() and not loop.done() and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    loop.cancel()
+    try:
+        await loop
+    except asyncio.CancelledError:
+        pass
+
+asyncio.run(run())
+stages["heavy_modules"] = [m for m in __HEAVY__ if m in sys.modules]
+print(json.dumps(stages))
+"""
+
+def run_once(mic):
+    env = dict(os.environ)
+    env.setdefault("GroqAPI", "startup-bench")
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD.replace("__MIC__", repr(mic)).replace("__HEAVY__", repr(HEAVY))],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "child failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def run(runs=5, budget=None, mic=True):
+    samples = [run_once(mic) for _ in range(runs)]
+    for stage in ("import", "listening", "model"):
+        values = sorted(s[stage] for s in samples)
+        print(f"⏱️ {stage:<10} median {statistics.median(values) * 1000:7.1f} ms   max {values[-1] * 1000:7.1f} ms")
+    warm_ups = sorted(s["warm_up"] for s in samples if "warm_up" in s)
+    if warm_ups:
+        print(f"🔈 TTS warm-up (background, after listening) median {statistics.median(warm_ups) * 1000:7.1f} ms   "
+              f"max {warm_ups[-1] * 1000:7.1f} ms")
+    print(f"📦 Heavy modules loaded by the end of the warm-up: {', '.join(samples[-1]['heavy_modules']) or 'none'}")
+
+    listening = statistics.median(s["listening"] for s in samples)
+    if budget is not None:
+        ok = listening <= budget
+        print(f"{'✅' if ok else '❌'} Time to listening {listening:.3f}s (budget {budget:.3f}s)")
+        return ok
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None, help="seconds allowed until listening")
+    parser.add_argument("--no-mic", action="store_true")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.runs, args.budget, mic=not args.no_mic) else 1)
@@ -0,0 +1,126 @@
+"""False-accept rate and upload savings of the VAD front-end (Backend/VAD.py).
+
+Speech comes from recordings (temp.wav and Brain/Data/audio.wav by default,
+cut into phrase-sized pieces and optionally mixed with noise). Non-speech
+phrases are noise bursts that would cross the listener's energy threshold:
+hiss, rumble, mains hum, clicks and knocks, generated with a fixed seed, plus
+any WAVs given with --noise. Each phrase gets a quiet lead-in, like the
+listener records before a phrase starts.
+
+    python -m benchmarks.vad_bench [--speech temp.wav ...] [--noise noise.wav ...] [--runs 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import soundfile as sf
+import speech_recognition as sr
+from Backend.VAD import VoiceActivityDetector
+
+RATE = 16000
+
+def load(path):
+    data, rate = sf.read(path, dtype='float32', always_2d=True)
+    mono = data.mean(axis=1)
+    if rate != RATE:
+        n = int(round(len(mono) * RATE / rate))
+        mono = np.interp(np.linspace(0, len(mono) - 1, n), np.arange(len(mono)), mono).astype('float32')
+    return mono
+
+def phrases_from(recording, seconds=2.5):
+    """Cut a long recording into phrase-sized pieces that contain sound."""
+    step = int(seconds * RATE)
+    pieces = [recording[i:i + step] for i in range(0, len(recording), step)]
+    return [p for p in pieces if len(p) > RATE // 2 and np.sqrt(np.mean(p ** 2)) > 0.01]
+
+def lead_in(rng, signal, seconds=0.5, level=0.002):
+    quiet = rng.normal(0, level, int(seconds * RATE)).astype('float32')
+    return np.concatenate([quiet, signal, quiet[:RATE // 4]])
+
+def noise_phrases(rng, count):
+    t = np.arange(int(1.2 * RATE)) / RATE
+    makers = {
+        "hiss": lambda: rng.normal(0, rng.uniform(0.03, 0.2), len(t)),
+        "rumble": lambda: np.convolve(rng.normal(0, 1.0, len(t)), np.ones(200) / 200, mode="same") * rng.uniform(2, 6),
+        "hum": lambda: sum(np.sin(2 * np.pi * 50 * k * t) / k for k in (1, 2, 3)) * rng.uniform(0.05, 0.2),
+        "clicks": lambda: _clicks(rng, len(t)),
+        "knock": lambda: _knock(rng, t),
+    }
+    phrases = []
+    for i in range(count):
+        name = list(makers)[i % len(makers)]
+        phrases.append((name, makers[name]().astype('float32')))
+    return phrases
+
+def _clicks(rng, n):
+    signal = np.zeros(n)
+    for start in rng.integers(0, n - 40, 12):
+        signal[start:start + 40] += rng.normal(0, 0.5, 40)
+    return signal
+
+def _knock(rng, t):
+    decay = np.exp(-t * 25)
+    return np.sin(2 * np.pi * rng.uniform(60, 200) * t) * decay * rng.uniform(0.3, 0.8) + rng.normal(0, 0.02, len(t)) * decay
+
+def to_audio(signal):
+    pcm = (np.clip(signal, -1, 1) * 32767).astype('<i2')
+    return sr.AudioData(pcm.tobytes(), RATE, 2)
+
+def crosses_listener_threshold(audio, threshold=300, chunk=1024):
+    samples = np.frombuffer(audio.frame_data, dtype='<i2').astype(np.float64)
+    chunks = samples[:len(samples) // chunk * chunk].reshape(-1, chunk)
+    return bool((np.sqrt((chunks ** 2).mean(axis=1)) > threshold).any())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speech", nargs="+", default=["temp.wav", os.path.join("Brain", "Data", "audio.wav")])
+    parser.add_argument("--noise", nargs="*", default=[])
+    parser.add_argument("--runs", type=int, default=20, help="noise phrases per speech phrase")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    speech = []
+    for path in args.speech:
+        for piece in phrases_from(load(path)):
+            speech.append(("speech", lead_in(rng, piece)))
+            noisy = piece + rng.normal(0, 0.01, len(piece)).astype('float32')
+            speech.append(("speech+noise", lead_in(rng, noisy)))
+    noise = [(name, lead_in(rng, s)) for name, s in noise_phrases(rng, max(10, len(speech) * args.runs // 10))]
+    noise += [(os.path.basename(p), lead_in(rng, load(p))) for p in args.noise]
+
+    # 🔹 Only phrases the listener would actually capture count
+    phrases = [(label, kind, to_audio(s)) for kind, group in (("speech", speech), ("noise", noise))
+               for label, s in group]
+    phrases = [(label, kind, a) for label, kind, a in phrases if crosses_listener_threshold(a)]
+    rng.shuffle(phrases)
+
+    vad = VoiceActivityDetector()
+    false_accepts, false_rejects, speech_total, noise_total = {}, 0, 0, {}
+    start = time.perf_counter()
+    for label, kind, audio in phrases:
+        kept = vad.process(audio)
+        if kind == "speech":
+            speech_total += 1
+            false_rejects += kept is None
+        else:
+            noise_total[label] = noise_total.get(label, 0) + 1
+            false_accepts[label] = false_accepts.get(label, 0) + (kept is not None)
+    elapsed = (time.perf_counter() - start) / max(1, len(phrases)) * 1000
+
+    stats = vad.stats()
+    accepted_noise = sum(false_accepts.values())
+    total_noise = sum(noise_total.values())
+    print(f"🎙️ {speech_total} speech phrases, {total_noise} noise phrases ({elapsed:.2f} ms each)")
+    for label in sorted(noise_total):
+        print(f"   {label:<14} false accepts {false_accepts[label]:3d} / {noise_total[label]}")
+    print(f"❌ False-accept rate {accepted_noise / max(1, total_noise):.1%}   "
+          f"false-reject rate {false_rejects / max(1, speech_total):.1%}")
+    print(f"📉 Bytes sent {stats['bytes_out']:,} of {stats['bytes_in']:,} "
+          f"({stats['bytes_saved'] / max(1, stats['bytes_in']):.0%} saved)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""End-to-end latency of main.voice_loop on recorded speech, without a microphone or LLM.
+
+A ReplaySource plays WAV recordings (temp.wav by default) into the real
+background listener, a recognizer transcribes them, and a stand-in model
+notes when each transcript reaches it. Latency runs from the end of each
+recording to that moment and includes the listener's end-of-phrase pause.
+
+    python -m benchmarks.voice_loop_bench [--wav temp.wav ...] [--turns 3] [--speed 1]
+        [--latency 0 0.3 0.8] [--workers 2] [--google]
+
+--speed replays faster than real time (the pause is shortened by the same
+factor). --google also measures the real Google recognizer (needs network).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main
+from Backend.AudioOutput import AudioOutput
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import GoogleRecognizer, LocalStubRecognizer, ReplaySource
+from Brain.Services import Services
+
+class SilentTTS:
+    async def warm_cache(self):
+        pass
+
+    def stop(self):
+        pass
+
+async def _no_warmup():
+    return {}
+
+async def run_session(wavs, backend, speed, gap, workers):
+    source = ReplaySource(wavs, speed=speed, gap=gap)
+    tts = SilentTTS()
+    stt = FastNaturalSpeechRecognition(
+        tts=tts, state=AssistantState(), source=source, backend=backend, workers=workers,
+    )
+    services = Services(
+        llm=object(), history=object(), config={}, tts=tts, stt=stt, audio_output=AudioOutput(),
+    )
+    arrivals = []
+
+    async def stand_in_model(user_input):
+        arrivals.append(time.monotonic())
+
+    main.model = stand_in_model
+    main.warm_location_cache = _no_warmup  # main.voice_loop builds a fresh model for these services
+    loop = asyncio.create_task(main.voice_loop(services))
+
+    audio_seconds = len(wavs) * (max(0.1, gap) + 5.0)
+    deadline = time.monotonic() + audio_seconds / speed + 10
+    while len(arrivals) < len(wavs) and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    loop.cancel()
+    try:
+        await loop
+    except asyncio.CancelledError:
+        pass
+    stt.stop_background_listener()
+    stt.pool.close()
+    latencies = [(a - e) * 1000 for a, e in zip(arrivals, source.utterance_ends)]
+    return latencies, len(wavs) - len(arrivals), stt.pool.stats()
+
+def report(name, latencies, missed, pool):
+    if not latencies:
+        print(f"❌ {name:<24} no transcripts reached the model")
+        return
+    print(
+        f"⏱️ {name:<24} median {statistics.median(latencies):7.1f} ms   "
+        f"max {max(latencies):7.1f} ms   turns {len(latencies)}   missed {missed}   "
+        f"max queue {pool['max_queue_depth']}   dropped {pool['dropped']}"
+    )
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wav", nargs="+", default=["temp.wav"])
+    parser.add_argument("--turns", type=int, default=3, help="times to replay the recordings")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--gap", type=float, default=1.0, help="seconds of silence after each recording")
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0, 0.3, 0.8],
+                        help="latencies (s) of the local stand-in recognizer")
+    parser.add_argument("--workers", type=int, default=2, help="recognition worker threads")
+    parser.add_argument("--google", action="store_true")
+    args = parser.parse_args()
+
+    wavs = args.wav * args.turns
+    backends = [
+        (f"local-stub {latency:.1f}s", LocalStubRecognizer(["what time is it"] * len(wavs), latency=latency))
+        for latency in args.latency
+    ]
+    if args.google:
+        backends.append(("google", GoogleRecognizer()))
+
+    print(f"🎧 {len(wavs)} utterances at {args.speed:g}x speed")
+    for name, backend in backends:
+        latencies, missed, pool = asyncio.run(run_session(wavs, backend, args.speed, args.gap, args.workers))
+        report(name, latencies, missed, pool)
+
+if __name__ == "__main__":
+    main_cli()
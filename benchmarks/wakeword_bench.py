@@ -0,0 +1,134 @@
+"""Outbound requests while Orion is asleep, with and without local wake word templates.
+
+A sleeping listener hears a stream of phrases: other speech (pieces of
+Brain/Data/audio.wav), noise bursts, and now and then the wake word
+(temp.wav, time-stretched and mixed with noise). Orion is put back to sleep
+after every wake-up. Without templates each phrase that passes the VAD goes
+to cloud STT (a stand-in that transcribes perfectly); with templates
+(--template, temp.wav by default) the local detector decides. Reported:
+cloud STT requests, transcripts handed to the model, missed and false wakes.
+
+    python -m benchmarks.wakeword_bench [--template temp.wav ...] [--phrases 60] [--wake-every 6]
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
+import soundfile as sf
+import speech_recognition as sr
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.WakeWord import WakeWordDetector
+
+RATE = 16000
+
+def load(path):
+    data, rate = sf.read(path, dtype='float32', always_2d=True)
+    mono = data.mean(axis=1)
+    n = int(round(len(mono) * RATE / rate))
+    return np.interp(np.linspace(0, len(mono) - 1, n), np.arange(len(mono)), mono)
+
+def to_audio(rng, signal, noise):
+    quiet = rng.normal(0, 0.002, RATE // 2)
+    pcm = np.concatenate([quiet, signal + rng.normal(0, noise, len(signal)), quiet])
+    return sr.AudioData((np.clip(pcm, -1, 1) * 32767).astype('<i2').tobytes(), RATE, 2)
+
+def idle_session(rng, wake, other, count, wake_every):
+    """[(is_wake_word, audio)] as heard by a sleeping listener."""
+    phrases = []
+    for i in range(count):
+        if i % wake_every == wake_every - 1:
+            n = int(len(wake) * rng.uniform(0.9, 1.1))
+            stretched = np.interp(np.linspace(0, len(wake) - 1, n), np.arange(len(wake)), wake)
+            phrases.append((True, to_audio(rng, stretched, rng.uniform(0.002, 0.008))))
+        elif i % 3 == 0:
+            phrases.append((False, to_audio(rng, rng.normal(0, rng.uniform(0.05, 0.2), RATE), 0.0)))
+        else:
+            start = int(rng.integers(0, len(other) - 2 * RATE))
+            piece = other[start:start + int(rng.uniform(0.8, 2.0) * RATE)]
+            phrases.append((False, to_audio(rng, piece, 0.002)))
+    return phrases
+
+class OracleRecognizer:
+    """Cloud STT stand-in: knows what every phrase says and counts the requests."""
+
+    def __init__(self, phrases):
+        self.phrases = phrases
+        self.calls = 0
+
+    def recognize(self, audio):
+        self.calls += 1
+        for is_wake, original in self.phrases:
+            if audio.frame_data in original.frame_data:  # the VAD hands on a slice of the capture
+                return "hey orion" if is_wake else "and then we went to the market"
+        raise sr.UnknownValueError()
+
+class NoTTS:
+    def stop(self):
+        pass
+
+async def run(phrases, wakeword):
+    backend = OracleRecognizer(phrases)
+    state = AssistantState(sleeping=True)
+    stt = FastNaturalSpeechRecognition(
+        tts=NoTTS(), state=state, source=object(), backend=backend, workers=1, wakeword=wakeword,
+    )
+    wakes, missed, false_wakes = 0, 0, 0
+    start = time.perf_counter()
+    for is_wake, audio in phrases:
+        stt._callback(None, audio)
+        while stt.pool.delivered + stt.pool.dropped < stt.pool.submitted:
+            await asyncio.sleep(0.001)
+        woke = state.listening
+        wakes += woke and is_wake
+        missed += is_wake and not woke
+        false_wakes += woke and not is_wake
+        state.sleep()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+    stt.pool.close()
+    return {
+        "cloud": backend.calls,
+        "model": stt.audio_handler.audio_queue.qsize(),
+        "ignored": stt.ignored_while_asleep,
+        "wakes": wakes,
+        "missed": missed,
+        "false_wakes": false_wakes,
+        "ms_per_phrase": elapsed / len(phrases) * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--template", nargs="+", default=["temp.wav"])
+    parser.add_argument("--wake", default="temp.wav", help="recording of the wake word to replay")
+    parser.add_argument("--other", default=os.path.join("Brain", "Data", "audio.wav"))
+    parser.add_argument("--phrases", type=int, default=60)
+    parser.add_argument("--wake-every", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    phrases = idle_session(rng, load(args.wake), load(args.other), args.phrases, args.wake_every)
+    expected = sum(is_wake for is_wake, _ in phrases)
+    print(f"😴 {len(phrases)} phrases while asleep, {expected} of them the wake word")
+
+    with tempfile.TemporaryDirectory() as empty, tempfile.TemporaryDirectory() as templates:
+        for i, path in enumerate(args.template):
+            shutil.copy(path, os.path.join(templates, f"template-{i}.wav"))
+        for name, directory in (("cloud wake check", empty), ("local wake word", templates)):
+            wakeword = WakeWordDetector(directory=directory)
+            result = asyncio.run(run(phrases, wakeword))
+            print(
+                f"   {name:<17} cloud STT requests {result['cloud']:3d}   to model {result['model']:3d} (ignored {result['ignored']})   "
+                f"wakes {result['wakes']}/{expected}   false wakes {result['false_wakes']}   "
+                f"{result['ms_per_phrase']:.1f} ms/phrase"
+            )
+
+if __name__ == "__main__":
+    main()
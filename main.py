@@ -1,11 +1,24 @@
+import argparse
 import asyncio
-from Brain.model import model
-from Backend.STT import FastNaturalSpeechRecognition
+import os
+from Brain.model import model, get_model
+from Backend import HTTPClient
+from Brain.Services import Services
+from Backend.RealtimeData import warm_location_cache
+from Backend.Tracing import tracer
 
-async def voice_loop():
+PROFILE_PATH = os.path.join('Brain', 'Data', 'profile.json')
+
+async def voice_loop(services=None, profile_url=None):
     print("🤖 Orion Assistant (voice only)")
-    stt = FastNaturalSpeechRecognition()
+    await HTTPClient.startup()  # ✅ Warm connection pool shared by all network calls
+    location_warmup = asyncio.create_task(warm_location_cache())  # ✅ Resolve location while we start listening
+    services = services or Services()  # ✅ One Groq client, TTS, listener and realtime cache for everyone
+    stt = services.stt
     stt.start_background_listener()  # ✅ Start once only
+    tts_warmup = asyncio.create_task(services.tts.warm_cache())  # ✅ Stock phrases play instantly later
+    orion = get_model(services=services)
+    stt.on_barge_in = lambda: orion.cancel_threadsafe(stt.loop)  # ✅ Talking over Orion aborts the reply
 
     try:
         while True:
@@ -13,10 +26,54 @@ async def voice_loop():
             if not user_input.strip():
                 continue
             print(f"🗣️ {user_input}")
-            await model(user_input)
+            tts_warmup.cancel()  # ✅ Replies never queue behind stock phrases on the TTS engine
+            tracer.start_turn(getattr(user_input, "turn", None))  # ✅ Spans from the phrase's capture onwards
+            with tracer.span("turn"):
+                await model(user_input)
+            if tts_warmup.cancelled():
+                tts_warmup = asyncio.create_task(services.tts.warm_cache())  # ✅ Resume between turns (cached ones are skipped)
+            await export_profile(profile_url)
     except KeyboardInterrupt:
         stt.stop_background_listener()
         print("👋 Exiting on keyboard interrupt.")
+    finally:
+        location_warmup.cancel()
+        tts_warmup.cancel()
+        services.audio_output.close()
+        await HTTPClient.shutdown()
+
+async def export_profile(url=None):
+    """Write the latency histograms after every turn (and POST them when a URL is set)."""
+    if not tracer.enabled:
+        return
+    tracer.dump()
+    if url:
+        try:
+            await tracer.push(url)
+        except Exception as e:
+            print(f"⚠️ Could not send the profile to {url}: {e}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Orion voice assistant")
+    parser.add_argument(
+        "--profile", nargs="?", const=PROFILE_PATH, metavar="PATH|URL",
+        help=f"trace every turn and write p50/p95/p99 latencies per stage to PATH (default {PROFILE_PATH}) "
+             "or POST them to an http(s) URL",
+    )
+    return parser.parse_args(argv)
 
 if __name__ == '__main__':
-    asyncio.run(voice_loop())
+    args = parse_args()
+    profile_url = None
+    if args.profile:
+        if args.profile.startswith(("http://", "https://")):
+            profile_url = args.profile
+            tracer.enable()
+        else:
+            tracer.enable(args.profile)
+        print(f"📈 Profiling every turn to {args.profile}")
+    try:
+        asyncio.run(voice_loop(profile_url=profile_url))
+    finally:
+        if tracer.enabled:
+            tracer.report()
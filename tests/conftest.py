@@ -0,0 +1,9 @@
+import pytest
+from Backend import RealtimeData
+from Backend.Cache import TieredCache
+
+@pytest.fixture
+def isolated_caches(tmp_path, monkeypatch):
+    """Fresh search and page caches under tmp_path instead of Brain/Data/cache."""
+    monkeypatch.setattr(RealtimeData, "search_cache", TieredCache(str(tmp_path / "search"), ttl=60))
+    monkeypatch.setattr(RealtimeData, "page_cache", TieredCache(str(tmp_path / "pages"), ttl=60))
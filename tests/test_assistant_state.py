@@ -0,0 +1,43 @@
+import threading
+from Backend.State import AssistantState
+from Backend.TTS import OrionTTS
+
+def test_flags_are_in_memory_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    state = AssistantState()
+    assert state.listening and not state.speaking
+    state.sleep()
+    state.start_speaking()
+    assert state.sleeping and state.speaking
+    assert list(tmp_path.iterdir()) == []
+
+def test_speaking_events_wake_other_threads():
+    state = AssistantState()
+    state.start_speaking()
+    assert not state.wait_idle(timeout=0.01)
+    threading.Timer(0.05, state.stop_speaking).start()
+    assert state.wait_idle(timeout=2)
+
+    state.sleep()
+    threading.Timer(0.05, state.wake).start()
+    assert state.wait_awake(timeout=2)
+
+def test_snapshot_mirrors_and_restores_flag_files(tmp_path):
+    state = AssistantState(snapshot_dir=str(tmp_path))
+    state.sleep()
+    state.start_speaking()
+    assert (tmp_path / "stop.orion").read_text() == "true"
+    assert (tmp_path / "TTS_runing.orion").read_text() == "true"
+    assert AssistantState(snapshot_dir=str(tmp_path)).sleeping
+
+def test_tts_barge_in_check_reads_shared_state():
+    state = AssistantState()
+    tts = OrionTTS(state=state)
+    tts._start()
+    assert tts._isruning()
+    state.stop_speaking()
+    assert not tts._isruning()
+
+if __name__ == "__main__":
+    test_speaking_events_wake_other_threads()
+    test_tts_barge_in_check_reads_shared_state()
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import LocalStubRecognizer
+from Brain.LLM import AsyncLLM, LLMCancelled
+from Brain.model import OrionModel
+from Brain.Services import Services
+
+class SlowCompletions:
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(model=kwargs.get("model"))
+
+def fake_client(delay):
+    return SimpleNamespace(chat=SimpleNamespace(completions=SlowCompletions(delay)))
+
+class EndlessStream:
+    """A streamed answer that never finishes on its own; counts the chunks it sent."""
+
+    def __init__(self):
+        self.sent = 0
+
+    async def create(self, stream=False, **kwargs):
+        async def chunks():
+            while True:
+                await asyncio.sleep(0.01)
+                self.sent += 1
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Still talking. "))])
+        return chunks()
+
+class SpeakingTTS:
+    def __init__(self, state):
+        self.state = state
+        self.first_audio_at = None
+        self.stopped = 0
+
+    async def speak_stream(self, sentences):
+        self.state.start_speaking()
+        while await sentences.get() is not None:
+            pass
+
+    def stop(self):
+        self.stopped += 1
+
+def test_loop_stays_responsive_during_request():
+    async def scenario():
+        llm = AsyncLLM(api_key=None, client=fake_client(0.3))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        response = await llm.complete(model="llama3-70b-8192")
+        tick_task.cancel()
+        return response, ticks
+
+    response, ticks = asyncio.run(scenario())
+    assert response.model == "llama3-70b-8192"
+    assert ticks >= 10
+
+def test_cancel_aborts_inflight_request():
+    async def scenario():
+        llm = AsyncLLM(api_key=None, client=fake_client(5))
+        asyncio.get_running_loop().call_later(0.1, llm.cancel)
+        start = time.perf_counter()
+        try:
+            await llm.complete(model="llama3-70b-8192")
+        except LLMCancelled:
+            return time.perf_counter() - start, llm.busy
+        raise AssertionError("request was not cancelled")
+
+    elapsed, busy = asyncio.run(scenario())
+    assert elapsed < 1
+    assert not busy
+
+def test_caller_cancellation_propagates():
+    async def scenario():
+        llm = AsyncLLM(api_key=None, client=fake_client(5))
+        task = asyncio.create_task(llm.complete(model="llama3-70b-8192"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            await asyncio.sleep(0)
+            return llm.busy
+        raise AssertionError("caller was not cancelled")
+
+    assert asyncio.run(scenario()) is False
+
+def test_barge_in_stops_the_answer_stream():
+    async def scenario():
+        state = AssistantState()
+        tts = SpeakingTTS(state)
+        completions = EndlessStream()
+        history = SimpleNamespace(system_messages=lambda: [], tail=lambda n: [], append=lambda *entries: None)
+        services = Services(
+            llm=AsyncLLM(api_key=None, client=SimpleNamespace(chat=SimpleNamespace(completions=completions))),
+            tts=tts, realtime_info=SimpleNamespace(perform_search=None), history=history, config={},
+        )
+        model = OrionModel(services=services)
+        stt = FastNaturalSpeechRecognition(
+            tts=tts, state=state, source=object(), backend=LocalStubRecognizer([]), workers=1, vad=False,
+        )
+        stt.on_barge_in = lambda: model.cancel_threadsafe(stt.loop)  # wired like main.voice_loop
+
+        answer = asyncio.create_task(model.Chatbot.process_query("tell me a long story"))
+        while not state.speaking:
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(stt._deliver, "stop")  # the pool thread hands over a new phrase
+        reply = await asyncio.wait_for(answer, 1)
+        sent = completions.sent
+        await asyncio.sleep(0.1)
+        stt.pool.close()
+        return reply, sent, completions.sent, tts.stopped, model.llm.busy
+
+    reply, sent, sent_later, stopped, busy = asyncio.run(scenario())
+    assert reply == "🛑 Request cancelled."
+    assert sent_later == sent  # no chunk is read after the barge-in
+    assert stopped >= 1 and not busy
+
+if __name__ == "__main__":
+    test_loop_stays_responsive_during_request()
+    test_cancel_aborts_inflight_request()
+    test_caller_cancellation_propagates()
+    test_barge_in_stops_the_answer_stream()
@@ -0,0 +1,123 @@
+import asyncio
+import time
+import numpy as np
+from Backend.AudioOutput import AudioOutput, NullDevice
+from Backend.State import AssistantState
+from Backend.TTS import OrionTTS
+
+RATE = 16000
+
+def null_output(speed=1.0):
+    devices = []
+
+    def factory(samplerate, channels, blocksize, callback):
+        devices.append(NullDevice(samplerate, channels, blocksize, callback, speed=speed))
+        return devices[-1]
+
+    return AudioOutput(blocksize=256, device_factory=factory), devices
+
+def ramp(seconds, start=0.1):
+    return np.linspace(start, start + 0.1, int(RATE * seconds), dtype='float32')
+
+def test_segments_play_in_order_on_one_stream():
+    output, devices = null_output(speed=4.0)
+
+    async def run():
+        a, b = ramp(0.2, 0.1), ramp(0.1, 0.5)
+        results = await asyncio.gather(output.play(a, RATE), output.play(b, RATE))
+        return a, b, results
+
+    a, b, results = asyncio.run(run())
+    output.close()
+    assert results == [True, True]
+    assert len(devices) == 1
+    samples = devices[0].samples()
+    assert np.allclose(samples[samples != 0], np.concatenate([a, b]))
+
+def test_playback_does_not_block_the_event_loop():
+    output, _ = null_output()
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        task = asyncio.create_task(ticker())
+        await output.play(ramp(0.3), RATE)
+        task.cancel()
+
+    asyncio.run(run())
+    output.close()
+    assert len(ticks) > 10
+
+def test_cancel_stops_current_and_queued_segments():
+    output, devices = null_output()
+
+    async def run():
+        first = asyncio.create_task(output.play(ramp(2.0), RATE))
+        second = asyncio.create_task(output.play(ramp(2.0), RATE))
+        await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        output.cancel()
+        results = await asyncio.gather(first, second)
+        return results, time.perf_counter() - start
+
+    results, waited = asyncio.run(run())
+    output.close()
+    assert results == [False, False]
+    assert waited < 0.1
+    assert len(devices[0].samples()) < RATE  # far less than the 4 s queued
+
+def test_cancelling_the_awaiting_task_drops_its_segment():
+    output, _ = null_output()
+
+    async def run():
+        task = asyncio.create_task(output.play(ramp(2.0), RATE))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return output.busy
+
+    assert asyncio.run(run()) is False
+    output.close()
+
+def test_int16_and_other_rates_are_converted():
+    output, devices = null_output(speed=4.0)
+
+    async def run():
+        await output.play(ramp(0.1), RATE)
+        await output.play(np.full(RATE // 20, 16384, dtype='int16'), RATE // 2)
+
+    asyncio.run(run())
+    output.close()
+    samples = devices[0].samples()
+    samples = samples[samples != 0]
+    assert output.samplerate == RATE
+    assert len(samples) == RATE // 5  # the 8 kHz tenth of a second was resampled to 16 kHz
+    assert np.allclose(samples[-100:], 0.5)
+
+def test_tts_stop_interrupts_playback_immediately():
+    output, _ = null_output()
+    state = AssistantState()
+    tts = OrionTTS(engine="gtts", state=state, output=output)
+
+    async def run():
+        speaking = asyncio.create_task(tts._play_pcm(ramp(2.0), RATE))
+        await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        tts.stop()  # what a barge-in does from the STT thread
+        played = await speaking
+        return played, time.perf_counter() - start
+
+    played, waited = asyncio.run(run())
+    output.close()
+    assert played is False and waited < 0.1
+
+if __name__ == "__main__":
+    test_segments_play_in_order_on_one_stream()
+    test_cancel_stops_current_and_queued_segments()
@@ -0,0 +1,38 @@
+import json
+from Brain.ChatHistory import ChatHistoryStore
+
+def make_legacy(tmp_path, turns):
+    legacy = tmp_path / "ChatHistory.json"
+    history = [{"role": "system", "content": "You are Orion, assistant of {user}."}]
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i}"})
+        history.append({"role": "assistant", "content": f"answer {i} ✨"})
+    legacy.write_text(json.dumps(history, indent=4, ensure_ascii=False), encoding="utf-8")
+    return legacy
+
+def test_migrates_legacy_json_once(tmp_path):
+    legacy = make_legacy(tmp_path, 3)
+    store = ChatHistoryStore(path=str(tmp_path / "ChatHistory.jsonl"), legacy_path=str(legacy))
+    assert store.system_messages() == [{"role": "system", "content": "You are Orion, assistant of {user}."}]
+    assert [m["content"] for m in store.tail(2)] == ["question 2", "answer 2 ✨"]
+
+    # 🔹 A second store must not re-import the legacy file
+    store.append({"role": "user", "content": "new"})
+    again = ChatHistoryStore(path=str(tmp_path / "ChatHistory.jsonl"), legacy_path=str(legacy))
+    assert len(again.tail(100)) == 7
+
+def test_tail_spans_blocks(tmp_path):
+    legacy = make_legacy(tmp_path, 200)
+    store = ChatHistoryStore(path=str(tmp_path / "ChatHistory.jsonl"), legacy_path=str(legacy), block_size=64)
+    tail = store.tail(6)
+    assert [m["content"] for m in tail] == [
+        "question 197", "answer 197 ✨", "question 198", "answer 198 ✨", "question 199", "answer 199 ✨"
+    ]
+    assert len(store.tail(1000)) == 400
+
+def test_append_skips_system_and_starts_empty(tmp_path):
+    store = ChatHistoryStore(path=str(tmp_path / "ChatHistory.jsonl"), legacy_path=str(tmp_path / "missing.json"))
+    assert store.tail(6) == []
+    store.append({"role": "system", "content": "ignored"}, {"role": "user", "content": "hi"})
+    assert store.system_messages() == []
+    assert store.tail(6) == [{"role": "user", "content": "hi"}]
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from Brain.model import OrionModel
+
+def call(name, **arguments):
+    return SimpleNamespace(function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+class SlowRealtime:
+    async def perform_search(self, query, **kwargs):
+        await asyncio.sleep(0.2)
+        if query == "broken":
+            raise RuntimeError("search backend down")
+        return f"results for {query}"
+
+class RecordingChatbot:
+    def __init__(self):
+        self.queries = []
+        self.search_results = []
+
+    async def handle_query(self, query, contexts=["General"], search_results=()):
+        self.queries.append(query)
+        self.search_results.append(list(search_results))
+        return f"answer {len(self.queries)}"
+
+def make_model():
+    model = OrionModel.__new__(OrionModel)
+    model.realtime_info = SlowRealtime()
+    model.Chatbot = RecordingChatbot()
+
+    async def stop():
+        await asyncio.sleep(0.2)
+        return "stopped"
+
+    model.function_map = {"Chatbot": model.Chatbot.handle_query, "Stop": stop}
+    return model
+
+def test_searches_run_concurrently_and_feed_chatbot():
+    model = make_model()
+    tool_calls = [
+        call("Chatbot", query="news and weather", contexts=["general"]),
+        call("Search", query="latest news"),
+        call("Search", query="broken"),
+        call("Stop"),
+        call("Search", query="weather radar"),
+    ]
+    start = time.perf_counter()
+    result = asyncio.run(model._dispatch(tool_calls))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.4  # three searches and Stop overlap instead of 0.8s in sequence
+    assert result == "answer 1\nstopped"
+    assert model.Chatbot.queries[0] == "news and weather"  # the query itself is passed on unchanged
+    first, broken, last = model.Chatbot.search_results[0]
+    assert "latest news" in first and "search backend down" in broken and "weather radar" in last
+
+def test_bad_arguments_are_isolated():
+    model = make_model()
+    bad = SimpleNamespace(function=SimpleNamespace(name="Stop", arguments="{not json"))
+    result = asyncio.run(model._dispatch([bad, call("Chatbot", query="hi", contexts=["general"])]))
+    lines = result.split("\n")
+    assert lines[0].startswith("❌ Invalid JSON in arguments for Stop")
+    assert lines[1] == "answer 1"
+
+if __name__ == "__main__":
+    test_searches_run_concurrently_and_feed_chatbot()
+    test_bad_arguments_are_isolated()
@@ -0,0 +1,51 @@
+from Backend.HTMLExtractor import ParagraphExtractor, is_html
+
+LONG = "Orion found this paragraph, and it is comfortably longer than the minimum length. "
+
+def feed_all(html, chunk, **kwargs):
+    parser = ParagraphExtractor(**kwargs)
+    raw = html.encode("utf-8")
+    for start in range(0, len(raw), chunk):
+        if parser.feed_bytes(raw[start:start + chunk]):
+            break
+    return parser
+
+def test_stops_at_first_long_paragraph():
+    html = f"<p>short</p><p>{LONG}</p>" + "<p>never read</p>" * 5000
+    parser = feed_all(html, 1024, min_length=40)
+    assert parser.finish() == LONG.strip()
+    assert parser.bytes_read < 4096
+
+def test_multibyte_text_survives_tiny_chunks():
+    html = f"<p>Café “Orion” — {LONG}</p>"
+    assert feed_all(html, 1, min_length=40).finish() == f"Café “Orion” — {LONG}".strip()
+
+def test_scripts_and_nested_tags():
+    html = (f"<script>var p = '<p>{LONG}</p>';</script>"
+            f"<p>Read <b>this</b> &amp; <a href='#'>that</a>: {LONG}</p>")
+    assert feed_all(html, 7, min_length=40).finish() == f"Read this & that: {LONG}".strip()
+
+def test_unclosed_paragraphs_end_at_next_block():
+    html = f"<p>intro<p>{LONG}<div>footer text that is not part of it</div>"
+    assert feed_all(html, 16, min_length=40).finish() == LONG.strip()
+
+def test_byte_cap():
+    html = "<div>" + "x" * 10000 + f"</div><p>{LONG}</p>"
+    parser = feed_all(html, 1024, min_length=40, max_bytes=4096)
+    assert parser.done and parser.bytes_read == 4096
+    assert parser.finish() is None
+
+def test_content_types():
+    assert is_html("text/html; charset=utf-8")
+    assert is_html("application/xhtml+xml")
+    assert is_html(None)
+    assert not is_html("application/pdf")
+    assert not is_html("image/jpeg")
+
+if __name__ == "__main__":
+    test_stops_at_first_long_paragraph()
+    test_multibyte_text_survives_tiny_chunks()
+    test_scripts_and_nested_tags()
+    test_unclosed_paragraphs_end_at_next_block()
+    test_byte_cap()
+    test_content_types()
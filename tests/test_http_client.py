@@ -0,0 +1,49 @@
+import asyncio
+import pytest
+from aiohttp import web
+from Backend import HTTPClient
+from Backend.RealtimeData import RealTimeInformation
+
+PARAGRAPH = "<p>" + "A paragraph long enough to be picked up by scrape_summary in Orion. " * 2 + "</p>"
+
+pytestmark = pytest.mark.usefixtures("isolated_caches")
+
+def test_repeat_calls_reuse_connection():
+    async def scenario():
+        peers = []
+
+        async def page(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.Response(text=f"<html>{PARAGRAPH}</html>", content_type="text/html")
+
+        app = web.Application()
+        app.router.add_get("/page", page)
+        runner = web.AppRunner(app, shutdown_timeout=0.1)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        realtime_info = RealTimeInformation()
+        try:
+            for n in range(3):
+                summary = await realtime_info.scrape_summary(f"http://127.0.0.1:{port}/page?n={n}")
+                assert summary
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+        return peers
+
+    peers = asyncio.run(scenario())
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+def test_new_event_loop_gets_fresh_session():
+    first = asyncio.run(HTTPClient.startup())
+    second = asyncio.run(HTTPClient.startup())
+    assert first is not second
+    asyncio.run(HTTPClient.shutdown())
+
+if __name__ == "__main__":
+    test_repeat_calls_reuse_connection()
+    test_new_event_loop_gets_fresh_session()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import time
+from Backend import RealtimeData
+from Backend.RealtimeData import LocationCache, RealTimeInformation
+
+KARACHI = {"city": "Karachi", "region": "Sindh", "country": "Pakistan",
+           "latitute": 24.86, "longitude": 67.01, "timezone": "Asia/Karachi"}
+
+def test_entry_persists_across_instances(tmp_path):
+    path = str(tmp_path / "location_cache.json")
+    LocationCache(path=path).store("1.2.3.4", KARACHI)
+    reloaded = LocationCache(path=path)
+    assert reloaded.get() == KARACHI
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["ip"] == "1.2.3.4"
+
+def test_malformed_file_is_ignored(tmp_path):
+    path = tmp_path / "location_cache.json"
+    for content in ("[]", "null", "42", '{"ip": "1.2.3.4"}', "{not json"):
+        path.write_text(content, encoding="utf-8")
+        assert LocationCache(path=str(path)).get() is None
+
+def test_ttl_and_ip_change_invalidate(tmp_path):
+    cache = LocationCache(path=str(tmp_path / "location_cache.json"), ttl=60)
+    cache.store("1.2.3.4", KARACHI)
+    assert cache.confirm("1.2.3.4") and cache.get() == KARACHI
+    cache.entry["fetched_at"] = time.time() - 120
+    assert cache.get() is None
+    cache.store("1.2.3.4", KARACHI)
+    assert not cache.confirm("5.6.7.8")
+    assert cache.get() is None
+
+def test_concurrent_callers_share_one_lookup(tmp_path):
+    original = RealtimeData.location_cache
+    RealtimeData.location_cache = LocationCache(path=str(tmp_path / "location_cache.json"))
+    lookups = 0
+
+    async def fake_fetch(self, revalidate=False):
+        nonlocal lookups
+        lookups += 1
+        await asyncio.sleep(0.05)
+        RealtimeData.location_cache.store("1.2.3.4", KARACHI)
+        return KARACHI
+
+    async def scenario():
+        first, second = RealTimeInformation(), RealTimeInformation()
+        results = await asyncio.gather(first.get_location_info(), second.get_time_info())
+        # 🔹 Served from the cache now, no further lookups
+        await first.get_location_info()
+        return results
+
+    original_fetch = RealTimeInformation._fetch_location
+    RealTimeInformation._fetch_location = fake_fetch
+    try:
+        location_info, time_info = asyncio.run(scenario())
+    finally:
+        RealTimeInformation._fetch_location = original_fetch
+        RealtimeData.location_cache = original
+
+    assert lookups == 1
+    assert "Karachi" in location_info
+    assert "Asia/Karachi" in time_info
+
+if __name__ == "__main__":
+    import pathlib, tempfile
+    for test in (test_entry_persists_across_instances, test_ttl_and_ip_change_invalidate,
+                 test_concurrent_callers_share_one_lookup):
+        test(pathlib.Path(tempfile.mkdtemp()))
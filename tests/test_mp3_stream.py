@@ -0,0 +1,92 @@
+import asyncio
+import io
+import time
+import numpy as np
+import pytest
+import soundfile as sf
+from Backend.AudioCache import AudioCache
+from Backend.AudioOutput import AudioOutput, NullDevice
+from Backend.MP3Stream import MP3StreamDecoder, decode_mp3
+from Backend.State import AssistantState
+from Backend.TTS import OrionTTS
+
+RATE = 24000
+pytestmark = pytest.mark.skipif("MP3" not in sf.available_formats(), reason="libsndfile without MP3 support")
+
+def make_mp3(seconds, constant=True):
+    t = np.arange(int(RATE * seconds)) / RATE
+    signal = (0.3 * np.sin(2 * np.pi * 440 * t) * np.sin(2 * np.pi * 0.5 * t)).astype('float32')
+    buffer = io.BytesIO()
+    options = {"bitrate_mode": "CONSTANT", "compression_level": 0.5} if constant else {}
+    sf.write(buffer, signal, RATE, format='MP3', **options)
+    return buffer.getvalue()
+
+def decode_in_pieces(mp3, size):
+    decoder = MP3StreamDecoder()
+    parts = [decoder.feed(mp3[i:i + size]) for i in range(0, len(mp3), size)]
+    parts.append(decoder.flush())
+    return decoder, parts
+
+def test_incremental_decode_matches_whole_stream():
+    mp3 = make_mp3(2.0)
+    reference, parts = decode_in_pieces(mp3, len(mp3))
+    whole = np.concatenate(parts)
+    for size in (100, 700, 5000):
+        decoder, parts = decode_in_pieces(mp3, size)
+        assert not decoder.variable_bitrate
+        assert sum(1 for p in parts if len(p)) > 3  # audio came out before the end
+        assert np.allclose(np.concatenate(parts), whole, atol=1e-6)
+    assert reference.samplerate == RATE
+
+def test_variable_bitrate_falls_back_to_one_decode():
+    mp3 = make_mp3(2.0, constant=False)
+    decoder, parts = decode_in_pieces(mp3, 700)
+    expected, _ = sf.read(io.BytesIO(mp3), dtype='float32')
+    assert decoder.variable_bitrate
+    assert np.allclose(np.concatenate(parts), expected, atol=1e-6)
+
+def slow_source(mp3, chunk_size=480, delay=0.01):
+    async def chunks(text):
+        for i in range(0, len(mp3), chunk_size):
+            await asyncio.sleep(delay)
+            yield mp3[i:i + chunk_size]
+    return chunks
+
+def make_tts(tmp_path, mp3):
+    def device(samplerate, channels, blocksize, callback):
+        return NullDevice(samplerate, channels, blocksize, callback, speed=20.0)
+    output = AudioOutput(device_factory=device)
+    tts = OrionTTS(engine="edge", state=AssistantState(), cache=AudioCache(str(tmp_path)), output=output)
+    tts._mp3_edge_tts = slow_source(mp3)
+    return tts
+
+def time_to_first_audio(tmp_path, seconds):
+    tts = make_tts(tmp_path, make_mp3(seconds))
+
+    async def run():
+        start = time.time()
+        await tts.speak(f"{seconds} seconds of speech")
+        return tts.first_audio_at - start, time.time() - start
+
+    first_audio, total = asyncio.run(run())
+    tts.output.close()
+    return first_audio, total
+
+def test_first_audio_does_not_scale_with_reply_length(tmp_path):
+    short_first, _ = time_to_first_audio(tmp_path / "short", 1.0)
+    long_first, long_total = time_to_first_audio(tmp_path / "long", 8.0)
+    assert long_first < long_total / 3
+    assert long_first < short_first + 0.15
+
+def test_streamed_speech_is_cached_for_next_time(tmp_path):
+    mp3 = make_mp3(1.0)
+    tts = make_tts(tmp_path, mp3)
+    asyncio.run(tts.speak("cache me"))
+    tts.output.close()
+    expected = asyncio.run(decode_mp3(slow_source(mp3, delay=0)("cache me")))[0]
+    data, rate = tts.cache.get(tts.cache.key("edge", tts.voice, "cache me"))
+    assert rate == RATE and np.allclose(data, expected, atol=1e-6)
+
+if __name__ == "__main__":
+    test_incremental_decode_matches_whole_stream()
+    test_variable_bitrate_falls_back_to_one_decode()
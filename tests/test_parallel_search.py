@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+import time
+from aiohttp import web
+from Backend import RealtimeData, HTTPClient
+from Backend.RealtimeData import RealTimeInformation
+
+PARAGRAPH = "<p>" + "Orion scrapes this paragraph because it is long enough to count. " * 3 + "</p>"
+
+pytestmark = pytest.mark.usefixtures("isolated_caches")
+
+async def start_server():
+    async def fast(request):
+        return web.Response(text=f"<html><body>{PARAGRAPH}</body></html>", content_type="text/html")
+
+    async def slow(request):
+        await asyncio.sleep(5)
+        return web.Response(text=f"<html><body>{PARAGRAPH}</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/fast/{n}", fast)
+    app.router.add_get("/slow/{n}", slow)
+    runner = web.AppRunner(app, shutdown_timeout=0.1)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+async def no_wiki(session, wiki_url):
+    return None
+
+async def run_search(links, wiki=no_wiki, **kwargs):
+    realtime_info = RealTimeInformation(**kwargs)
+    realtime_info._fetch_wiki_summary = wiki
+    original_search = RealtimeData.search
+    RealtimeData.search = lambda query, num_results, lang: links
+    try:
+        start = time.perf_counter()
+        result = await realtime_info.perform_search("orion", max_results=2)
+        return result, time.perf_counter() - start
+    finally:
+        RealtimeData.search = original_search
+
+def test_early_return_skips_slow_pages():
+    async def scenario():
+        runner, base = await start_server()
+        try:
+            links = [f"{base}/slow/1", f"{base}/fast/1", f"{base}/fast/2", f"{base}/slow/2"]
+            return await run_search(links)
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+
+    result, elapsed = asyncio.run(scenario())
+    assert elapsed < 3
+    assert result.count("🔗") == 2
+    assert "/fast/1" in result and "/fast/2" in result
+
+def test_slow_wikipedia_does_not_hold_the_early_return():
+    async def slow_wiki(session, wiki_url):
+        await asyncio.sleep(5)
+        return "Orion is a constellation."
+
+    async def scenario():
+        runner, base = await start_server()
+        try:
+            return await run_search([f"{base}/fast/1", f"{base}/fast/2"], wiki=slow_wiki, wiki_grace=0.2)
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+
+    result, elapsed = asyncio.run(scenario())
+    assert elapsed < 1.5
+    assert result.count("🔗") == 2 and "Wikipedia" not in result
+
+def test_deadline_bounds_whole_search():
+    async def scenario():
+        runner, base = await start_server()
+        try:
+            links = [f"{base}/slow/{n}" for n in range(4)]
+            return await run_search(links, search_deadline=1.0)
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+
+    result, elapsed = asyncio.run(scenario())
+    assert elapsed < 2
+    assert "Summary not available" in result
+
+if __name__ == "__main__":
+    test_early_return_skips_slow_pages()
+    test_deadline_bounds_whole_search()
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+from Brain.ChatBot import Chatbot
+from Brain.Prompt import PromptBuilder, estimate_tokens, message_tokens, search_snippets
+
+SYSTEM = [{"role": "system", "content": "You are Orion, a voice assistant for {user}."}]
+
+SEARCH_RESULT = """🔍 Search Results for 'mars rover':
+
+🔗 https://example.com/rover
+📜 The Mars rover landed in Jezero crater in 2021. It collects rock samples. Cookies help us improve this site.
+
+🔗 https://example.com/dead
+📜 Summary not available
+
+🔗 https://mirror.example.com/rover
+📜 The Mars rover landed in Jezero crater in 2021! Subscribe to our newsletter for weekly deals.
+
+📘 Wikipedia Summary:
+Perseverance is a car-sized Mars rover designed to explore Jezero crater."""
+
+def long_history(turns=40, words=120):
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i} " + "word " * words})
+        history.append({"role": "assistant", "content": f"answer {i} " + "reply " * words})
+    return history
+
+def test_token_estimate_is_close_to_four_characters_a_token():
+    text = "Orion keeps every request under its token budget, whatever the pages it scraped contain."
+    assert 0.7 < estimate_tokens(text) / (len(text) / 4) < 1.5
+    assert estimate_tokens("") == 0
+
+def test_search_results_are_split_into_snippets():
+    snippets = search_snippets(SEARCH_RESULT)
+    assert [source for source, _ in snippets] == [
+        "https://example.com/rover", "https://mirror.example.com/rover", "Wikipedia",
+    ]
+    assert search_snippets("❌ Error during search: timeout") == [(None, "❌ Error during search: timeout")]
+
+def test_request_stays_within_budget_with_huge_pages():
+    builder = PromptBuilder(budget=1500, reply_tokens=300)
+    pages = [(f"https://site{i}.example", "The rover found ancient river beds. " +
+              " ".join(f"Page {i} line {k} lists topic{k} and item{k * 7} and note{k * 13}." for k in range(400)))
+             for i in range(5)]
+    messages, report = builder.build(SYSTEM, long_history(), "what did the mars rover find", "Time: 10:00", pages)
+    assert report["total"] == message_tokens(messages)
+    assert report["total"] <= 1500 - 300
+    assert report["history_dropped"] > 0 and report["sentences_dropped"] > 0
+    assert messages[0] == SYSTEM[0] and messages[-1]["role"] == "user"
+    assert messages[1]["role"] == "user"  # history never starts on an orphaned answer
+    assert "what did the mars rover find" in messages[-1]["content"]
+
+def test_snippets_are_deduplicated_and_ranked_by_relevance():
+    builder = PromptBuilder()
+    search, selection = builder.select("where did the mars rover land", search_snippets(SEARCH_RESULT), 40)
+    assert selection["duplicates"] == 1
+    assert search.count("landed in Jezero crater") == 1
+    assert "Cookies" not in search and "newsletter" not in search  # irrelevant sentences lose out
+    assert search.index("[1] https://example.com/rover") < search.index("Wikipedia")
+
+def test_plain_chat_is_just_the_query():
+    messages, report = PromptBuilder().build(SYSTEM, [], "hello there")
+    assert messages[-1] == {"role": "user", "content": "hello there"}
+    assert report["search"] == 0 and report["context"] == 0
+
+def test_chatbot_builds_budgeted_messages():
+    history = SimpleNamespace(system_messages=lambda: [dict(m) for m in SYSTEM], tail=lambda n: long_history()[-n:])
+    services = SimpleNamespace(
+        llm=None, tts=None, realtime_info=None, history=history, config={"user": "Ada", "prompt_budget": 800},
+    )
+    bot = Chatbot(services)
+    messages = bot.build_messages("what did the rover find", snippets=search_snippets(SEARCH_RESULT))
+    assert messages[0]["content"] == "You are Orion, a voice assistant for Ada."
+    assert message_tokens(messages) <= 800
+    assert "Jezero" in messages[-1]["content"]
+    assert bot.prompt.stats()["requests"] == 1
+
+if __name__ == "__main__":
+    test_token_estimate_is_close_to_four_characters_a_token()
+    test_search_results_are_split_into_snippets()
+    test_request_stays_within_budget_with_huge_pages()
+    test_snippets_are_deduplicated_and_ranked_by_relevance()
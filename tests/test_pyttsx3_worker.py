@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+import numpy as np
+import soundfile as sf
+from Backend.AudioCache import AudioCache
+from Backend.State import AssistantState
+from Backend.SynthWorker import Pyttsx3Worker
+from Backend.TTS import OrionTTS
+
+SYNTH_DELAY = 0.1
+PLAY_DELAY = 0.1
+
+class FakeEngine:
+    """Stands in for pyttsx3: writes one short tone per sentence."""
+
+    def __init__(self, flush_late=False):
+        self.flush_late = flush_late
+        self.jobs = []
+
+    def save_to_file(self, text, path):
+        self.jobs.append((text, path))
+
+    def runAndWait(self):
+        time.sleep(SYNTH_DELAY)
+        for text, path in self.jobs:
+            samples = np.full(len(text) * 10, 0.1, dtype='float32')
+            write = lambda: sf.write(path, samples, 16000, format='WAV')
+            if self.flush_late:
+                threading.Timer(0.05, write).start()
+            else:
+                write()
+        self.jobs = []
+
+def make_worker(tmp_path, engines, **kwargs):
+    def factory():
+        engines.append(FakeEngine(**kwargs))
+        return engines[-1]
+    return Pyttsx3Worker(engine_factory=factory, scratch_dir=str(tmp_path))
+
+def test_one_engine_serves_queued_requests_in_order(tmp_path):
+    engines = []
+    worker = make_worker(tmp_path, engines)
+    futures = [worker.submit(text) for text in ("one", "three", "sentence five")]
+    results = [f.result(timeout=5) for f in futures]
+    worker.close()
+    assert len(engines) == 1
+    assert [len(data) for data, rate in results] == [30, 50, 130]
+    assert all(rate == 16000 for data, rate in results)
+    assert list(tmp_path.iterdir()) == []  # scratch file removed
+
+def test_waits_for_late_flush_without_fixed_sleep(tmp_path):
+    worker = make_worker(tmp_path, [], flush_late=True)
+    data, rate = worker.submit("late file").result(timeout=5)
+    worker.close()
+    assert len(data) == 90
+
+def test_cancelled_requests_are_skipped(tmp_path):
+    engines = []
+    worker = make_worker(tmp_path, engines)
+    first = worker.submit("first")
+    dropped = worker.submit("dropped")
+    dropped.cancel()
+    first.result(timeout=5)
+    worker.submit("last").result(timeout=5)
+    worker.close()
+    assert worker.synthesized == 2
+
+def test_stream_synthesizes_next_sentence_during_playback(tmp_path):
+    engines = []
+    tts = OrionTTS(engine="pyttsx3", state=AssistantState(), cache=AudioCache(str(tmp_path / "tts")))
+    tts._offline_worker = make_worker(tmp_path, engines)
+    played = []
+
+    async def fake_play(data, samplerate):
+        await asyncio.sleep(PLAY_DELAY)
+        played.append(len(data))
+
+    tts._play_pcm = fake_play
+
+    async def run():
+        sentences = asyncio.Queue()
+        for sentence in ("aaaa", "bbbbbbbb", "cccccccccccc", None):
+            sentences.put_nowait(sentence)
+        start = time.perf_counter()
+        await tts.speak_stream(sentences)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    tts.offline_worker.close()
+    assert played == [40, 80, 120]
+    # Sequential synth + play would take 3 * (SYNTH_DELAY + PLAY_DELAY)
+    assert elapsed < 3 * (SYNTH_DELAY + PLAY_DELAY) - 0.1
+    assert not tts._isruning()
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    test_stream_synthesizes_next_sentence_during_playback(pathlib.Path(tempfile.mkdtemp()))
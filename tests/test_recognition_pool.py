@@ -0,0 +1,71 @@
+import threading
+import time
+from Backend.RecognitionPool import RecognitionPool
+
+class Collector:
+    def __init__(self, expected):
+        self.results = []
+        self.expected = expected
+        self.done = threading.Event()
+
+    def __call__(self, result):
+        self.results.append(result)
+        if len(self.results) == self.expected:
+            self.done.set()
+
+def delayed(audio):
+    """audio is (text, seconds): the later phrases finish first."""
+    text, seconds = audio
+    time.sleep(seconds)
+    if text == "boom":
+        raise RuntimeError("recognizer failed")
+    return text
+
+def test_results_arrive_in_capture_order_while_running_in_parallel():
+    collector = Collector(3)
+    pool = RecognitionPool(delayed, collector, workers=3)
+    start = time.monotonic()
+    for phrase in [("first", 0.3), ("second", 0.1), ("third", 0.0)]:
+        pool.submit(phrase)
+    assert collector.done.wait(5)
+    elapsed = time.monotonic() - start
+    pool.close()
+    assert collector.results == ["first", "second", "third"]
+    assert elapsed < 0.35  # not 0.4 s of sequential recognition
+
+def test_errors_are_delivered_in_place():
+    collector = Collector(2)
+    pool = RecognitionPool(delayed, collector, workers=2)
+    pool.submit(("boom", 0.05))
+    pool.submit(("after", 0.0))
+    assert collector.done.wait(5)
+    pool.close()
+    assert isinstance(collector.results[0], RuntimeError)
+    assert collector.results[1] == "after"
+
+def test_overflow_drops_the_oldest_waiting_phrase():
+    gate = threading.Event()
+
+    def blocked(audio):
+        gate.wait(5)
+        return audio
+
+    collector = Collector(3)
+    pool = RecognitionPool(blocked, collector, workers=1, max_pending=2)
+    pool.submit("busy")
+    time.sleep(0.05)  # the only worker is now stuck on "busy"
+    for phrase in ("old", "newer", "newest"):
+        pool.submit(phrase)
+    assert pool.depth == 2
+    gate.set()
+    assert collector.done.wait(5)
+    pool.close()
+    assert collector.results == ["busy", "newer", "newest"]
+    stats = pool.stats()
+    assert stats["dropped"] == 1 and stats["delivered"] == 3 and stats["submitted"] == 4
+    assert stats["max_queue_depth"] == 2
+    assert stats["latency_p50_ms"] > 0 and stats["queue_depth"] == 0
+
+if __name__ == "__main__":
+    test_results_arrive_in_capture_order_while_running_in_parallel()
+    test_overflow_drops_the_oldest_waiting_phrase()
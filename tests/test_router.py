@@ -0,0 +1,34 @@
+import json
+import os
+from Brain.Router import FastRouter
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "data", "router_utterances.jsonl")
+
+def test_labeled_utterances_never_misroute():
+    router = FastRouter()
+    with open(DATA, encoding="utf-8") as f:
+        samples = [json.loads(line) for line in f if line.strip()]
+    for sample in samples:
+        calls = router.route(sample["text"])
+        if sample["expected"] is None:
+            assert calls is None, sample["text"]
+            continue
+        if calls is None:
+            continue  # Falling back to the LLM is always safe
+        name = calls[0].function.name
+        if name == "Chatbot":
+            name += ":" + ",".join(json.loads(calls[0].function.arguments)["contexts"])
+        assert name == sample["expected"], sample["text"]
+
+def test_routed_calls_look_like_llm_tool_calls():
+    calls = FastRouter().route("Orion, what's the weather?")
+    assert len(calls) == 1
+    assert calls[0].function.name == "Chatbot"
+    assert json.loads(calls[0].function.arguments) == {
+        "query": "Orion, what's the weather?", "contexts": ["weather"]
+    }
+    assert json.loads(FastRouter().route("bye Orion")[0].function.arguments) == {}
+
+if __name__ == "__main__":
+    test_labeled_utterances_never_misroute()
+    test_routed_calls_look_like_llm_tool_calls()
@@ -0,0 +1,92 @@
+import asyncio
+import json
+from types import SimpleNamespace
+import Brain.model
+from Brain.model import OrionModel
+from Brain.Router import RouteCache
+from Brain.Services import Services
+
+def tool_call(name, **arguments):
+    return SimpleNamespace(function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+class RoutingLLM:
+    """Answers every routing request with a Chatbot call for the utterance."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def complete(self, messages, **kwargs):
+        self.requests.append(messages)
+        query = messages[-1]["content"]
+        message = SimpleNamespace(tool_calls=[tool_call("Chatbot", query=query, contexts=["general"])])
+        return SimpleNamespace(choices=[SimpleNamespace(finish_reason="tool_calls", message=message)])
+
+def make_model(**kwargs):
+    llm = RoutingLLM()
+    services = Services(
+        llm=llm, tts=object(), realtime_info=SimpleNamespace(perform_search=None), history=object(), config={},
+    )
+    model = OrionModel(services=services, **kwargs)
+    dispatched = []
+
+    async def dispatch(tool_calls):
+        dispatched.append([(c.function.name, json.loads(c.function.arguments)) for c in tool_calls])
+        return "ok"
+
+    model._dispatch = dispatch
+    return model, llm, dispatched
+
+def test_repeated_utterance_skips_the_routing_call():
+    model, llm, dispatched = make_model()
+    asyncio.run(model.handle("Tell me a joke about cats"))
+    asyncio.run(model.handle("tell me a joke about cats!"))
+    assert len(llm.requests) == 1
+    # The replayed plan carries the new wording of the query
+    assert dispatched[1] == [("Chatbot", {"query": "tell me a joke about cats!", "contexts": ["general"]})]
+    stats = model.routing_stats()
+    assert stats["llm_calls"] == 1 and stats["hits"] == 1 and stats["hit_rate"] == 0.5
+
+def test_routing_prefix_is_built_once(monkeypatch):
+    model, llm, _ = make_model()
+    dumps = []
+    monkeypatch.setattr(Brain.model, "json", SimpleNamespace(dumps=lambda *a, **k: dumps.append(a), loads=json.loads))
+    asyncio.run(model.handle("who wrote hamlet"))
+    assert dumps == []
+    assert all(a is b for a, b in zip(llm.requests[0], model.routing_prefix))
+    assert llm.requests[0][-1] == {"role": "user", "content": "who wrote hamlet"}
+
+def test_least_recently_used_decision_is_evicted():
+    model, llm, _ = make_model(route_cache_size=2)
+    for text in ("who wrote hamlet", "who painted the mona lisa", "who wrote hamlet", "how far is the moon"):
+        asyncio.run(model.handle(text))
+    assert len(llm.requests) == 3
+    asyncio.run(model.handle("Who wrote Hamlet?"))  # used recently, still cached
+    assert len(llm.requests) == 3
+    asyncio.run(model.handle("who painted the mona lisa"))  # evicted by "how far is the moon"
+    assert len(llm.requests) == 4
+
+def test_plan_with_odd_arguments_is_still_dispatched():
+    model, llm, dispatched = make_model()
+
+    async def null_arguments(messages, **kwargs):
+        message = SimpleNamespace(tool_calls=[SimpleNamespace(function=SimpleNamespace(name="Stop", arguments="null"))])
+        return SimpleNamespace(choices=[SimpleNamespace(finish_reason="tool_calls", message=message)])
+
+    llm.complete = null_arguments
+    assert asyncio.run(model.handle("please go quiet now")) == "ok"
+    assert dispatched == [[("Stop", None)]] and len(model.routes.cache) == 0
+
+def test_undispatchable_plans_are_not_cached():
+    routes = RouteCache()
+    bad = SimpleNamespace(function=SimpleNamespace(name="Search", arguments="{not json"))
+    routes.store("search for cats", [bad])
+    routes.store("", [tool_call("Stop")])
+    assert routes.get("search for cats") is None
+    routes.store("stop", [SimpleNamespace(function=SimpleNamespace(name="Stop", arguments="null"))])
+    assert routes.get("stop") is None
+    assert len(routes.cache) == 0
+
+if __name__ == "__main__":
+    test_repeated_utterance_skips_the_routing_call()
+    test_least_recently_used_decision_is_evicted()
+    test_undispatchable_plans_are_not_cached()
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import pytest
+from aiohttp import web
+from Backend import RealtimeData, HTTPClient
+from Backend.Cache import DiskCache, TieredCache
+from Backend.RealtimeData import RealTimeInformation, normalize_query
+
+PARAGRAPH = "<p>" + "This paragraph is long enough to count as the summary of a search result. " * 2 + "</p>"
+
+pytestmark = pytest.mark.usefixtures("isolated_caches")
+
+async def start_server(hits):
+    async def page(request):
+        hits.append(request.path)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=f"<html>{PARAGRAPH}</html>", content_type="text/html", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/{name}", page)
+    runner = web.AppRunner(app, shutdown_timeout=0.1)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+def test_normalize_query_folds_near_duplicates():
+    assert normalize_query("Search for the latest AI news!") == normalize_query("latest ai news")
+    assert normalize_query("the") == "the"
+
+def test_repeat_and_overlapping_searches_skip_network(monkeypatch):
+    hits = []
+    google_calls = []
+
+    def fake_search(query, num_results, lang):
+        google_calls.append(query)
+        return [f"{base}/a", f"{base}/b", f"{base}/c", f"{base}/d"]
+
+    async def no_wiki(session, wiki_url):
+        return None
+
+    async def scenario():
+        nonlocal base
+        runner, base = await start_server(hits)
+        realtime_info = RealTimeInformation()
+        realtime_info._fetch_wiki_summary = no_wiki
+        try:
+            first = await realtime_info.perform_search("latest AI news", max_results=2)
+            second = await realtime_info.perform_search("Search for the latest AI news", max_results=2)
+            # Different query, same pages: only Google runs again
+            third = await realtime_info.perform_search("AI headlines", max_results=2)
+            return first, second, third
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+
+    base = None
+    monkeypatch.setattr(RealtimeData, "search", fake_search)
+    first, second, third = asyncio.run(scenario())
+
+    assert first == second.replace("Search for the latest AI news", "latest AI news")
+    assert len(google_calls) == 2
+    assert len(hits) == len(set(hits)) <= 4
+    assert third.count("🔗") == 2
+
+def test_empty_search_results_are_not_cached(monkeypatch):
+    google_calls = []
+
+    def blocked_search(query, num_results, lang):
+        google_calls.append(query)
+        return []
+
+    async def no_wiki(session, wiki_url):
+        return None
+
+    async def scenario():
+        realtime_info = RealTimeInformation()
+        realtime_info._fetch_wiki_summary = no_wiki
+        try:
+            await realtime_info.perform_search("latest AI news", max_results=2)
+            await realtime_info.perform_search("Search for the latest AI news", max_results=2)
+        finally:
+            await HTTPClient.shutdown()
+
+    monkeypatch.setattr(RealtimeData, "search", blocked_search)
+    asyncio.run(scenario())
+    assert len(google_calls) == 2
+    assert len(RealtimeData.search_cache.disk) == 0
+
+def test_disk_cache_scans_its_directory_once(tmp_path, monkeypatch):
+    scans = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or scandir(path))
+    cache = DiskCache(str(tmp_path), ttl=60, max_entries=5)
+    for i in range(20):
+        cache.set(f"query {i}", {"links": [i]})
+    assert len(scans) == 1
+    assert len(cache) == 5
+    assert cache.get("query 19") == {"links": [19]} and cache.get("query 14") is None
+
+def test_expired_page_is_revalidated_with_etag(tmp_path, monkeypatch):
+    hits = []
+    monkeypatch.setattr(RealtimeData, "page_cache", TieredCache(str(tmp_path / "expiring"), ttl=0))
+
+    async def scenario():
+        runner, base = await start_server(hits)
+        realtime_info = RealTimeInformation()
+        try:
+            first = await realtime_info.scrape_summary(f"{base}/page")
+            second = await realtime_info.scrape_summary(f"{base}/page")
+            return first, second
+        finally:
+            await HTTPClient.shutdown()
+            await runner.cleanup()
+
+    first, second = asyncio.run(scenario())
+    assert first and first == second
+    assert len(hits) == 2  # second request was a 304
+
+if __name__ == "__main__":
+    test_normalize_query_folds_near_duplicates()
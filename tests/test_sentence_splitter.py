@@ -0,0 +1,36 @@
+from Backend.TTS import SentenceSplitter
+
+def split_stream(text, chunk=3):
+    splitter = SentenceSplitter()
+    sentences = []
+    for i in range(0, len(text), chunk):
+        sentences += splitter.feed(text[i:i + chunk])
+    tail = splitter.flush()
+    return sentences + ([tail] if tail else [])
+
+def test_splits_on_sentence_boundaries():
+    text = "Hello Amanat, the weather is clear today. It is 31°C in Karachi! Do you need anything else?"
+    assert split_stream(text) == [
+        "Hello Amanat, the weather is clear today.",
+        "It is 31°C in Karachi!",
+        "Do you need anything else?",
+    ]
+
+def test_keeps_abbreviations_and_short_fragments_together():
+    text = "I asked Dr. Smith about it yesterday. Ok. That settles the matter for now."
+    assert split_stream(text) == [
+        "I asked Dr. Smith about it yesterday.",
+        "Ok. That settles the matter for now.",
+    ]
+
+def test_newlines_end_a_sentence():
+    text = "Here are the headlines for today\n1. Markets rallied on strong earnings"
+    assert split_stream(text, chunk=5) == [
+        "Here are the headlines for today",
+        "1. Markets rallied on strong earnings",
+    ]
+
+if __name__ == "__main__":
+    test_splits_on_sentence_boundaries()
+    test_keeps_abbreviations_and_short_fragments_together()
+    test_newlines_end_a_sentence()
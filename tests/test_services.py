@@ -0,0 +1,67 @@
+import Brain.model
+from Brain.model import OrionModel, get_model
+from Brain.Services import Services
+
+class FakeLLM:
+    pass
+
+class FakeTTS:
+    pass
+
+class FakeRealtime:
+    async def perform_search(self, query, **kwargs):
+        return f"results for {query}"
+
+class FakeHistory:
+    pass
+
+class FakeSTT:
+    def stop(self):
+        return "stopped"
+
+def make_services():
+    return Services(
+        llm=FakeLLM(), tts=FakeTTS(), realtime_info=FakeRealtime(),
+        history=FakeHistory(), stt=FakeSTT(), config={"name": "Orion"},
+    )
+
+def test_services_are_built_once():
+    services = Services(groq_api="test-key")
+    built = []
+    first = services._get("thing", lambda: built.append(1) or object())
+    second = services._get("thing", lambda: built.append(1) or object())
+    assert first is second
+    assert built == [1]
+    assert services.realtime_info is services.realtime_info
+
+def test_chatbot_and_model_share_one_container():
+    services = make_services()
+    model = OrionModel(services=services)
+    assert model.llm is services.llm
+    assert model.Chatbot.llm is services.llm
+    assert model.Chatbot.tts is services.tts
+    assert model.realtime_info is model.Chatbot.realtime_info is services.realtime_info
+    assert model.Chatbot.history is services.history
+    assert model.Chatbot.config == {"name": "Orion"}
+    assert model.stt is services.stt
+
+def test_get_model_follows_the_services_it_is_given(monkeypatch):
+    monkeypatch.setattr(Brain.model, "model_instance", None)
+    first, second = make_services(), make_services()
+    model = get_model(services=first)
+    assert get_model() is model and get_model(services=first) is model
+    rebuilt = get_model(services=second)
+    assert rebuilt is not model and rebuilt.services is second
+    assert get_model() is rebuilt
+
+def test_tts_reuses_groq_client_from_factory():
+    from Backend.TTS import OrionTTS
+    made = []
+    tts = OrionTTS(engine="groq", client_factory=lambda: made.append(1) or object())
+    assert tts._groq_client() is tts._groq_client()
+    assert made == [1]
+
+if __name__ == "__main__":
+    test_services_are_built_once()
+    test_chatbot_and_model_share_one_container()
+    test_tts_reuses_groq_client_from_factory()
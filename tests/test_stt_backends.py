@@ -0,0 +1,52 @@
+import asyncio
+import time
+import numpy as np
+import soundfile as sf
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import LocalStubRecognizer, ReplaySource
+
+class SilentTTS:
+    def stop(self):
+        pass
+
+def write_utterance(path, seconds=0.8, rate=22050):
+    t = np.arange(int(rate * seconds)) / rate
+    speech = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 3 * t)) / 2
+    sf.write(str(path), np.concatenate([speech, np.zeros(rate // 2)]), rate, subtype='PCM_16')
+    return str(path)
+
+def test_replay_source_paces_like_a_microphone(tmp_path):
+    source = ReplaySource(write_utterance(tmp_path / "a.wav"), speed=4.0, gap=0.2)
+    with source:
+        start = time.monotonic()
+        while not source.finished.is_set():
+            source.stream.read(source.CHUNK)
+        elapsed = time.monotonic() - start
+    # 0.8 s of speech (trailing silence trimmed) + 0.2 s gap at 4x speed
+    assert 0.2 <= elapsed < 0.5
+    assert len(source.utterance_ends) == 1
+
+def test_listener_runs_on_replay_source_and_stub_recognizer(tmp_path):
+    wav = write_utterance(tmp_path / "a.wav")
+    backend = LocalStubRecognizer(["what time is it", "", "stop listening"], latency=0.05)
+
+    async def run():
+        source = ReplaySource([wav, wav, wav], speed=4.0, gap=1.0)
+        stt = FastNaturalSpeechRecognition(tts=SilentTTS(), state=AssistantState(), source=source, backend=backend)
+        stt.start_background_listener()
+        try:
+            heard = [await asyncio.wait_for(stt.handle(), 10) for _ in range(2)]
+        finally:
+            stt.stop_background_listener()
+        return heard, source
+
+    heard, source = asyncio.run(run())
+    assert heard == ["what time is it", "stop listening"]  # the unintelligible one is dropped
+    assert backend.calls == 3
+    assert len(source.utterance_ends) == 3
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    test_listener_runs_on_replay_source_and_stub_recognizer(pathlib.Path(tempfile.mkdtemp()))
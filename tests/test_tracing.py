@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+import numpy as np
+import speech_recognition as sr
+import Backend.STT
+import Brain.model
+import main
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import LocalStubRecognizer
+from Backend.Tracing import Tracer
+from Brain.model import OrionModel
+from Brain.Services import Services
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("route.llm"):
+        pass
+    tracer.record("stt.capture", 1.0)
+    assert tracer.new_turn() is None and tracer.start_turn() is None
+    assert tracer.histograms() == {} and tracer.spans() == []
+
+def test_spans_share_the_turn_across_tasks_and_threads():
+    tracer = Tracer(enabled=True)
+
+    async def stage(name, seconds):
+        with tracer.span(name):
+            await asyncio.sleep(seconds)
+
+    async def turn():
+        turn_id = tracer.start_turn()
+        await asyncio.gather(stage("tool.Search", 0.02), stage("tool.Stop", 0.01))
+        await asyncio.to_thread(lambda: tracer.record("tts.synthesis", 0.05))
+        return turn_id
+
+    first, second = asyncio.run(turn()), asyncio.run(turn())
+    assert first != second
+    spans = tracer.spans(first)
+    assert sorted(s["name"] for s in spans) == ["tool.Search", "tool.Stop", "tts.synthesis"]
+    assert all(s["turn"] == first for s in spans)
+    assert tracer.spans(second) and tracer.spans(second)[0]["turn"] == second
+
+def test_histograms_and_dump(tmp_path):
+    tracer = Tracer(enabled=True, path=str(tmp_path / "profile.json"))
+    for ms in range(1, 101):
+        tracer.record("answer.llm", ms / 1000)
+    with tracer.span("route.llm"):
+        time.sleep(0.01)
+    h = tracer.histograms()["answer.llm"]
+    assert h["count"] == 100
+    assert abs(h["p50_ms"] - 50.5) < 0.01 and abs(h["p95_ms"] - 95.05) < 0.01 and abs(h["p99_ms"] - 99.01) < 0.01
+    assert tracer.histograms()["route.llm"]["p50_ms"] >= 10
+
+    path = tracer.dump()
+    with open(path, encoding="utf-8") as f:
+        dumped = json.load(f)
+    assert set(dumped["histograms"]) == {"answer.llm", "route.llm"}
+    assert len(dumped["recent_spans"]) == 101
+
+def test_listener_spans_follow_the_phrase_into_the_turn(monkeypatch):
+    tracer = Tracer(enabled=True)
+    monkeypatch.setattr(Backend.STT, "tracer", tracer)
+    monkeypatch.setattr(Brain.model, "tracer", tracer)
+    delivered = []
+
+    class FakeSTT:
+        def stop(self):
+            return "stopped"
+
+    async def run():
+        stt = FastNaturalSpeechRecognition(
+            tts=SimpleNamespace(stop=lambda: None), state=AssistantState(), source=object(),
+            backend=LocalStubRecognizer(["bye orion"]), workers=1, vad=False,
+        )
+        stt.pool.deliver = delivered.append
+        tone = (np.sin(np.arange(16000) / 16000 * 2 * np.pi * 220) * 8000).astype('<i2')
+        stt._callback(None, sr.AudioData(tone.tobytes(), 16000, 2))
+        for _ in range(500):
+            if delivered:
+                break
+            await asyncio.sleep(0.01)
+        stt.pool.close()
+
+        services = Services(llm=object(), tts=object(), realtime_info=SimpleNamespace(perform_search=None),
+                            history=object(), stt=FakeSTT(), config={})
+        model = OrionModel(services=services)
+        transcript = delivered[0]
+        tracer.start_turn(transcript.turn)
+        await model.handle(transcript)  # "bye orion" is fast-routed to Stop
+        return transcript
+
+    transcript = asyncio.run(run())
+    assert transcript == "bye orion" and transcript.turn
+    names = [s["name"] for s in tracer.spans(transcript.turn)]
+    assert names == ["stt.capture", "stt.recognition", "tool.Stop"]
+    assert tracer.spans(transcript.turn)[0]["ms"] == 1000.0  # one second of captured audio
+
+def test_profile_option():
+    assert main.parse_args([]).profile is None
+    assert main.parse_args(["--profile"]).profile == main.PROFILE_PATH
+    assert main.parse_args(["--profile", "out.json"]).profile == "out.json"
+
+if __name__ == "__main__":
+    test_disabled_tracer_records_nothing()
+    test_spans_share_the_turn_across_tasks_and_threads()
+    test_profile_option()
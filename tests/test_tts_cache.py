@@ -0,0 +1,141 @@
+import asyncio
+import os
+from types import SimpleNamespace
+import numpy as np
+from Backend.AudioCache import AudioCache
+from Backend.State import AssistantState
+from Backend.TTS import OrionTTS
+import main
+
+def tone(n, value=0.25):
+    return np.full(n, value, dtype='float32')
+
+def test_memory_and_disk_tiers(tmp_path):
+    cache = AudioCache(str(tmp_path))
+    key = cache.key("edge", "en-GB-RyanNeural", "Okay.")
+    cache.set(key, tone(100), 24000)
+    pcm, rate = cache.get(key)
+    assert rate == 24000 and len(pcm) == 100
+
+    fresh = AudioCache(str(tmp_path))  # e.g. after a restart
+    pcm, rate = fresh.get(key)
+    assert rate == 24000 and np.array_equal(pcm, tone(100))
+    fresh.get(key)
+    assert fresh.stats()["disk_hits"] == 1 and fresh.stats()["memory_hits"] == 1
+
+def test_key_depends_on_engine_voice_and_text():
+    keys = {
+        AudioCache.key("edge", "en-GB-RyanNeural", "Okay."),
+        AudioCache.key("gtts", "en", "Okay."),
+        AudioCache.key("edge", "en-US-AriaNeural", "Okay."),
+        AudioCache.key("edge", "en-GB-RyanNeural", "Sure."),
+    }
+    assert len(keys) == 4
+    assert AudioCache.key("gtts", "en", " Okay. ") == AudioCache.key("gtts", "en", "Okay.")
+
+def test_disk_tier_is_size_capped(tmp_path):
+    cache = AudioCache(str(tmp_path), max_bytes=20_000)
+    for i in range(10):
+        cache.set(cache.key("gtts", "en", f"phrase {i}"), tone(2000), 16000)
+    assert 0 < cache.disk_bytes() <= 20_000
+    assert cache.get(cache.key("gtts", "en", "phrase 9")) is not None
+
+def test_writes_do_not_rescan_the_directory(tmp_path, monkeypatch):
+    scans = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or scandir(path))
+    cache = AudioCache(str(tmp_path), max_bytes=20_000)
+    for i in range(10):
+        cache.set(cache.key("gtts", "en", f"phrase {i}"), tone(2000), 16000)
+    assert len(scans) == 1
+    assert cache._bytes == cache.disk_bytes() <= 20_000
+
+def make_tts(tmp_path, calls):
+    tts = OrionTTS(engine="gtts", state=AssistantState(), cache=AudioCache(str(tmp_path)),
+                   stock_phrases=("Oops, something went wrong.", "Okay."))
+
+    async def fake_synthesize(text):
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        return tone(len(text)), 16000
+
+    tts._synthesize_gtts = fake_synthesize
+    return tts
+
+def test_repeated_phrases_skip_the_engine(tmp_path):
+    calls = []
+    tts = make_tts(tmp_path, calls)
+
+    async def run():
+        for _ in range(3):
+            await tts.synthesize("Oops, something went wrong.")
+
+    asyncio.run(run())
+    assert calls == ["Oops, something went wrong."]
+
+def test_warm_cache_pre_synthesizes_stock_phrases(tmp_path):
+    calls = []
+    tts = make_tts(tmp_path, calls)
+    played = []
+
+    async def fake_play(data, samplerate):
+        played.append(len(data))
+
+    tts._play_pcm = fake_play
+
+    async def run():
+        await tts.warm_cache()
+        await tts.speak("Okay.")
+
+    asyncio.run(run())
+    assert calls == ["Oops, something went wrong.", "Okay."]
+    assert played == [len("Okay.")]
+
+def test_warm_up_never_delays_listening_or_a_turn(monkeypatch):
+    events = []
+
+    class FakeSTT:
+        loop = None
+
+        def start_background_listener(self):
+            events.append("listening")
+
+        def stop_background_listener(self):
+            pass
+
+        async def handle(self):
+            if "turn" in events:
+                raise KeyboardInterrupt
+            await asyncio.sleep(0.05)
+            return "what time is it"
+
+    class SlowTTS:
+        async def warm_cache(self):
+            events.append("warm-up")
+            try:
+                await asyncio.sleep(10)  # e.g. five edge-tts round trips
+            except asyncio.CancelledError:
+                events.append("warm-up paused")
+                raise
+
+    async def noop():
+        return None
+
+    async def fake_model(user_input):
+        await asyncio.sleep(0.01)  # routing call
+        events.append("turn")
+
+    monkeypatch.setattr(main, "HTTPClient", SimpleNamespace(startup=noop, shutdown=noop))
+    monkeypatch.setattr(main, "warm_location_cache", noop)
+    monkeypatch.setattr(main, "get_model", lambda services: SimpleNamespace(cancel_threadsafe=lambda loop: None))
+    monkeypatch.setattr(main, "model", fake_model)
+    services = SimpleNamespace(stt=FakeSTT(), tts=SlowTTS(), audio_output=SimpleNamespace(close=lambda: None))
+    asyncio.run(asyncio.wait_for(main.voice_loop(services), 2))
+    assert events == ["listening", "warm-up", "warm-up paused", "turn"]
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    test_key_depends_on_engine_voice_and_text()
+    test_disk_tier_is_size_capped(pathlib.Path(tempfile.mkdtemp()))
+    test_warm_cache_pre_synthesizes_stock_phrases(pathlib.Path(tempfile.mkdtemp()))
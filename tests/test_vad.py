@@ -0,0 +1,80 @@
+import numpy as np
+import soundfile as sf
+import speech_recognition as sr
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import LocalStubRecognizer
+from Backend.VAD import VoiceActivityDetector
+
+RATE = 16000
+
+def phrase(signal, lead=0.5):
+    rng = np.random.default_rng(0)
+    quiet = rng.normal(0, 0.002, int(lead * RATE))
+    pcm = np.clip(np.concatenate([quiet, signal, quiet]), -1, 1)
+    return sr.AudioData((pcm * 32767).astype('<i2').tobytes(), RATE, 2)
+
+def speech():
+    data, rate = sf.read("temp.wav", dtype='float32')
+    n = int(len(data) * RATE / rate)
+    return np.interp(np.linspace(0, len(data) - 1, n), np.arange(len(data)), data)
+
+def hiss(seconds=1.2, level=0.1):
+    return np.random.default_rng(1).normal(0, level, int(seconds * RATE))
+
+def clicks(seconds=1.2):
+    signal = np.zeros(int(seconds * RATE))
+    for start in np.random.default_rng(2).integers(0, len(signal) - 40, 12):
+        signal[start:start + 40] = 0.5
+    return signal
+
+def test_speech_is_kept_and_trimmed():
+    vad = VoiceActivityDetector()
+    audio = phrase(speech())
+    kept = vad.process(audio)
+    assert kept is not None
+    assert len(kept.frame_data) < len(audio.frame_data) * 0.7  # lead-in and tail silence are gone
+    assert len(kept.frame_data) > RATE * 2 * 0.8  # the ~1 s of speech is not
+    assert kept.sample_rate == RATE and kept.sample_width == 2
+
+def test_noise_bursts_are_dropped():
+    vad = VoiceActivityDetector()
+    for noise in (hiss(), hiss(level=0.3), clicks()):
+        assert vad.process(phrase(noise)) is None
+    stats = vad.stats()
+    assert stats["rejected"] == 3 and stats["bytes_out"] == 0
+
+def test_noise_floor_adapts():
+    vad = VoiceActivityDetector()
+    vad.process(phrase(speech()))
+    quiet_floor = vad.noise_floor
+    for _ in range(10):
+        vad.process(phrase(hiss(level=0.05), lead=0.0))
+    assert vad.noise_floor > quiet_floor
+
+def test_frames_are_a_view_of_the_captured_buffer():
+    vad = VoiceActivityDetector()
+    data = phrase(speech()).frame_data
+    samples = np.frombuffer(data, dtype='<i2')
+    frames = samples[:len(samples) // 320 * 320].reshape(-1, 320)
+    assert np.shares_memory(frames, samples)
+    assert len(vad.features(samples, RATE)[0]) == len(frames)
+
+def test_listener_never_uploads_noise():
+    class SilentTTS:
+        def stop(self):
+            pass
+
+    backend = LocalStubRecognizer(["what time is it"])
+    stt = FastNaturalSpeechRecognition(
+        tts=SilentTTS(), state=AssistantState(), source=object(), backend=backend,
+    )
+    stt._callback(None, phrase(hiss()))
+    stt._callback(None, phrase(clicks()))
+    stt.pool.close()
+    stt.loop.close()
+    assert stt.pool.submitted == 0 and backend.calls == 0
+
+if __name__ == "__main__":
+    test_speech_is_kept_and_trimmed()
+    test_noise_bursts_are_dropped()
@@ -0,0 +1,108 @@
+import asyncio
+import shutil
+import numpy as np
+import soundfile as sf
+import speech_recognition as sr
+from Backend.State import AssistantState
+from Backend.STT import FastNaturalSpeechRecognition
+from Backend.STTBackends import LocalStubRecognizer
+from Backend.WakeWord import WakeWordDetector
+
+RATE = 16000
+
+def load(path):
+    data, rate = sf.read(path, dtype='float32')
+    n = int(len(data) * RATE / rate)
+    return np.interp(np.linspace(0, len(data) - 1, n), np.arange(len(data)), data)
+
+def phrase(signal, noise=0.002):
+    rng = np.random.default_rng(0)
+    quiet = rng.normal(0, noise, RATE // 2)
+    pcm = np.clip(np.concatenate([quiet, signal + rng.normal(0, noise, len(signal)), quiet]), -1, 1)
+    return sr.AudioData((pcm * 32767).astype('<i2').tobytes(), RATE, 2)
+
+def wake_word(stretch=1.0):
+    signal = load("temp.wav")
+    n = int(len(signal) * stretch)
+    return np.interp(np.linspace(0, len(signal) - 1, n), np.arange(len(signal)), signal)
+
+def other_speech():
+    return load("Brain/Data/audio.wav")[RATE * 2:RATE * 3]
+
+def detector(tmp_path):
+    shutil.copy("temp.wav", tmp_path / "hey-orion.wav")
+    return WakeWordDetector(directory=str(tmp_path))
+
+class SilentTTS:
+    def stop(self):
+        pass
+
+def listener(wakeword, transcripts=()):
+    backend = LocalStubRecognizer(transcripts)
+    state = AssistantState(sleeping=True)
+    stt = FastNaturalSpeechRecognition(
+        tts=SilentTTS(), state=state, source=object(), backend=backend, workers=1, wakeword=wakeword,
+    )
+    return stt, backend, state
+
+def test_wake_word_matches_templates_only(tmp_path):
+    wakeword = detector(tmp_path)
+    assert wakeword.available
+    assert wakeword.detect(phrase(wake_word()))
+    assert wakeword.detect(phrase(wake_word(stretch=1.1), noise=0.01))
+    assert not wakeword.detect(phrase(other_speech()))
+    assert not wakeword.detect(phrase(np.random.default_rng(1).normal(0, 0.1, RATE)))
+    stats = wakeword.stats()
+    assert stats["checked"] == 4 and stats["detected"] == 2 and stats["templates"] == 1
+
+def test_silent_phrase_is_not_a_wake_word(tmp_path):
+    wakeword = detector(tmp_path)
+    silence = sr.AudioData(bytes(RATE * 2), RATE, 2)  # e.g. a muted mic with vad=False
+    assert len(wakeword.features(np.zeros(RATE), RATE)) == 0
+    assert not wakeword.detect(silence)
+    stt, backend, state = listener(wakeword)
+    stt.vad = None
+    stt._callback(None, silence)
+    stt.pool.close()
+    stt.loop.close()
+    assert state.sleeping and stt.pool.submitted == 0
+
+def test_asleep_nothing_is_uploaded_until_the_wake_word(tmp_path):
+    stt, backend, state = listener(detector(tmp_path), ["what time is it"])
+    stt._callback(None, phrase(other_speech()))
+    assert state.sleeping and stt.pool.submitted == 0 and backend.calls == 0
+    assert stt.wakeword.requests_avoided == 1
+
+    stt._callback(None, phrase(wake_word()))
+    assert state.listening and stt.pool.submitted == 0
+    stt._callback(None, phrase(other_speech()))
+    stt.pool.close()
+    stt.loop.close()
+    assert stt.pool.submitted == 1
+
+def test_without_templates_cloud_decides_but_model_stays_idle(tmp_path):
+    wakeword = WakeWordDetector(directory=str(tmp_path / "missing"))
+    assert not wakeword.available
+
+    async def run():
+        stt, backend, state = listener(wakeword)
+        stt._deliver("what's the weather")
+        assert state.sleeping and stt.ignored_while_asleep == 1
+        stt._deliver("Hey Orion.")
+        assert state.listening
+        return await asyncio.wait_for(stt.handle(), 1)
+
+    assert asyncio.run(run()) == "Hey Orion."  # the weather question never reached the model
+
+def test_enroll_saves_a_template(tmp_path):
+    wakeword = WakeWordDetector(directory=str(tmp_path / "wakeword"))
+    path = wakeword.enroll(phrase(wake_word()))
+    assert path.endswith(".wav") and sf.info(path).samplerate == RATE
+    assert wakeword.available
+    assert len(WakeWordDetector(directory=str(tmp_path / "wakeword"))._templates()) == 1
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        test_wake_word_matches_templates_only(pathlib.Path(tmp))
@@ -0,0 +1,75 @@
+import asyncio
+from Backend import RealtimeData
+from Backend.Cache import TTLCache
+from Backend.RealtimeData import RealTimeInformation
+
+KARACHI = {"city": "Karachi", "region": "Sindh", "country": "Pakistan",
+           "latitute": 24.8607, "longitude": 67.0011, "timezone": "Asia/Karachi"}
+
+class FakeResponse:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return {"current_weather": {"temperature": 31.4, "windspeed": 12.0,
+                                    "winddirection": 200, "weathercode": 1}}
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        return FakeResponse()
+
+def test_ttl_cache_expiry_and_stats():
+    cache = TTLCache(ttl=60, maxsize=2)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)  # evicts "a"
+    assert cache.get("a") is None and cache.get("c") == 3
+    cache._data["c"] = (0, 3)
+    assert cache.get("c") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 3
+
+def test_repeat_weather_turns_hit_the_cache():
+    session = FakeSession()
+    original_cache = RealtimeData.weather_cache
+    original_session = RealtimeData.http_client.session
+    RealtimeData.weather_cache = TTLCache(ttl=600)
+
+    async def fake_session():
+        return session
+
+    async def fake_location(self):
+        return dict(KARACHI)
+
+    async def scenario():
+        realtime_info = RealTimeInformation()
+        realtime_info.get_location = fake_location.__get__(realtime_info)
+        first = await realtime_info.get_detailed_weather()
+        # A few metres away still rounds to the same key
+        KARACHI["latitute"] = 24.8611
+        second = await realtime_info.get_detailed_weather()
+        return first, second, realtime_info.cache_stats()
+
+    RealtimeData.http_client.session = fake_session
+    try:
+        first, second, stats = asyncio.run(scenario())
+    finally:
+        RealtimeData.http_client.session = original_session
+        RealtimeData.weather_cache = original_cache
+
+    assert first == second
+    assert "31.4°C" in first
+    assert len(session.urls) == 1
+    assert "hourly" not in session.urls[0]
+    assert stats["weather"]["hits"] == 1 and stats["weather"]["misses"] == 1
+
+if __name__ == "__main__":
+    test_ttl_cache_expiry_and_stats()
+    test_repeat_weather_turns_hit_the_cache()